@@ -0,0 +1,153 @@
+"""Headless batch re-evaluation: scoring, explanations and the bias audit.
+
+Reads a candidate file (CSV or Parquet), splits it into chunks and runs
+each chunk in a process pool: re-score, materialize explanations and
+compute counterfactual score shifts. The parent merges the chunks,
+computes the intersectional audit on the re-scored pool and writes
+everything as Parquet, in the layout the app reads::
+
+    python -m hiring.batch --input pool.parquet --out data/nightly
+
+then point ``HIRING_CANDIDATE_DATA``, ``HIRING_EXPLANATION_DATA`` and
+``HIRING_AUDIT_DATA`` at the paths it prints. Nothing here needs a
+browser session, so it can run as a scheduled job.
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from hiring import bias, counterfactual, explanations, partitions
+from hiring.charts import np, pd
+from hiring.scoring import score_batch
+
+CHUNK_SIZE = 100_000
+
+# Intersections written to the audit; the page can still explore others live
+AUDIT_INTERSECTIONS = (('gender',), ('age_band',), ('institution',), ('gender', 'age_band'))
+AUDIT_MIN_CELL_SIZE = 5
+
+AUDIT_FILES = {
+    'intersectional': 'intersectional.parquet',
+    'counterfactual_summary': 'counterfactual_summary.parquet',
+    'counterfactual_histograms': 'counterfactual_histograms.parquet',
+}
+
+BatchResult = namedtuple('BatchResult', ['candidates', 'explanations', 'intersectional', 'shift_summary', 'shift_histograms'])
+
+
+def read_candidates(path):
+    """Candidates from a CSV or Parquet file, or a partitioned dataset directory."""
+    if os.path.isdir(path):
+        return partitions.read_partitions(path)
+    if path.endswith('.csv'):
+        return pd.read_csv(path, parse_dates=[partitions.DATE_COLUMN])
+    return pd.read_parquet(path)
+
+
+def _evaluate_chunk(chunk, swaps):
+    # Runs in a worker process: everything it returns is small or columnar
+    scores = score_batch(chunk)
+    scored = chunk.assign(score=scores)
+    return scores, explanations.materialize(scored), counterfactual.shift_stats(scored, swaps)
+
+
+def run_batch(candidates, workers=None, chunk_size=CHUNK_SIZE):
+    """Re-score ``candidates`` and audit the result; returns a ``BatchResult``."""
+    swaps = counterfactual.attribute_swaps(candidates)
+    # An empty pool still runs one (empty) chunk, so the outputs keep their columns
+    chunks = [candidates.iloc[start:start + chunk_size] for start in range(0, len(candidates), chunk_size)] or [candidates]
+    scores, explained = [], []
+    totals = counterfactual.empty_shift_stats(swaps)
+    # Spawned workers, as in hiring.evaluation, so this is safe from threaded callers too
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=multiprocessing.get_context('spawn')
+    ) as executor:
+        for chunk_scores, chunk_explanations, stats in executor.map(_evaluate_chunk, chunks, [swaps] * len(chunks)):
+            scores.append(chunk_scores)
+            explained.append(chunk_explanations)
+            counterfactual.merge_shift_stats(totals, stats)
+
+    scored = candidates.assign(score=np.concatenate(scores))
+    selected = (scored['status'] == 'Approved').to_numpy()
+    audited = [attributes for attributes in AUDIT_INTERSECTIONS if all(attribute in scored for attribute in attributes)]
+    if audited:
+        intersectional = pd.concat([
+            bias.intersectional_rates(scored, attributes, selected, AUDIT_MIN_CELL_SIZE).assign(
+                intersection=' x '.join(attributes)
+            )
+            for attributes in audited
+        ], ignore_index=True)
+    else:
+        # None of the audited attributes are in the input: an empty audit, same columns
+        intersectional = pd.DataFrame({
+            'applicants': pd.array([], dtype='Int64'),
+            'selected': pd.array([], dtype='Int64'),
+            'selection_rate': np.zeros(0),
+            'disparate_impact': np.zeros(0),
+            'suppressed': np.zeros(0, dtype=bool),
+            'adverse_impact': np.zeros(0, dtype=bool),
+            'intersection': pd.array([], dtype='str'),
+        })
+    shift_summary, shift_histograms = counterfactual.summarize_shifts(totals)
+    return BatchResult(
+        scored, pd.concat(explained, ignore_index=True), intersectional, shift_summary, shift_histograms
+    )
+
+
+def write_results(result, root):
+    """Write a ``BatchResult`` under ``root``; returns the paths the app reads."""
+    paths = {
+        'candidates': os.path.join(root, 'candidates'),
+        'explanations': os.path.join(root, 'explanations.parquet'),
+        'audit': os.path.join(root, 'audit'),
+    }
+    partitions.write_partitions(result.candidates, paths['candidates'])
+    explanations.write_explanations(result.explanations, paths['explanations'])
+    os.makedirs(paths['audit'], exist_ok=True)
+    for name, frame in (
+        ('intersectional', result.intersectional),
+        ('counterfactual_summary', result.shift_summary),
+        ('counterfactual_histograms', result.shift_histograms.reset_index()),
+    ):
+        # Write then rename, so a page never reads a partial audit file
+        path = os.path.join(paths['audit'], AUDIT_FILES[name])
+        staging = os.path.join(paths['audit'], f'.{AUDIT_FILES[name]}')
+        frame.to_parquet(staging, index=False)
+        os.replace(staging, path)
+    return paths
+
+
+def read_audit(root):
+    """Audit frames written by ``write_results``, by name."""
+    audit = {name: pd.read_parquet(os.path.join(root, file)) for name, file in AUDIT_FILES.items()}
+    audit['counterfactual_histograms'] = audit['counterfactual_histograms'].set_index('shift')
+    return audit
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--input', required=True, help="candidate CSV or Parquet file, or partitioned dataset directory")
+    parser.add_argument('--out', default=os.path.join('data', 'batch'), help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="candidates per worker task")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    candidates = read_candidates(args.input)
+    missing = [column for column in ('id', 'status', partitions.DATE_COLUMN, *explanations.FACTORS.values()) if column not in candidates]
+    if missing:
+        parser.error(f"{args.input} is missing columns: {', '.join(missing)}")
+    result = run_batch(candidates, args.workers, args.chunk_size)
+    paths = write_results(result, args.out)
+    print(f"Evaluated {len(candidates):,} candidates in {time.perf_counter() - started:.1f}s")
+    print(f"HIRING_CANDIDATE_DATA={os.path.abspath(paths['candidates'])}")
+    print(f"HIRING_EXPLANATION_DATA={os.path.abspath(paths['explanations'])}")
+    print(f"HIRING_AUDIT_DATA={os.path.abspath(paths['audit'])}")
+
+
+if __name__ == '__main__':
+    main()
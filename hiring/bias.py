@@ -0,0 +1,67 @@
+"""Intersectional selection-rate analysis.
+
+All intersections of the chosen protected attributes are counted in one
+grouped pass: each attribute is reduced to integer codes, the codes are
+combined into a single mixed-radix key, and ``np.bincount`` counts
+applicants and selections per key. Cost is linear in rows however many
+attributes are combined.
+"""
+from hiring.charts import np, pd
+
+# Above this many possible intersections, only keys that occur are counted
+MAX_DENSE_CELLS = 10_000_000
+
+
+def _codes(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values, sort=True)
+
+
+def intersectional_rates(frame, attributes, selected, min_cell_size=5, impact_threshold=0.8):
+    """Selection rate and disparate impact for every intersection of ``attributes``.
+
+    ``selected`` is a boolean array marking selected applicants. Cells with
+    fewer than ``min_cell_size`` applicants are kept in the result but their
+    counts, rate and impact are suppressed (NA) and they are excluded from
+    the reference rate. The counts are suppressed too, since the rate could
+    otherwise be worked out from them.
+    """
+    attributes = list(attributes)
+    if not attributes:
+        raise ValueError("At least one attribute is required")
+    codes, categories = zip(*(_codes(frame[attribute]) for attribute in attributes))
+    sizes = [len(category) for category in categories]
+
+    # Applicants with a missing attribute (code -1) can't be placed in a cell
+    valid = np.logical_and.reduce([code >= 0 for code in codes])
+    key = np.zeros(int(valid.sum()), dtype=np.int64)
+    for code, size in zip(codes, sizes):
+        key = key * size + code[valid]
+    selected = np.asarray(selected, dtype=np.float64)[valid]
+
+    if np.prod(sizes, dtype=np.float64) <= MAX_DENSE_CELLS:
+        applicants = np.bincount(key, minlength=int(np.prod(sizes)))
+        selections = np.bincount(key, weights=selected, minlength=len(applicants))
+        cells = np.flatnonzero(applicants)
+        applicants, selections = applicants[cells], selections[cells]
+    else:
+        cells, inverse = np.unique(key, return_inverse=True)
+        applicants = np.bincount(inverse)
+        selections = np.bincount(inverse, weights=selected)
+
+    result = pd.DataFrame({
+        attribute: np.asarray(category)[cell_codes]
+        for attribute, category, cell_codes in zip(attributes, categories, np.unravel_index(cells, sizes))
+    })
+    suppressed = applicants < min_cell_size
+    result['applicants'] = pd.array(applicants, dtype='Int64')
+    result['selected'] = pd.array(selections.astype(np.int64), dtype='Int64')
+    result.loc[suppressed, ['applicants', 'selected']] = pd.NA
+    rates = np.where(suppressed, np.nan, selections / applicants)
+    result['selection_rate'] = rates
+    reference = np.nanmax(rates) if not suppressed.all() else np.nan
+    result['disparate_impact'] = rates / reference if reference > 0 else np.nan
+    result['suppressed'] = suppressed
+    result['adverse_impact'] = result['disparate_impact'] < impact_threshold
+    return result.sort_values('disparate_impact', na_position='last').reset_index(drop=True)
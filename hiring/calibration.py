@@ -0,0 +1,106 @@
+"""Isotonic calibration of AI scores to the scores reviewers settle on.
+
+``fit_calibration`` fits one monotonic (non-decreasing) mapping from
+``ai_score`` to ``human_score`` per group (department or position) from
+the override log, with the pool-adjacent-violators algorithm. Groups
+with too few overrides use the mapping fitted on the whole log.
+
+``CalibrationModel.apply`` calibrates any number of scores in one
+``np.interp`` call: each group's knots are shifted onto their own stretch
+of the number line and every score is shifted by its group's offset, so
+all groups are looked up together.
+"""
+from collections import namedtuple
+
+import streamlit as st
+
+from hiring.charts import np, pd
+
+MIN_GROUP_SAMPLES = 30
+
+# Fitted knots for one group: sorted AI scores and calibrated scores
+Curve = namedtuple('Curve', ['ai_score', 'calibrated'])
+
+
+def isotonic_fit(x, y, weights=None):
+    """Non-decreasing least-squares fit of ``y`` on ``x``.
+
+    Returns a ``Curve`` with one knot per distinct ``x``.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    weights = np.ones_like(y) if weights is None else np.asarray(weights, dtype=float)
+    # Collapse ties first; scores take few distinct values, so the
+    # pooling loop below runs over distinct scores, not observations
+    knots, inverse = np.unique(x, return_inverse=True)
+    total = np.bincount(inverse, weights=weights)
+    means = np.bincount(inverse, weights=weights * y) / total
+
+    # Pool adjacent violators: merge blocks while a block's mean drops
+    block_mean, block_weight, block_size = [], [], []
+    for mean, weight in zip(means, total):
+        block_mean.append(mean)
+        block_weight.append(weight)
+        block_size.append(1)
+        while len(block_mean) > 1 and block_mean[-2] > block_mean[-1]:
+            weight = block_weight[-2] + block_weight[-1]
+            block_mean[-2] = (block_mean[-2] * block_weight[-2] + block_mean[-1] * block_weight[-1]) / weight
+            block_weight[-2] = weight
+            block_size[-2] += block_size[-1]
+            del block_mean[-1], block_weight[-1], block_size[-1]
+    return Curve(knots, np.repeat(block_mean, block_size))
+
+
+class CalibrationModel:
+    """Per-group isotonic curves with a fallback curve for unseen groups."""
+
+    def __init__(self, by, curves, fallback, samples):
+        self.by = by
+        self.curves = curves
+        self.fallback = fallback
+        self.samples = samples
+        # Every group (fallback last) on its own stretch of the number line
+        self._groups = pd.Index(list(curves))
+        ordered = [*curves.values(), fallback]
+        lows = np.array([curve.ai_score[0] for curve in ordered])
+        highs = np.array([curve.ai_score[-1] for curve in ordered])
+        self._span = float(highs.max() - lows.min()) + 1
+        self._lows, self._highs = lows, highs
+        self._offsets = np.arange(len(ordered)) * self._span - lows.min()
+        self._knots = np.concatenate([curve.ai_score + offset for curve, offset in zip(ordered, self._offsets)])
+        self._values = np.concatenate([curve.calibrated for curve in ordered])
+
+    def apply(self, scores, groups):
+        """Calibrated scores for ``scores`` whose group values are ``groups``."""
+        # Look up each distinct group once rather than every row's label
+        group_codes, uniques = pd.factorize(np.asarray(groups) if isinstance(groups, list) else groups)
+        lookup = self._groups.get_indexer(uniques)
+        lookup[lookup < 0] = len(self._groups)
+        codes = lookup[group_codes]
+        # Clamping to the group's fitted range keeps lookups inside it
+        scores = np.clip(np.asarray(scores, dtype=float), self._lows[codes], self._highs[codes])
+        return np.interp(scores + self._offsets[codes], self._knots, self._values)
+
+    def curve_frame(self):
+        """All fitted curves as one long frame, for plotting."""
+        return pd.concat([
+            pd.DataFrame({self.by: group, 'ai_score': curve.ai_score, 'calibrated': curve.calibrated})
+            for group, curve in {**self.curves, 'All (fallback)': self.fallback}.items()
+        ], ignore_index=True)
+
+
+def fit_calibration(log, by='department', min_samples=MIN_GROUP_SAMPLES):
+    """Fit a ``CalibrationModel`` on an override log's ``ai_score`` and ``human_score``."""
+    fallback = isotonic_fit(log['ai_score'], log['human_score'])
+    curves, samples = {}, {}
+    for group, part in log.groupby(by, sort=True, observed=True):
+        samples[group] = len(part)
+        if len(part) >= min_samples:
+            curves[group] = isotonic_fit(part['ai_score'], part['human_score'])
+    return CalibrationModel(by, curves, fallback, samples)
+
+
+@st.cache_resource(max_entries=8)
+def get_calibration(_log, version, by='department'):
+    """Fitted model for the override log at ``version``, shared by all sessions."""
+    return fit_calibration(_log, by)
@@ -0,0 +1,127 @@
+"""Shared chart helpers for the Streamlit pages.
+
+Plotly and pandas are the slowest imports in the app, so pages get them
+through lazy module proxies that only import on first attribute access.
+``begin_page`` also starts a one-off background thread that preloads them
+after the server comes up, and ``report_import_times`` shows what each
+page actually paid for imports. The same two hooks bracket a rerun for
+``hiring.profiling`` when profiling is switched on.
+"""
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+
+import streamlit as st
+
+from hiring import profiling
+
+logger = logging.getLogger(__name__)
+
+HEAVY_MODULES = ("numpy", "pandas", "plotly.graph_objects", "plotly.express")
+
+# Seconds spent on the first import of each heavy module in this process
+IMPORT_TIMES = {}
+
+_import_lock = threading.Lock()
+_warm_up_started = threading.Event()
+_page_state = threading.local()
+
+
+def timed_import(name):
+    """Import ``name`` once per process, recording how long it took."""
+    module = sys.modules.get(name)
+    if module is not None and name in IMPORT_TIMES:
+        return module
+    with _import_lock:
+        if name not in IMPORT_TIMES:
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            IMPORT_TIMES[name] = time.perf_counter() - start
+            # Attribute the cost to the page that triggered the import
+            page_imports = getattr(_page_state, "imports", None)
+            if page_imports is not None:
+                page_imports.append((name, IMPORT_TIMES[name]))
+    return sys.modules[name]
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = timed_import(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+px = LazyModule("plotly.express")
+go = LazyModule("plotly.graph_objects")
+
+
+def _warm_up():
+    for name in HEAVY_MODULES:
+        try:
+            timed_import(name)
+        except ImportError:
+            logger.exception("Warm-up import of %s failed", name)
+    logger.info(
+        "Warm-up finished: %s",
+        ", ".join(f"{name} {IMPORT_TIMES.get(name, 0) * 1000:.0f} ms" for name in HEAVY_MODULES),
+    )
+
+
+def warm_up():
+    """Preload the heavy modules in a daemon thread, once per process."""
+    if _warm_up_started.is_set():
+        return
+    _warm_up_started.set()
+    threading.Thread(target=_warm_up, name="hiring-warm-up", daemon=True).start()
+
+
+def begin_page(page):
+    """Mark the start of a page run so its import cost can be reported."""
+    _page_state.page = page
+    _page_state.start = time.perf_counter()
+    _page_state.imports = []
+    warm_up()
+    profiling.start(page)
+
+
+def report_import_times():
+    """Log and show in the sidebar the imports paid for by this page run."""
+    page = getattr(_page_state, "page", None)
+    if page is None:
+        return
+    imports = _page_state.imports
+    elapsed = time.perf_counter() - _page_state.start
+    import_total = sum(seconds for _, seconds in imports)
+    logger.info(
+        "%s: %.0f ms run, %.0f ms in imports (%s)",
+        page,
+        elapsed * 1000,
+        import_total * 1000,
+        ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in imports) or "all warm",
+    )
+    with st.sidebar.expander("⏱️ Load Times"):
+        st.caption(f"Page run: {elapsed * 1000:.0f} ms, imports: {import_total * 1000:.0f} ms")
+        for name in HEAVY_MODULES:
+            if name in IMPORT_TIMES:
+                st.caption(f"{name}: {IMPORT_TIMES[name] * 1000:.0f} ms")
+            else:
+                st.caption(f"{name}: not loaded")
+    _page_state.page = None
+    profile_path = profiling.stop()
+    if profile_path:
+        st.sidebar.caption(f"🔬 Profile saved: {os.path.basename(profile_path)}")
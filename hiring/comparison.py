@@ -0,0 +1,71 @@
+"""Side-by-side comparison of a handful of candidates.
+
+The selection is read with one batched call per source
+(``Database.candidates_by_ids`` and ``ExplanationStore.rows``). The two results
+are joined into a single frame with one row per candidate, and every
+comparison figure is drawn from that frame or its long (candidate x
+factor) form.
+"""
+from hiring.charts import np, pd, px
+from hiring.explanations import BIAS_TYPES, FACTORS
+
+MIN_CANDIDATES = 2
+MAX_CANDIDATES = 20
+
+CANDIDATE_COLUMNS = ['id', 'name', 'position', 'department', 'institution', 'score', 'bias_risk', 'status']
+
+
+def parse_ids(text):
+    """Distinct candidate ids from a comma- or space-separated string, in order.
+
+    Raises ``ValueError`` on anything that isn't an integer.
+    """
+    ids = [int(part) for part in text.replace(',', ' ').split()]
+    return list(dict.fromkeys(ids))
+
+
+def comparison_frame(database, explanation_store, ids):
+    """One row per candidate in ``ids``: profile columns, factor scores, contributions and bias flags."""
+    candidates = database.candidates_by_ids(ids)[CANDIDATE_COLUMNS]
+    explanations = explanation_store.rows(ids)
+    # Both reads return rows in the order of ``ids``, so they line up as they are
+    return pd.concat([candidates, explanations.drop(columns=['id', 'score'])], axis=1)
+
+
+def factor_frame(frame, labels):
+    """Long form of ``frame``: one row per candidate and factor."""
+    score_columns = list(FACTORS.values())
+    contribution_columns = [column.replace('_score', '') + '_contribution' for column in score_columns]
+    return pd.DataFrame({
+        'candidate': np.repeat(np.asarray(labels, dtype=object), len(FACTORS)),
+        'factor': np.tile(list(FACTORS), len(frame)),
+        'score': frame[score_columns].to_numpy(dtype=float).ravel(),
+        'contribution': frame[contribution_columns].to_numpy(dtype=float).ravel()
+    })
+
+
+def radar_figure(factors):
+    fig = px.line_polar(factors, r='score', theta='factor', color='candidate', line_close=True, title="Factor Profiles")
+    fig.update_traces(fill='toself', opacity=0.6)
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0, 100])))
+    return fig
+
+
+def factor_bar_figure(factors):
+    return px.bar(factors, x='factor', y='score', color='candidate', barmode='group', title="Factor Scores")
+
+
+def contribution_figure(factors):
+    # Stacked contributions add up to each candidate's AI score (before the institution prior)
+    return px.bar(
+        factors, x='candidate', y='contribution', color='factor',
+        labels={'contribution': 'Contribution to AI score'},
+        title="Contributions to the AI Score"
+    )
+
+
+def bias_flags(frame, labels):
+    """Bias risk per candidate and type, with the number of flagged types."""
+    flags = pd.DataFrame({'candidate': labels, **{bias_type: frame[bias_type] for bias_type in BIAS_TYPES}})
+    flags['flagged'] = (frame[list(BIAS_TYPES)] != 'Low').sum(axis=1).to_numpy()
+    return flags
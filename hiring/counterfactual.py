@@ -0,0 +1,109 @@
+"""Counterfactual fairness tests for the batch scorer.
+
+For each protected attribute, every candidate's value is swapped for the
+next category (a cyclic permutation of the observed values, so every
+group is moved to a different one) and the batch is re-scored. Work is
+split into chunks scored in a thread pool, and each chunk builds one
+perturbed column at a time. Only running totals and a histogram of score
+shifts are kept, never the perturbed frames. The per-chunk totals merge
+in any order, so ``hiring.batch`` spreads the same chunks over processes.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from hiring.charts import np, pd
+from hiring.scoring import score_batch
+
+COUNTERFACTUAL_ATTRIBUTES = ('gender', 'age_band', 'institution', 'location')
+
+# Histogram bins for score shifts: half-point bins centred on -10 .. +10
+SHIFT_BINS = np.arange(-10.25, 10.5, 0.5)
+
+CHUNK_SIZE = 50_000
+
+SUMMARY_COLUMNS = ['attribute', 'candidates', 'share_changed', 'mean_shift', 'mean_abs_shift', 'max_abs_shift']
+
+
+def attribute_swaps(frame, attributes=COUNTERFACTUAL_ATTRIBUTES):
+    """Per attribute in ``frame``: its sorted categories and the category each one is swapped for."""
+    swaps = {}
+    for attribute in attributes:
+        if attribute not in frame:
+            continue
+        categories = pd.Index(pd.unique(frame[attribute].dropna())).sort_values()
+        # Each category maps to the next one, wrapping around
+        swaps[attribute] = (categories, np.roll(categories.to_numpy(dtype=object), -1))
+    return swaps
+
+
+def shift_stats(chunk, swaps, scorer=score_batch):
+    """Mergeable shift totals for one chunk of candidates (see ``merge_shift_stats``)."""
+    base = scorer(chunk)
+    stats = {}
+    for attribute, (categories, swapped) in swaps.items():
+        codes = pd.Categorical(chunk[attribute], categories=categories).codes
+        perturbed_column = np.where(codes >= 0, swapped[codes], chunk[attribute].to_numpy(dtype=object))
+        perturbed = chunk.assign(**{attribute: perturbed_column})
+        shift = scorer(perturbed) - base
+        stats[attribute] = {
+            'count': len(shift),
+            'changed': int(np.count_nonzero(np.abs(shift) > 1e-9)),
+            'sum': float(shift.sum()),
+            'abs_sum': float(np.abs(shift).sum()),
+            'max_abs': float(np.abs(shift).max(initial=0.0)),
+            'histogram': np.histogram(np.clip(shift, SHIFT_BINS[0], SHIFT_BINS[-1]), bins=SHIFT_BINS)[0],
+        }
+    return stats
+
+
+def empty_shift_stats(attributes):
+    return {
+        attribute: {'count': 0, 'changed': 0, 'sum': 0.0, 'abs_sum': 0.0, 'max_abs': 0.0,
+                    'histogram': np.zeros(len(SHIFT_BINS) - 1, dtype=np.int64)}
+        for attribute in attributes
+    }
+
+
+def merge_shift_stats(totals, stats):
+    """Add one chunk's ``shift_stats`` into ``totals`` in place."""
+    for attribute, chunk_stats in stats.items():
+        total = totals[attribute]
+        for field in ('count', 'changed', 'sum', 'abs_sum', 'histogram'):
+            total[field] = total[field] + chunk_stats[field]
+        total['max_abs'] = max(total['max_abs'], chunk_stats['max_abs'])
+    return totals
+
+
+def summarize_shifts(totals):
+    """``(summary, histograms)`` frames from merged shift totals."""
+    summary = pd.DataFrame([
+        {
+            'attribute': attribute,
+            'candidates': total['count'],
+            'share_changed': total['changed'] / total['count'] if total['count'] else 0.0,
+            'mean_shift': total['sum'] / total['count'] if total['count'] else 0.0,
+            'mean_abs_shift': total['abs_sum'] / total['count'] if total['count'] else 0.0,
+            'max_abs_shift': total['max_abs'],
+        }
+        for attribute, total in totals.items()
+    ], columns=SUMMARY_COLUMNS)
+    centres = (SHIFT_BINS[:-1] + SHIFT_BINS[1:]) / 2
+    histograms = pd.DataFrame({attribute: total['histogram'] for attribute, total in totals.items()}, index=centres)
+    histograms.index.name = 'shift'
+    return summary, histograms
+
+
+def counterfactual_shifts(frame, attributes=COUNTERFACTUAL_ATTRIBUTES, scorer=score_batch,
+                          chunk_size=CHUNK_SIZE, max_workers=None):
+    """Score shifts when each attribute is swapped, aggregated per attribute.
+
+    Returns ``(summary, histograms)``: a frame with one row per attribute,
+    and a frame of shift-histogram counts indexed by bin centre.
+    """
+    swaps = attribute_swaps(frame, attributes)
+    chunks = (frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size))
+    totals = empty_shift_stats(swaps)
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        for stats in executor.map(lambda chunk: shift_stats(chunk, swaps, scorer), chunks):
+            merge_shift_stats(totals, stats)
+    return summarize_shifts(totals)
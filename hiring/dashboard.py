@@ -0,0 +1,230 @@
+"""Dashboard filtering, KPIs and figures, plus a materialized default view.
+
+Most reviewers open the dashboard without touching the filters, so the
+``DashboardMaterializer`` keeps the default view (every department,
+position, location and status over the last 30 days) precomputed in a
+background thread: the filtered frame, KPIs, figures and table labels.
+It rebuilds whenever the candidate store commits a batch, and when the
+day rolls over and moves the default date range. Pages serve a first
+load from the snapshot and compute live once the filters change.
+"""
+import logging
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from hiring import figures, formatting, partitions
+from hiring.charts import go, np, pd, px
+from hiring.store import get_candidate_store
+from hiring.timeseries import TimeSeriesStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_DAYS = 30
+
+# Score histogram bins: 20 bins of 5 points over the 0-100 score range
+SCORE_BINS = np.linspace(0, 100, 21)
+
+# Multiselect filters, in sidebar order
+FILTER_COLUMNS = ('department', 'position', 'location', 'status')
+
+STATUS_COLORS = {
+    'Approved': '#4CAF50',
+    'Review': '#FFC107',
+    'Rejected': '#F44336',
+    'Info Requested': '#2196F3'
+}
+
+RISK_COLORS = {
+    'Low': '#4CAF50',
+    'Medium': '#FFC107',
+    'High': '#F44336'
+}
+
+DashboardSnapshot = namedtuple('DashboardSnapshot', [
+    'version', 'filter_key', 'options', 'filtered', 'kpis', 'figures', 'status_labels', 'risk_labels'
+])
+
+
+def default_date_range(now=None):
+    now = now or datetime.now()
+    return now - timedelta(days=DEFAULT_WINDOW_DAYS), now
+
+
+def filter_options(candidates):
+    """Distinct values offered by each multiselect filter."""
+    return {column: candidates[column].unique() for column in FILTER_COLUMNS}
+
+
+def default_filters(options, date_range=None):
+    start, end = date_range or default_date_range()
+    filter_key = dict(options)
+    filter_key['date_range'] = (start.date(), end.date())
+    return filter_key
+
+
+def filter_candidates(candidates, filter_key, date_order=None):
+    """Rows matching every filter; ``candidates`` itself when all match.
+
+    With rows in date order (``date_order`` from ``partitions.date_order``)
+    the date range is cut out by binary search before any other filter
+    runs, so the cost follows the rows in range, not the whole history.
+    """
+    start, end = filter_key['date_range']
+    rows = partitions.date_slice(candidates['application_date'], start, end, date_order)
+    if rows is not None:
+        window = candidates.iloc[rows]
+        mask = pd.Series(True, index=window.index)
+    else:
+        window = candidates
+        dates = candidates['application_date']
+        # Whole-day bounds compare the datetime column directly instead of
+        # converting every row to a date object
+        mask = (dates >= pd.Timestamp(start)) & (dates < pd.Timestamp(end) + pd.Timedelta(days=1))
+    for column in FILTER_COLUMNS:
+        mask &= window[column].isin(filter_key[column])
+    # Boolean indexing copies, so skip it when nothing is filtered out
+    if not mask.all():
+        return window[mask]
+    return candidates if len(window) == len(candidates) else window
+
+
+def compute_kpis(filtered, candidates):
+    count = len(filtered)
+    approval_rate = round((filtered['status'] == 'Approved').sum() / count * 100, 1) if count else 0
+    avg_score = round(filtered['score'].mean(), 1) if count else 0
+    low_bias = round((filtered['bias_risk'] == 'Low').sum() / count * 100, 1) if count else 0
+    return {
+        'total': count,
+        'total_delta': count - len(candidates),
+        'approval_rate': approval_rate,
+        'avg_score': avg_score,
+        'avg_score_delta': round(avg_score - candidates['score'].mean(), 1),
+        'low_bias': low_bias
+    }
+
+
+def _score_histogram(filtered):
+    # Binned here, so the cached figure holds 20 bars rather than every score
+    scores = filtered['score'].to_numpy(dtype=float)
+    counts, edges = np.histogram(scores[~np.isnan(scores)], bins=SCORE_BINS)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(title='Distribution of AI Scores', xaxis_title='score', yaxis_title='count', bargap=0)
+    return fig
+
+
+def _department_pie(filtered):
+    dept_counts = filtered['department'].value_counts()
+    return px.pie(names=dept_counts.index, values=dept_counts.values, title='Applications by Department')
+
+
+def _status_pie(filtered):
+    status_counts = filtered['status'].value_counts()
+    return px.pie(
+        names=status_counts.index,
+        values=status_counts.values,
+        title='Application Status Distribution',
+        color=status_counts.index,
+        color_discrete_map=STATUS_COLORS
+    )
+
+
+def _bias_risk_bar(filtered):
+    risk_counts = filtered['bias_risk'].value_counts()
+    return px.bar(
+        x=risk_counts.index,
+        y=risk_counts.values,
+        title='Distribution of Bias Risk Levels',
+        color=risk_counts.index,
+        color_discrete_map=RISK_COLORS
+    )
+
+
+def _applications_trend(filtered):
+    applications = TimeSeriesStore.from_events(filtered['application_date'], base='day')
+    trend, resolution = applications.query('count', name='applications')
+    return px.line(trend, x='date', y='applications', title=f'Applications per {resolution.capitalize()}')
+
+
+CHART_BUILDERS = {
+    'score_histogram': _score_histogram,
+    'department_pie': _department_pie,
+    'status_pie': _status_pie,
+    'bias_risk_bar': _bias_risk_bar,
+    'applications_trend': _applications_trend
+}
+
+
+def build_figure(chart_id, filtered):
+    return CHART_BUILDERS[chart_id](filtered)
+
+
+def build_snapshot(candidates, version, date_range=None, date_order=None):
+    """Everything the dashboard shows for the default filters."""
+    options = filter_options(candidates)
+    filter_key = default_filters(options, date_range)
+    filtered = filter_candidates(candidates, filter_key, date_order)
+    built = {}
+    if not filtered.empty:
+        built = {chart_id: build(filtered) for chart_id, build in CHART_BUILDERS.items()}
+    return DashboardSnapshot(
+        version=version,
+        filter_key=figures.normalize_filters(filter_key),
+        options=options,
+        filtered=filtered,
+        kpis=compute_kpis(filtered, candidates),
+        figures=built,
+        status_labels=formatting.category_labels(filtered['status'], formatting.STATUS_BADGES),
+        risk_labels=formatting.category_labels(filtered['bias_risk'], formatting.RISK_BADGES)
+    )
+
+
+class DashboardMaterializer:
+    """Keeps a ``DashboardSnapshot`` of the default view current."""
+
+    def __init__(self, store, refresh_interval=600):
+        self._store = store
+        self._refresh_interval = refresh_interval
+        self._snapshot = None
+        self._wake = threading.Event()
+        # Store listeners run under the store's lock, so only signal there
+        wake = lambda changes, candidates: self._wake.set()
+        store.subscribe(wake, on_history=wake)
+        self._thread = threading.Thread(target=self._run, name='dashboard-materializer', daemon=True)
+        self._thread.start()
+
+    def latest(self, version):
+        """The snapshot for store ``version``, or None while it is being rebuilt."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != version:
+            return None
+        return snapshot
+
+    def refresh(self):
+        candidates, version = self._store.snapshot()
+        date_range = default_date_range()
+        current = self._snapshot
+        if current is not None and current.version == version and \
+                current.filter_key == figures.normalize_filters(default_filters(current.options, date_range)):
+            return current
+        self._snapshot = build_snapshot(candidates, version, date_range, self._store.date_order)
+        return self._snapshot
+
+    def _run(self):
+        while True:
+            # Cleared before refreshing, so a batch committed during the
+            # refresh leaves the event set and triggers the next one
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Materializing the default dashboard view failed")
+            # Woken by a committed batch or loaded history, or periodically to follow the date
+            self._wake.wait(self._refresh_interval)
+
+
+@st.cache_resource
+def get_dashboard_materializer():
+    return DashboardMaterializer(get_candidate_store())
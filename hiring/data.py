@@ -0,0 +1,189 @@
+"""Mock data loaders shared by more than one page."""
+import os
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from hiring import partitions, reviewers
+from hiring.charts import np, pd
+from hiring.records import Candidate
+from hiring.shared_cache import shared_cache
+
+
+# Mock data generation. Only the candidate store reads this and it never
+# modifies the frame, so it is memoized as the shared, memory-mapped copy
+# rather than through st.cache_data, which would hand out private copies.
+# Dates are relative to today, hence the TTL.
+@shared_cache('mock_candidates', ttl=12 * 3600, memoize=True)
+def generate_mock_data():
+    positions = ['Data Scientist', 'Software Engineer', 'Product Manager', 'UX Designer',
+                'ML Engineer', 'DevOps Engineer', 'Frontend Developer', 'Backend Developer']
+    departments = ['Engineering', 'Product', 'Design', 'Data']
+    locations = ['New York', 'San Francisco', 'London', 'Singapore', 'Berlin']
+    genders = ['Female', 'Male', 'Non-binary']
+    age_bands = ['18-29', '30-39', '40-49', '50+']
+    institutions = ['Stanford University', 'MIT', 'State University', 'Community College', 'Online Program']
+    
+    # Generate dates as datetime objects
+    dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(50)]
+    
+    data = {
+        'id': range(1, 51),
+        'name': [f"Candidate {i}" for i in range(1, 51)],
+        'position': [positions[i % len(positions)] for i in range(50)],
+        'department': [departments[i % len(departments)] for i in range(50)],
+        'location': [locations[i % len(locations)] for i in range(50)],
+        'gender': [genders[i % len(genders)] for i in range(50)],
+        'age_band': [age_bands[(i // 3) % len(age_bands)] for i in range(50)],
+        'institution': [institutions[(i // 2) % len(institutions)] for i in range(50)],
+        'technical_score': [60 + (i * 7) % 40 for i in range(50)],
+        'experience_score': [55 + (i * 11) % 45 for i in range(50)],
+        'education_score': [65 + (i * 5) % 35 for i in range(50)],
+        'cultural_fit': [70 + (i * 3) % 30 for i in range(50)],
+        'score': [round(50 + (i % 50), 1) for i in range(50)],
+        'bias_risk': ['Low' if i > 30 else 'Medium' if i > 15 else 'High' for i in range(50)],
+        'status': ['Review' if i < 20 else 'Approved' if i < 35 else 'Rejected' for i in range(50)],
+        'application_date': dates
+    }
+    df = pd.DataFrame(data)
+    # Convert application_date to datetime
+    df['application_date'] = pd.to_datetime(df['application_date'])
+    return df
+
+
+# Mock candidate data
+@st.cache_data
+@shared_cache('candidate_profile')
+def get_candidate_data(candidate_id):
+    return Candidate.from_profile(candidate_id, {
+        'personal': {
+            'name': 'John Smith',
+            'email': 'john.smith@email.com',
+            'phone': '+1 (555) 123-4567',
+            'location': 'San Francisco, CA',
+            'position': 'Senior Data Scientist',
+            'department': 'Data Science',
+            'status': 'In Review',
+            'application_date': '2024-01-01'
+        },
+        'education': [
+            {
+                'degree': 'Ph.D. in Computer Science',
+                'institution': 'Stanford University',
+                'year': '2018-2022',
+                'gpa': '3.9'
+            },
+            {
+                'degree': 'M.S. in Data Science',
+                'institution': 'MIT',
+                'year': '2016-2018',
+                'gpa': '3.8'
+            }
+        ],
+        'experience': [
+            {
+                'title': 'Lead Data Scientist',
+                'company': 'Tech Corp',
+                'duration': '2022-Present',
+                'description': 'Led a team of 5 data scientists in developing ML models'
+            },
+            {
+                'title': 'Data Scientist',
+                'company': 'AI Startup',
+                'duration': '2018-2022',
+                'description': 'Developed and deployed ML models for client projects'
+            }
+        ],
+        'skills': {
+            'technical': {
+                'Python': 95,
+                'Machine Learning': 90,
+                'Deep Learning': 85,
+                'SQL': 88,
+                'Cloud Platforms': 82
+            },
+            'soft': {
+                'Leadership': 90,
+                'Communication': 88,
+                'Problem Solving': 92,
+                'Teamwork': 95,
+                'Project Management': 85
+            }
+        },
+        'ai_evaluation': {
+            'overall_score': 92,
+            'technical_score': 90,
+            'experience_score': 88,
+            'education_score': 95,
+            'cultural_fit': 92,
+            'bias_risk': 'Low',
+            'flags': [],
+            'recommendations': [
+                'Strong technical background',
+                'Excellent leadership experience',
+                'Cultural fit alignment'
+            ]
+        }
+    })
+
+
+# Override log: AI scores and the scores reviewers settled on. Read from a
+# partitioned dataset (e.g. written by hiring.synthetic) when configured.
+# Not cached here: the override store (hiring.overrides) loads it once.
+def get_override_log():
+    data_dir = os.environ.get('HIRING_OVERRIDE_DATA')
+    if data_dir:
+        return partitions.read_partitions(data_dir, date_column='date')
+    return mock_override_log()
+
+
+# Mock override log. Each department corrects the AI in its own way,
+# which calibration picks up.
+@st.cache_data
+@shared_cache('override_log')
+def mock_override_log(rows=50_000):
+    positions = ['Data Scientist', 'Software Engineer', 'Product Manager', 'UX Designer',
+                'ML Engineer', 'DevOps Engineer', 'Frontend Developer', 'Backend Developer']
+    departments = ['Engineering', 'Product', 'Design', 'Data']
+    rng = np.random.default_rng(11)
+    department = rng.choice(departments, rows)
+    ai_score = rng.integers(40, 101, rows).astype(float)
+    corrections = {
+        'Engineering': lambda score: score - 0.2 * (score - 60).clip(0),  # high scores overrated
+        'Product': lambda score: score + 3,
+        'Design': lambda score: 50 + 0.7 * (score - 50),
+        'Data': lambda score: score
+    }
+    human_score = ai_score.copy()
+    for name, correct in corrections.items():
+        rows_in = department == name
+        human_score[rows_in] = correct(ai_score[rows_in])
+    human_score = np.clip(np.rint(human_score + rng.normal(0, 3, rows)), 0, 100)
+    return pd.DataFrame({
+        'position': rng.choice(positions, rows),
+        'department': department,
+        'ai_score': ai_score,
+        'human_score': human_score,
+        'date': pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D')
+    })
+
+
+# Mock reviewer decisions for logs that don't record reviewers: a year of
+# decisions from 300 reviewers, yielded one month at a time. Each reviewer
+# adjusts the AI score with their own bias and noise.
+def mock_reviewer_decisions(reviewer_count=300, monthly=100_000):
+    rng = np.random.default_rng(7)
+    names = np.array([f"Reviewer {i:03d}" for i in range(reviewer_count)], dtype=object)
+    bias = rng.normal(0, 2, len(names))
+    noise = rng.uniform(2, 8, len(names))
+    for month in pd.date_range(start='2023-01-01', periods=12, freq='MS'):
+        who = rng.integers(0, len(names), monthly)
+        ai_score = rng.integers(50, 100, monthly)
+        human_score = np.clip(np.rint(ai_score + bias[who] + rng.normal(0, 1, monthly) * noise[who]), 0, 100)
+        yield pd.DataFrame({
+            'reviewer': names[who],
+            'ai_score': ai_score,
+            'human_score': human_score,
+            'final_decision': np.where(human_score >= reviewers.AI_APPROVAL_THRESHOLD, 'Approved', 'Rejected'),
+            'date': month + pd.to_timedelta(rng.integers(0, month.days_in_month, monthly), unit='D')
+        })
@@ -0,0 +1,358 @@
+"""Data access over an embedded SQLite database, shared by every page.
+
+The candidate and override stores remain the source of truth. The
+database mirrors them: a writer thread bulk-loads each table once, then
+applies the changes store listeners queue for it, so a store commit
+never waits on SQLite. Pages ask it for filtered and aggregated results
+through typed methods instead of shaping their own frames, so filtering,
+ordering, limits and grouping run in the engine. A query waits only for
+the tables it reads, and only until they hold every change queued before
+it started.
+
+Connections come from a fixed-size pool shared by every thread of the
+process, so concurrent sessions reuse them instead of opening their own.
+Every query is parameterized, and ``sqlite3`` keeps each connection's
+prepared statements in its statement cache. The file is in WAL mode, so
+readers never wait for the mirror's writes.
+"""
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+import streamlit as st
+
+from hiring.charts import np, pd
+from hiring.overrides import get_override_store
+from hiring.store import get_candidate_store
+
+POOL_SIZE = 8
+STATEMENT_CACHE_SIZE = 256
+
+# Rows per executemany call while bulk loading
+LOAD_CHUNK_ROWS = 100_000
+
+# Score adjustments beyond this many points share the outermost histogram bar
+MAX_ADJUSTMENT_BIN = 10
+
+# Adjustments of more than this many points count as overriding the AI
+OVERRIDE_POINTS = 5
+
+CANDIDATE_COLUMNS = (
+    'id', 'name', 'position', 'department', 'location', 'gender', 'age_band', 'institution',
+    'technical_score', 'experience_score', 'education_score', 'cultural_fit', 'score', 'bias_risk',
+    'status', 'application_date'
+)
+DECISION_COLUMNS = ('timestamp', 'id', 'previous_status', 'new_status', 'reviewer', 'batch')
+OVERRIDE_COLUMNS = ('position', 'department', 'ai_score', 'human_score', 'reviewer', 'final_decision', 'date')
+
+# Columns overrides can be grouped by
+ADJUSTMENT_GROUPS = ('department', 'position', 'reviewer')
+
+SCHEMA = (
+    "CREATE TABLE candidates ("
+    "id INTEGER PRIMARY KEY, name TEXT, position TEXT, department TEXT, location TEXT, gender TEXT, "
+    "age_band TEXT, institution TEXT, technical_score INTEGER, experience_score INTEGER, "
+    "education_score INTEGER, cultural_fit INTEGER, score REAL, bias_risk TEXT, status TEXT, "
+    "application_date TEXT)",
+    "CREATE TABLE decisions ("
+    "timestamp TEXT, id INTEGER, previous_status TEXT, new_status TEXT, reviewer TEXT, batch INTEGER)",
+    "CREATE TABLE overrides ("
+    "position TEXT, department TEXT, ai_score REAL, human_score REAL, reviewer TEXT, final_decision TEXT, date TEXT)",
+)
+
+# Built after each table's bulk load, which is faster than maintaining them during it
+INDEXES = {
+    'candidates': "CREATE INDEX candidates_application_date ON candidates (application_date)",
+    'decisions': "CREATE INDEX decisions_batch ON decisions (batch)",
+    'overrides': "CREATE INDEX overrides_department ON overrides (department)",
+}
+
+# Load order: the small tables first, so the queries on them are served sooner
+TABLES = ('overrides', 'decisions', 'candidates')
+
+CandidateRow = namedtuple('CandidateRow', CANDIDATE_COLUMNS)
+OverrideSummary = namedtuple('OverrideSummary', ['reviews', 'overrides', 'override_rate', 'mean_adjustment'])
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections shared by every thread of the process."""
+
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        # Last in, first out: the most recently used connection has the warmest caches
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        # A mirror rebuilt on every start doesn't need durable commits
+        connection.execute("PRAGMA synchronous=OFF")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, waiting for one if all ``size`` are in use."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if not create:
+                connection = self._idle.get()
+            else:
+                try:
+                    connection = self._connect()
+                except BaseException:
+                    # Give the slot back, or the pool shrinks for good
+                    with self._lock:
+                        self._created -= 1
+                    raise
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+
+def _column_values(values):
+    # SQLite takes Python scalars; dates are stored as sortable ISO text
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime('%Y-%m-%d').tolist()
+    if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+        return values.astype(object).where(values.notna(), None).tolist()
+    return values.tolist()
+
+
+def _rows(frame, columns):
+    # Columns the frame doesn't have are stored as NULL
+    return zip(*(_column_values(frame[column]) if column in frame else [None] * len(frame) for column in columns))
+
+
+class Database:
+    """Pooled, parameterized queries over the mirrored candidates, decisions and overrides."""
+
+    def __init__(self, path, pool_size=POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        # Writes per table: queued, and applied by the writer thread. The
+        # bulk load counts as each table's first write.
+        self._writes = queue.Queue()
+        self._condition = threading.Condition()
+        self._queued = dict.fromkeys(TABLES, 1)
+        self._applied = dict.fromkeys(TABLES, 0)
+        self._loaded_batch = 0
+        self.error = None
+        with self.pool.connection() as connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+
+    # Loading and mirroring
+
+    def start(self, candidates, decisions, overrides):
+        """Start the writer: bulk-load the stores' contents, then apply queued changes."""
+        threading.Thread(
+            target=self._write_loop,
+            args=(candidates, decisions, overrides),
+            name='hiring-database-writer',
+            daemon=True
+        ).start()
+
+    def _write_loop(self, candidates, decisions, overrides):
+        self._load(candidates, decisions, overrides)
+        while True:
+            tables, apply, args = self._writes.get()
+            try:
+                if self.error is None:
+                    apply(*args)
+            except Exception as error:
+                # The mirror no longer matches the stores; readers re-raise this
+                self.error = error
+            self._mark_applied(tables)
+
+    def _load(self, candidates, decisions, overrides):
+        frames = {
+            'candidates': candidates,
+            'decisions': decisions.assign(timestamp=decisions['timestamp'].astype(str)),
+            'overrides': overrides,
+        }
+        columns = {'candidates': CANDIDATE_COLUMNS, 'decisions': DECISION_COLUMNS, 'overrides': OVERRIDE_COLUMNS}
+        self._loaded_batch = int(decisions['batch'].max()) if len(decisions) else 0
+        for table in TABLES:
+            try:
+                if self.error is None:
+                    with self.pool.connection() as connection:
+                        self._insert(connection, table, frames[table], columns[table])
+                        connection.execute(INDEXES[table])
+                        connection.commit()
+            except Exception as error:
+                # Readers re-raise this instead of waiting forever
+                self.error = error
+            self._mark_applied((table,))
+
+    def _mark_applied(self, tables):
+        with self._condition:
+            for table in tables:
+                self._applied[table] += 1
+            self._condition.notify_all()
+
+    def _insert(self, connection, table, frame, columns):
+        statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        for start in range(0, len(frame), LOAD_CHUNK_ROWS):
+            connection.executemany(statement, _rows(frame.iloc[start:start + LOAD_CHUNK_ROWS], columns))
+
+    def _queue(self, tables, apply, *args):
+        # Listeners run under their store's lock, so they only queue the write;
+        # the writer thread applies writes in the order they were queued
+        with self._condition:
+            for table in tables:
+                self._queued[table] += 1
+            self._writes.put((tables, apply, args))
+
+    def record_decisions(self, audit, candidates=None):
+        """Candidate store listener: mirror a committed batch of decisions."""
+        if not audit.empty:
+            self._queue(('candidates', 'decisions'), self._record_decisions, audit)
+
+    def _record_decisions(self, audit):
+        with self.pool.connection() as connection:
+            # Status updates are idempotent and applied in batch order
+            connection.executemany(
+                "UPDATE candidates SET status = ? WHERE id = ?",
+                zip(_column_values(audit['new_status']), _column_values(audit['id']))
+            )
+            # Audit entries already in the bulk-loaded log are not added twice
+            audit = audit[audit['batch'] > self._loaded_batch]
+            self._insert(connection, 'decisions', audit.assign(timestamp=audit['timestamp'].astype(str)), DECISION_COLUMNS)
+            connection.commit()
+
+    def record_candidates(self, added, candidates=None):
+        """Candidate store listener: mirror older rows loaded into the store."""
+        self._queue(('candidates',), self._record_candidates, added)
+
+    def _record_candidates(self, added):
+        with self.pool.connection() as connection:
+            self._insert(connection, 'candidates', added, CANDIDATE_COLUMNS)
+            connection.commit()
+
+    def record_overrides(self, overrides):
+        """Override store listener: mirror an appended chunk of overrides."""
+        self._queue(('overrides',), self._record_overrides, overrides)
+
+    def _record_overrides(self, overrides):
+        with self.pool.connection() as connection:
+            self._insert(connection, 'overrides', overrides, OVERRIDE_COLUMNS)
+            connection.commit()
+
+    # Reading
+
+    def wait_ready(self, tables=TABLES, timeout=None):
+        """Wait until ``tables`` hold every write queued so far, including the bulk load."""
+        with self._condition:
+            queued = {table: self._queued[table] for table in tables}
+            self._condition.wait_for(
+                lambda: all(self._applied[table] >= count for table, count in queued.items()), timeout
+            )
+        if self.error is not None:
+            raise RuntimeError("Loading the database failed") from self.error
+
+    def _fetch(self, table, sql, params=()):
+        self.wait_ready((table,))
+        with self.pool.connection() as connection:
+            return connection.execute(sql, params).fetchall()
+
+    def _frame(self, table, sql, params, columns):
+        return pd.DataFrame.from_records(self._fetch(table, sql, params), columns=columns)
+
+    def candidate(self, candidate_id):
+        """One candidate as a ``CandidateRow``, or None if unknown."""
+        rows = self._fetch('candidates', f"SELECT {', '.join(CANDIDATE_COLUMNS)} FROM candidates WHERE id = ?", (int(candidate_id),))
+        if not rows:
+            return None
+        *values, application_date = rows[0]
+        return CandidateRow(*values, pd.Timestamp(application_date))
+
+    def candidates_by_ids(self, ids):
+        """Candidates in ``ids`` in the order given, by primary key; raises ``KeyError`` if any is unknown."""
+        ids = [int(candidate_id) for candidate_id in ids]
+        frame = self._frame(
+            'candidates',
+            f"SELECT {', '.join(CANDIDATE_COLUMNS)} FROM candidates WHERE id IN ({', '.join('?' * len(ids))})",
+            ids, CANDIDATE_COLUMNS
+        )
+        order = pd.Index(frame['id']).get_indexer(ids)
+        if (order < 0).any():
+            raise KeyError(f"Unknown candidate ids: {np.asarray(ids)[order < 0][:10].tolist()}")
+        frame = frame.iloc[order].reset_index(drop=True)
+        frame['application_date'] = pd.to_datetime(frame['application_date'])
+        return frame
+
+    def recent_decisions(self, limit=100):
+        """The latest ``limit`` audited decisions, newest first."""
+        frame = self._frame(
+            'decisions',
+            f"SELECT {', '.join(DECISION_COLUMNS)} FROM decisions ORDER BY batch DESC, rowid DESC LIMIT ?",
+            (int(limit),), DECISION_COLUMNS
+        )
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        return frame
+
+    def override_summary(self):
+        """Reviews in the override log, how many overrode the AI score, and the mean adjustment."""
+        reviews, overrides, mean_adjustment = self._fetch(
+            'overrides',
+            "SELECT count(*), coalesce(sum(abs(human_score - ai_score) > ?), 0), coalesce(avg(human_score - ai_score), 0.0) "
+            "FROM overrides",
+            (OVERRIDE_POINTS,)
+        )[0]
+        return OverrideSummary(reviews, overrides, overrides / reviews if reviews else 0.0, mean_adjustment)
+
+    def adjustment_histogram(self):
+        """Reviews per whole-point score adjustment, clipped to +/-``MAX_ADJUSTMENT_BIN``."""
+        return self._frame(
+            'overrides',
+            "SELECT max(min(CAST(round(human_score - ai_score) AS INTEGER), ?), ?) AS adjustment, count(*) "
+            "FROM overrides GROUP BY adjustment ORDER BY adjustment",
+            (MAX_ADJUSTMENT_BIN, -MAX_ADJUSTMENT_BIN), ['adjustment', 'frequency']
+        )
+
+    def adjustments_by(self, column):
+        """Review count and mean (absolute) adjustment per value of ``column``."""
+        if column not in ADJUSTMENT_GROUPS:
+            raise ValueError(f"Overrides can't be grouped by {column!r}")
+        return self._frame(
+            'overrides',
+            f"SELECT {column}, count(*), avg(human_score - ai_score), avg(abs(human_score - ai_score)) "
+            f"FROM overrides WHERE {column} IS NOT NULL GROUP BY {column} ORDER BY count(*) DESC",
+            (), [column, 'reviews', 'mean_adjustment', 'mean_abs_adjustment']
+        )
+
+
+@st.cache_resource
+def get_database():
+    # One file per worker process: each mirrors its own stores. HIRING_DB
+    # sets where they go; the process id is added to its name.
+    configured = os.environ.get('HIRING_DB') or os.path.join(tempfile.gettempdir(), 'hiring.sqlite')
+    root, extension = os.path.splitext(configured)
+    path = f'{root}-{os.getpid()}{extension or ".sqlite"}'
+    # The database is a mirror rebuilt on every start
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    database = Database(path)
+    store, override_store = get_candidate_store(), get_override_store()
+    # Subscribing returns the contents the listener's first call follows on from
+    candidates, _ = store.subscribe(database.record_decisions, on_history=database.record_candidates)
+    overrides, _ = override_store.subscribe(database.record_overrides)
+    # Changes queued by the listeners meanwhile are applied after the bulk load
+    database.start(candidates, store.audit_log(), overrides)
+    return database
@@ -0,0 +1,252 @@
+"""Per-candidate AI explanations, materialized when candidates are scored.
+
+``materialize`` turns a scored candidate frame into one explanation row
+per candidate: the four factor scores and their weighted contributions
+to the AI score, the education prior, a band per factor that selects its
+explanation and key points, and a risk level per bias type. It is one
+vectorized pass over the frame, run where candidates are scored;
+``hiring.synthetic`` writes its output next to the candidate dataset.
+
+``ExplanationStore`` answers lookups by candidate id. In memory the rows
+are sorted by id and found with a binary search. On disk the Parquet
+file is sorted by id too, so a lookup reads only the row group whose id
+range holds the candidate. Either way, opening an explanation costs the
+same however many candidates there are.
+"""
+import os
+import threading
+
+import streamlit as st
+
+from hiring.charts import np, pd
+from hiring.scoring import FACTOR_WEIGHTS, INSTITUTION_ADJUSTMENT
+from hiring.store import get_candidate_store
+from hiring.versions import fingerprint, get_data_versions
+
+# Factor shown on the explanation page -> scored column
+FACTORS = {
+    'Technical Skills': 'technical_score',
+    'Experience': 'experience_score',
+    'Education': 'education_score',
+    'Cultural Fit': 'cultural_fit',
+}
+
+# How well each factor is measured: confidence and half-width of its interval
+FACTOR_CONFIDENCE = {'technical_score': 0.95, 'experience_score': 0.90, 'education_score': 0.98, 'cultural_fit': 0.85}
+FACTOR_MARGIN = {'technical_score': 2, 'experience_score': 3, 'education_score': 2, 'cultural_fit': 3}
+
+# Factor scores below each bound fall in that band
+BANDS = ['Developing', 'Solid', 'Strong']
+BAND_BOUNDS = [70, 85]
+
+# Explanation and key points per factor and band
+FACTOR_TEXT = {
+    'technical_score': {
+        'Developing': ('Gaps in some required technical skills', ('Core skills below the role requirement', 'Limited hands-on project evidence', 'Would need technical onboarding')),
+        'Solid': ('Meets the technical requirements of the role', ('Working proficiency in the core stack', 'Relevant project experience', 'Room to deepen specialist skills')),
+        'Strong': ('Strong proficiency in required technical skills', ('Advanced skills in the core stack', 'Extensive specialist experience', 'Strong tooling and platform knowledge')),
+    },
+    'experience_score': {
+        'Developing': ('Limited experience in similar roles', ('Early-career profile', 'Few comparable responsibilities', 'Would benefit from mentoring')),
+        'Solid': ('Relevant experience in similar roles', ('Comparable responsibilities held', 'Some project ownership', 'Domain familiarity')),
+        'Strong': ('Extensive experience in similar roles', ('Leadership experience', 'Project management skills', 'Industry expertise')),
+    },
+    'education_score': {
+        'Developing': ('Education only partly matches the role', ('Degree in an adjacent field', 'Limited formal training in core topics', 'Skills mostly self-taught')),
+        'Solid': ('Relevant degree for the role', ('Degree in a related field', 'Solid academic record', 'Relevant coursework')),
+        'Strong': ('Advanced degree in a relevant field', ('Advanced degree in the field', 'Research background', 'Academic achievements')),
+    },
+    'cultural_fit': {
+        'Developing': ('Some misalignment with team practices', ('Different working-style preferences', 'Limited collaboration evidence', 'Worth probing in interview')),
+        'Solid': ('Good alignment with company values', ('Clear communication', 'Collaborative working style', 'Shared values')),
+        'Strong': ('Strong alignment with company values', ('Communication skills', 'Team collaboration', 'Leadership potential')),
+    },
+}
+
+BIAS_TYPES = ('gender_bias', 'age_bias', 'education_bias', 'cultural_bias')
+RISK_LEVELS = ['Low', 'Medium', 'High']
+RISK_CONFIDENCE = {'Low': 0.95, 'Medium': 0.85, 'High': 0.80}
+
+# Scores this close to the approval bar can be decided by the education prior
+APPROVAL_THRESHOLD = 85
+
+# Age bands whose experience scores run furthest from the mean
+AGE_EXTREMES = ('18-29', '50+')
+
+# Parquet row group size: the most a disk lookup reads
+ROW_GROUP_ROWS = 65_536
+
+
+def materialize(candidates):
+    """One explanation row per scored candidate, sorted by id."""
+    rows = len(candidates)
+    frame = {'id': candidates['id'].to_numpy(dtype=np.int64), 'score': candidates['score'].to_numpy(dtype=np.float32)}
+    for column in FACTORS.values():
+        scores = candidates[column].to_numpy(dtype=np.float32)
+        frame[column] = scores.astype(np.uint8)
+        frame[column.replace('_score', '') + '_contribution'] = FACTOR_WEIGHTS[column] * scores
+        frame[column.replace('_score', '') + '_band'] = pd.Categorical.from_codes(
+            np.searchsorted(BAND_BOUNDS, scores, side='right'), categories=BANDS
+        )
+
+    if 'institution' in candidates:
+        adjustment = candidates['institution'].map(INSTITUTION_ADJUSTMENT).fillna(0.0).to_numpy(dtype=np.float32)
+    else:
+        adjustment = np.zeros(rows, dtype=np.float32)
+    prior = FACTOR_WEIGHTS['education_score'] * adjustment
+    frame['education_prior'] = prior
+
+    # The scorer reads no gender or gender proxy
+    gender = np.zeros(rows, dtype=np.int8)
+    # Experience tracks age, so a weak experience score at either end of the age range is a flag
+    if 'age_band' in candidates:
+        extreme = candidates['age_band'].isin(AGE_EXTREMES).to_numpy()
+        age = np.where(extreme & (frame['experience_score'] < BAND_BOUNDS[0]), 1, 0)
+    else:
+        age = np.zeros(rows, dtype=np.int8)
+    # Any institution prior is a flag; one large enough to move the score across the bar is high risk
+    decisive = np.abs(frame['score'] - APPROVAL_THRESHOLD) < np.abs(prior)
+    education = np.where(decisive, 2, np.where(adjustment != 0, 1, 0))
+    # Cultural fit is the most subjective factor; it carries the screening model's own flag
+    if 'bias_risk' in candidates:
+        cultural = pd.Categorical(candidates['bias_risk'], categories=RISK_LEVELS).codes
+    else:
+        cultural = np.zeros(rows, dtype=np.int8)
+    for bias_type, codes in zip(BIAS_TYPES, (gender, age, education, cultural)):
+        frame[bias_type] = pd.Categorical.from_codes(np.maximum(codes, 0), categories=RISK_LEVELS)
+
+    explanations = pd.DataFrame(frame)
+    if not explanations['id'].is_monotonic_increasing:
+        explanations = explanations.sort_values('id', kind='stable', ignore_index=True)
+    return explanations
+
+
+def write_explanations(explanations, path):
+    """Write materialized explanations as one Parquet file sorted by id."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    if not explanations['id'].is_monotonic_increasing:
+        explanations = explanations.sort_values('id', kind='stable', ignore_index=True)
+    # Write then rename, so readers never see a partial file
+    staging = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}')
+    explanations.to_parquet(staging, index=False, row_group_size=ROW_GROUP_ROWS)
+    os.replace(staging, path)
+
+
+def explain(row):
+    """Explanation of one materialized row, as the explanation page shows it."""
+    factors = {}
+    for name, column in FACTORS.items():
+        prefix = column.replace('_score', '')
+        score = int(row[column])
+        band = row[prefix + '_band']
+        text, key_points = FACTOR_TEXT[column][band]
+        margin = FACTOR_MARGIN[column]
+        factors[name] = {
+            'weight': FACTOR_WEIGHTS[column],
+            'score': score,
+            'contribution': round(float(row[prefix + '_contribution']), 1),
+            'band': band,
+            'confidence_interval': (max(score - margin, 0), min(score + margin, 100)),
+            'explanation': text,
+            'confidence': FACTOR_CONFIDENCE[column],
+            'key_points': list(key_points)
+        }
+    return {
+        'candidate_id': int(row['id']),
+        'score': round(float(row['score']), 1),
+        'education_prior': round(float(row['education_prior']), 1),
+        'decision_factors': factors,
+        'bias_analysis': {
+            bias_type: {'risk': row[bias_type], 'confidence': RISK_CONFIDENCE[row[bias_type]]}
+            for bias_type in BIAS_TYPES
+        }
+    }
+
+
+class ExplanationStore:
+    """Explanations by candidate id, from a materialized frame or a Parquet file."""
+
+    def __init__(self, explanations=None, path=None):
+        if (explanations is None) == (path is None):
+            raise ValueError("Pass either explanations or path")
+        self._path = path
+        self._lock = threading.Lock()
+        if explanations is not None:
+            # Swapped as one pair by ``rematerialize``
+            self._materialized = (explanations, explanations['id'].to_numpy())
+        else:
+            self._materialized = None
+            import pyarrow.parquet as pq
+            self._file = pq.ParquetFile(path)
+            # Row group id ranges come from the footer; no data is read here
+            id_column = self._file.schema_arrow.get_field_index('id')
+            metadata = self._file.metadata
+            self._group_first = np.array([
+                metadata.row_group(group).column(id_column).statistics.min for group in range(metadata.num_row_groups)
+            ])
+
+    def __len__(self):
+        if self._materialized is not None:
+            return len(self._materialized[1])
+        return self._file.metadata.num_rows
+
+    def rematerialize(self, candidates):
+        """Replace in-memory explanations with ones for ``candidates``.
+
+        The store only ever gains rows, so a call with fewer rows than are
+        already held (an older snapshot) changes nothing.
+        """
+        if len(candidates) <= len(self):
+            return
+        explanations = materialize(candidates)
+        with self._lock:
+            if len(explanations) > len(self):
+                self._materialized = (explanations, explanations['id'].to_numpy())
+
+    def rows(self, ids):
+        """Materialized rows for ``ids`` in the order given; raises ``KeyError`` if any is unknown."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._materialized is not None:
+            frame, known = self._materialized
+        else:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            # Every row group holding a requested id is read once, and only
+            # the requested rows are converted
+            groups = np.unique(np.searchsorted(self._group_first, ids, side='right') - 1)
+            table = self._file.read_row_groups(groups[groups >= 0].tolist())
+            frame = table.filter(pc.is_in(table['id'], value_set=pa.array(ids))).to_pandas()
+            known = frame['id'].to_numpy()
+        positions = np.minimum(np.searchsorted(known, ids), max(len(known) - 1, 0))
+        found = known[positions] == ids if len(known) else np.zeros(len(ids), dtype=bool)
+        if not found.all():
+            raise KeyError(f"No explanations for candidate ids: {ids[~found][:10].tolist()}")
+        return frame.iloc[positions].reset_index(drop=True)
+
+    def row(self, candidate_id):
+        """Materialized row for ``candidate_id`` as a dict; raises ``KeyError`` if unknown."""
+        frame = self.rows([candidate_id])
+        return {column: frame[column].iat[0] for column in frame.columns}
+
+    def explain(self, candidate_id):
+        return explain(self.row(candidate_id))
+
+
+@st.cache_resource
+def get_explanation_store():
+    # Explanations materialized with the dataset (see hiring.synthetic) when configured
+    data_path = os.environ.get('HIRING_EXPLANATION_DATA')
+    versions = get_data_versions()
+    if data_path:
+        versions.set_base('explanations', fingerprint(data_path))
+        return ExplanationStore(path=data_path)
+    # Otherwise materialize them from the loaded candidates, again when older
+    # rows are loaded into the store
+    data_dir = os.environ.get('HIRING_CANDIDATE_DATA')
+    versions.set_base('explanations', fingerprint(data_dir) if data_dir else 'mock')
+    store = get_candidate_store()
+    explanation_store = ExplanationStore(materialize(store.snapshot().candidates))
+    candidates, _ = store.subscribe(on_history=lambda added, candidates: explanation_store.rematerialize(candidates))
+    # Covers history loaded before subscribing
+    explanation_store.rematerialize(candidates)
+    return explanation_store
@@ -0,0 +1,197 @@
+"""Online fairness monitoring of hiring decisions.
+
+``FairnessMonitor`` keeps per-group approval counters over two sliding
+windows of recent decisions: the current window and the one before it.
+Each decision updates the counters in O(1) and rechecks the
+disparate-impact ratio (lowest group approval rate over the highest,
+the four-fifths rule) and a two-proportion z-test between the two
+windows. Alerts are pushed to a ``NotificationFeed`` when a check starts
+failing, not on every decision while it keeps failing, and only re-arm
+once the check has recovered by a margin, so noise around a threshold
+does not flood the feed.
+"""
+import math
+import threading
+from collections import defaultdict, deque
+from datetime import datetime
+
+import streamlit as st
+
+from hiring.charts import pd
+
+PROTECTED_ATTRIBUTES = ('gender', 'age_band')
+
+# Statuses that count as a final decision, mapped to "approved"
+FINAL_DECISIONS = {'Approved': True, 'Rejected': False}
+
+
+class NotificationFeed:
+    """Most recent notification events, newest first."""
+
+    def __init__(self, max_events=50):
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def push(self, type, message):
+        with self._lock:
+            self._events.appendleft({'type': type, 'message': message, 'time': datetime.now()})
+
+    def events(self):
+        with self._lock:
+            return list(self._events)
+
+
+def _same_array(a, b):
+    # ``a`` is held by the cache, so its buffer can't have been reused
+    return a.shape == b.shape and a.strides == b.strides and \
+        a.__array_interface__['data'][0] == b.__array_interface__['data'][0]
+
+
+class _Window:
+    def __init__(self):
+        self.decisions = deque()
+        self.totals = defaultdict(int)
+        self.approvals = defaultdict(int)
+
+    def add(self, decision):
+        key, approved = decision
+        self.decisions.append(decision)
+        self.totals[key] += 1
+        self.approvals[key] += approved
+
+    def pop(self):
+        decision = self.decisions.popleft()
+        key, approved = decision
+        self.totals[key] -= 1
+        self.approvals[key] -= approved
+        return decision
+
+    def rate(self, key):
+        total = self.totals.get(key, 0)
+        return self.approvals.get(key, 0) / total if total else None
+
+
+class FairnessMonitor:
+    """Streaming disparate-impact and drift checks per protected attribute."""
+
+    def __init__(self, feed, attributes=PROTECTED_ATTRIBUTES, window_size=1000,
+                 impact_threshold=0.8, drift_z=3.0, min_group_size=30, recovery_margin=0.05):
+        self.feed = feed
+        self.attributes = attributes
+        self.window_size = window_size
+        self.impact_threshold = impact_threshold
+        self.drift_z = drift_z
+        self.min_group_size = min_group_size
+        self.recovery_margin = recovery_margin
+        self._current = _Window()
+        self._previous = _Window()
+        self._groups = defaultdict(set)
+        self._alerting = set()
+        self._lock = threading.Lock()
+        # Candidate id column and the index built over it
+        self._id_index = None
+
+    def record(self, groups, approved):
+        """Record one decision for a candidate in ``groups`` ({attribute: group})."""
+        with self._lock:
+            for attribute in self.attributes:
+                group = groups[attribute]
+                self._groups[attribute].add(group)
+                self._current.add(((attribute, group), int(approved)))
+            # The current window holds one entry per attribute per decision
+            while len(self._current.decisions) > self.window_size * len(self.attributes):
+                self._previous.add(self._current.pop())
+            while len(self._previous.decisions) > self.window_size * len(self.attributes):
+                self._previous.pop()
+            for attribute in self.attributes:
+                self._check(attribute)
+
+    def record_batch(self, audit, candidates):
+        """Feed a store batch (audit rows plus the candidate frame) to the monitor."""
+        final = audit[audit['new_status'].isin(list(FINAL_DECISIONS))]
+        if final.empty:
+            return
+        positions = self._positions(candidates, final['id'])
+        found = positions >= 0
+        groups = candidates[list(self.attributes)].iloc[positions[found]]
+        approved = final['new_status'].map(FINAL_DECISIONS).to_numpy()[found]
+        for row, is_approved in zip(groups.itertuples(index=False), approved):
+            self.record(dict(zip(self.attributes, row)), is_approved)
+
+    def _positions(self, candidates, ids):
+        # Batches only change statuses, and the store's new frame shares the
+        # id column's memory, so the index is rebuilt only when rows change
+        column = candidates['id'].to_numpy()
+        cached = self._id_index
+        if cached is None or not _same_array(cached[0], column):
+            cached = self._id_index = (column, pd.Index(column))
+        return cached[1].get_indexer(ids)
+
+    def disparate_impact(self, attribute):
+        """(ratio, {group: approval rate}) over the current window."""
+        with self._lock:
+            return self._disparate_impact(attribute)
+
+    def _disparate_impact(self, attribute):
+        rates = {}
+        for group in self._groups[attribute]:
+            key = (attribute, group)
+            if self._current.totals.get(key, 0) >= self.min_group_size:
+                rates[group] = self._current.rate(key)
+        if len(rates) < 2 or max(rates.values()) == 0:
+            return None, rates
+        return min(rates.values()) / max(rates.values()), rates
+
+    def _check(self, attribute):
+        ratio, rates = self._disparate_impact(attribute)
+        label = attribute.replace('_', ' ')
+        failing = ratio is not None and ratio < self.impact_threshold
+        recovered = ratio is None or ratio >= self.impact_threshold + self.recovery_margin
+        if self._transition(('impact', attribute), failing, recovered):
+            lowest = min(rates, key=rates.get)
+            self.feed.push(
+                '⚠️ Warning',
+                f"Disparate impact on {label}: ratio {ratio:.3f} is below {self.impact_threshold:.2f} "
+                f"({lowest} approved at {rates[lowest]:.0%})"
+            )
+
+        for group in self._groups[attribute]:
+            z = self._drift_z((attribute, group))
+            drifting = z is not None and abs(z) > self.drift_z
+            recovered = z is None or abs(z) < self.drift_z - 1
+            if self._transition(('drift', attribute, group), drifting, recovered):
+                direction = 'rose' if z > 0 else 'fell'
+                self.feed.push(
+                    '📉 Drift',
+                    f"Approval rate for {label} {group} {direction} to "
+                    f"{self._current.rate((attribute, group)):.0%} (z = {z:+.1f})"
+                )
+
+    def _drift_z(self, key):
+        n1, n2 = self._current.totals.get(key, 0), self._previous.totals.get(key, 0)
+        if n1 < self.min_group_size or n2 < self.min_group_size:
+            return None
+        pooled = (self._current.approvals[key] + self._previous.approvals[key]) / (n1 + n2)
+        spread = math.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+        if spread == 0:
+            return None
+        return (self._current.rate(key) - self._previous.rate(key)) / spread
+
+    def _transition(self, alert, failing, recovered):
+        # True only when an alert goes from clear to active
+        if failing and alert not in self._alerting:
+            self._alerting.add(alert)
+            return True
+        if recovered:
+            self._alerting.discard(alert)
+        return False
+
+
+@st.cache_resource
+def get_notification_feed():
+    return NotificationFeed()
+
+
+@st.cache_resource
+def get_fairness_monitor():
+    return FairnessMonitor(get_notification_feed())
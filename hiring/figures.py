@@ -0,0 +1,146 @@
+"""Figure cache shared by every session on this server process.
+
+Figures are keyed on (chart id, normalized filter selection, data
+version), so reviewers looking at the same view reuse one built figure
+instead of constructing it again on each rerun. The cache is bounded by
+the estimated size of the figures it holds, since a figure's traces can
+carry as many points as the rows it was drawn from.
+"""
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import streamlit as st
+
+from hiring.charts import pd
+
+MAX_FIGURE_BYTES = 64 * 1024 * 1024
+
+# Layout, templates and other per-figure state, on top of the trace data
+FIGURE_OVERHEAD_BYTES = 16 * 1024
+
+
+def normalize_filters(filters):
+    """Turn a filter selection into a hashable, order-independent key."""
+    normalized = []
+    for name, value in sorted((filters or {}).items()):
+        if isinstance(value, (list, tuple, set, frozenset)) or hasattr(value, "tolist"):
+            value = tuple(sorted(_normalize_value(v) for v in value))
+        else:
+            value = _normalize_value(value)
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def _normalize_value(value):
+    # datetime and pd.Timestamp are date subclasses too
+    if isinstance(value, date):
+        return value.isoformat()
+    # NumPy scalars
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def data_version(data):
+    """Content hash of a DataFrame (or any picklable object)."""
+    if isinstance(data, pd.DataFrame):
+        hashed = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        digest = hashlib.sha1(hashed.tobytes())
+        digest.update(",".join(map(str, data.columns)).encode())
+    else:
+        digest = hashlib.sha1(pickle.dumps(data))
+    return digest.hexdigest()[:16]
+
+
+def _data_bytes(value):
+    # Arrays report their size; other sequences are counted at 8 bytes an item
+    if hasattr(value, 'nbytes'):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_data_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return 8 * len(value)
+    return 0
+
+
+def figure_bytes(figure):
+    """Rough size of a figure: the data its traces hold, plus a fixed overhead."""
+    traces = getattr(figure, 'data', ())
+    return FIGURE_OVERHEAD_BYTES + sum(_data_bytes(trace.to_plotly_json()) for trace in traces)
+
+
+class FigureCache:
+    """Thread-safe LRU of built Plotly figures, bounded by their estimated size."""
+
+    def __init__(self, max_bytes=MAX_FIGURE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (figure, estimated bytes)
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build, store=True):
+        with self._lock:
+            entry = self._figures.get(key)
+            if entry is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # Build and size outside the lock so slow charts don't block other sessions
+        figure = build()
+        if not store:
+            return figure
+        size = figure_bytes(figure)
+        # A figure bigger than the whole cache would only evict everything else
+        if size > self.max_bytes:
+            return figure
+        with self._lock:
+            previous = self._figures.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._figures[key] = (figure, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._figures.popitem(last=False)
+                self.bytes -= evicted
+        return figure
+
+    def discard_version(self, version):
+        """Drop every figure built on ``version`` (alone or within a tuple of versions)."""
+        with self._lock:
+            stale = [
+                key for key in self._figures
+                if key[2] == version or (isinstance(key[2], tuple) and version in key[2])
+            ]
+            for key in stale:
+                self.bytes -= self._figures.pop(key)[1]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._figures)
+
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache()
+
+
+def cached_figure(chart_id, filters, version, build, store=True):
+    """Return the figure for this view, building it only on a cache miss.
+
+    Cached figures are shared between sessions, so callers must treat them
+    as read-only. With ``store=False`` a miss is built but not cached.
+    """
+    key = (chart_id, normalize_filters(filters), version)
+    return get_figure_cache().get_or_build(key, build, store=store)
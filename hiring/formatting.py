@@ -0,0 +1,78 @@
+"""Vectorized conditional formatting for candidate and decision tables.
+
+Instead of a pandas Styler (one Python call per cell, plus a same-shaped
+frame of CSS strings), styles are computed as whole-column NumPy arrays
+and shown through ``st.column_config``. The source frame is never
+mutated or copied, so this is safe on frames returned by cached loaders.
+"""
+from hiring.charts import np, pd
+
+STATUS_BADGES = {
+    'Approved': '🟢 Approved',
+    'Review': '🟡 Review',
+    'Rejected': '🔴 Rejected',
+    'Info Requested': '🔵 Info Requested',
+}
+
+RISK_BADGES = {
+    'Low': '🟢 Low',
+    'Medium': '🟡 Medium',
+    'High': '🔴 High',
+}
+
+
+def category_labels(values, labels):
+    """Map categorical values to display labels in one array lookup.
+
+    Values missing from ``labels`` are passed through unchanged.
+    """
+    categories = list(labels)
+    codes = pd.Categorical(values, categories=categories).codes
+    lookup = np.array([labels[category] for category in categories] + [''], dtype=object)
+    result = lookup[codes]
+    unknown = codes < 0
+    if unknown.any():
+        result[unknown] = np.asarray(values, dtype=object)[unknown]
+    return result
+
+
+def delta_labels(new, old, fmt=None):
+    """Signed ``new - old`` differences with a color marker; empty where either is missing.
+
+    ``fmt`` defaults to whole numbers for integer differences and one
+    decimal place otherwise.
+    """
+    if fmt is None:
+        # From the inputs' dtypes: nullable integers come out of asarray as floats
+        integral = all(
+            pd.api.types.is_integer_dtype(getattr(values, 'dtype', np.asarray(values).dtype)) for values in (new, old)
+        )
+        fmt = '%+d' if integral else '%+.1f'
+    delta = np.asarray(new) - np.asarray(old)
+    missing = pd.isna(delta)
+    if missing.any():
+        labels = np.full(delta.shape, '', dtype=object)
+        if not missing.all():
+            labels[~missing] = delta_labels(delta[~missing].astype(float), 0, fmt)
+        return labels
+    # Format each distinct delta once, then broadcast with an index lookup
+    if np.issubdtype(delta.dtype, np.integer) and delta.size and np.ptp(delta) < delta.size:
+        low = delta.min()
+        distinct = np.arange(low, delta.max() + 1)
+        positions = delta - low
+    else:
+        distinct, positions = np.unique(delta, return_inverse=True)
+    markers = np.select([distinct > 0, distinct < 0], ['🟢 ', '🔴 '], '⚪ ')
+    lookup = np.char.add(markers, np.char.mod(fmt, distinct)).astype(object)
+    return lookup[positions]
+
+
+def styled_view(frame, columns):
+    """A frame over ``frame``'s columns with some replaced or added.
+
+    Built with ``copy=False`` so unchanged columns share memory with
+    ``frame`` instead of being copied.
+    """
+    data = {name: frame[name] for name in frame.columns}
+    data.update(columns)
+    return pd.DataFrame(data, index=frame.index, copy=False)
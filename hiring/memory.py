@@ -0,0 +1,98 @@
+"""Per-session memory accounting with a soft budget.
+
+Pages register the frames they hold during a rerun. Shared objects (the
+store snapshot, cached figures) are reported but not charged to the
+session. When the owned total goes over ``HIRING_SESSION_MEMORY_MB``,
+pages degrade instead of growing further: tables are paged and new
+figures are not added to the shared cache.
+"""
+import logging
+import os
+import sys
+
+import streamlit as st
+
+from hiring.charts import np, pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_MB = 256
+
+# Object columns are sized from a sample rather than a deep scan
+OBJECT_SAMPLE_SIZE = 1000
+
+
+def frame_bytes(frame):
+    """Estimated memory of a DataFrame, without a deep scan of object columns."""
+    total = int(frame.index.memory_usage())
+    for name in frame.columns:
+        column = frame[name]
+        if column.dtype == object and len(column):
+            step = max(1, len(column) // OBJECT_SAMPLE_SIZE)
+            sample = column.iloc[::step]
+            per_value = np.mean([sys.getsizeof(value) for value in sample])
+            total += int(len(column) * (8 + per_value))
+        else:
+            total += int(column.memory_usage(index=False, deep=False))
+    return total
+
+
+def object_bytes(obj):
+    if isinstance(obj, pd.DataFrame):
+        return frame_bytes(obj)
+    if isinstance(obj, pd.Series):
+        return frame_bytes(obj.to_frame())
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    return sys.getsizeof(obj)
+
+
+def budget_bytes():
+    return float(os.environ.get('HIRING_SESSION_MEMORY_MB', DEFAULT_BUDGET_MB)) * 1024 * 1024
+
+
+class SessionMemory:
+    """What one session holds during a rerun."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.items = {}
+
+    def track(self, name, obj, shared=False):
+        size = object_bytes(obj)
+        self.items[name] = (size, shared)
+        return size
+
+    @property
+    def owned_bytes(self):
+        return sum(size for size, shared in self.items.values() if not shared)
+
+    @property
+    def shared_bytes(self):
+        return sum(size for size, shared in self.items.values() if shared)
+
+    def over_budget(self):
+        return self.owned_bytes > self.budget
+
+    def render(self):
+        """Sidebar metric plus a breakdown, and a log line when over budget."""
+        owned_mb = self.owned_bytes / 1024 / 1024
+        budget_mb = self.budget / 1024 / 1024
+        st.sidebar.metric(
+            "🧠 Session Memory",
+            f"{owned_mb:.1f} MB",
+            delta=f"{owned_mb - budget_mb:+.1f} MB vs budget",
+            delta_color="inverse"
+        )
+        with st.sidebar.expander("Memory Breakdown"):
+            for name, (size, shared) in sorted(self.items.items(), key=lambda item: -item[1][0]):
+                st.caption(f"{name}: {size / 1024 / 1024:.2f} MB{' (shared)' if shared else ''}")
+        if self.over_budget():
+            logger.warning("Session over memory budget: %.1f MB of %.1f MB", owned_mb, budget_mb)
+
+
+def session_memory():
+    """Fresh accounting for this rerun of the current session."""
+    accounting = SessionMemory(budget_bytes())
+    st.session_state['_memory'] = accounting
+    return accounting
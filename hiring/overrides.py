@@ -0,0 +1,68 @@
+"""Override log shared by every session on this server process.
+
+Reviewers' confirmed score adjustments are appended in chunks, like the
+candidate store's audit log, and each append bumps the ``overrides``
+data version. Caches keyed on that version (the calibration model, its
+figures) refresh; caches keyed on other sources, such as the dashboard's
+candidate figures, are untouched.
+"""
+import os
+import threading
+from collections import namedtuple
+
+import streamlit as st
+
+from hiring.charts import pd
+from hiring.data import get_override_log
+from hiring.versions import fingerprint, get_data_versions
+
+OverrideSnapshot = namedtuple('OverrideSnapshot', ['log', 'version'])
+
+
+class OverrideStore:
+    """Append-only override log with a content version."""
+
+    def __init__(self, log, versions):
+        self._lock = threading.Lock()
+        # The log as of the last snapshot, and chunks appended since
+        self._log = log
+        self._pending = []
+        self._versions = versions
+        self._listeners = []
+        self.version = versions.get('overrides')
+
+    def subscribe(self, listener):
+        """Call ``listener(chunk)`` with every appended chunk of overrides.
+
+        Returns the snapshot that the listener's first call follows on from.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            return self._snapshot()
+
+    def snapshot(self):
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self):
+        if self._pending:
+            self._log = pd.concat([self._log, *self._pending], ignore_index=True)
+            self._pending = []
+        return OverrideSnapshot(self._log, self.version)
+
+    def append(self, overrides):
+        """Append a frame of overrides (the log's columns; extra ones are kept)."""
+        with self._lock:
+            self._pending.append(overrides)
+            self.version = self._versions.bump('overrides')
+            for listener in self._listeners:
+                listener(overrides)
+            return self.version
+
+
+@st.cache_resource
+def get_override_store():
+    data_dir = os.environ.get('HIRING_OVERRIDE_DATA')
+    versions = get_data_versions()
+    versions.set_base('overrides', fingerprint(data_dir) if data_dir else 'mock')
+    return OverrideStore(get_override_log(), versions)
@@ -0,0 +1,111 @@
+"""Candidate data partitioned by application month.
+
+On disk, each month is one Parquet file under a Hive-style directory
+(``application_month=2024-01/part-0.parquet``), so a date-range read
+opens only the months that overlap the range. In memory, a frame kept
+in date order is pruned the same way with a binary search on the date
+column, so a recent-window query touches only the rows in the window
+however much history is held.
+"""
+import os
+
+from hiring.charts import np, pd
+
+DATE_COLUMN = 'application_date'
+PARTITION_PREFIX = 'application_month='
+PARTITION_FILE = 'part-0.parquet'
+
+
+def partition_name(month):
+    return f"{PARTITION_PREFIX}{month.strftime('%Y-%m')}"
+
+
+def write_partitions(frame, root, date_column=DATE_COLUMN):
+    """Write ``frame`` as one Parquet file per month under ``root``.
+
+    Months present in ``frame`` replace the partitions already on disk;
+    other months are left alone.
+    """
+    os.makedirs(root, exist_ok=True)
+    months = frame[date_column].dt.to_period('M')
+    for month, part in frame.groupby(months, sort=True, observed=True):
+        directory = os.path.join(root, partition_name(month))
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename, so readers never see a partial file
+        staging = os.path.join(directory, f'.{PARTITION_FILE}')
+        part.to_parquet(staging, index=False)
+        os.replace(staging, os.path.join(directory, PARTITION_FILE))
+
+
+def list_partitions(root):
+    """``(month, path)`` for every partition under ``root``, oldest first."""
+    partitions = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name, PARTITION_FILE)
+        if name.startswith(PARTITION_PREFIX) and os.path.exists(path):
+            partitions.append((pd.Period(name[len(PARTITION_PREFIX):], freq='M'), path))
+    return sorted(partitions)
+
+
+def read_partitions(root, start=None, end=None, columns=None, date_column=DATE_COLUMN, ascending=False):
+    """Rows with ``start <= date <= end`` (whole days), newest first by default.
+
+    Partitions outside the range are never opened; only the boundary
+    months are filtered row by row.
+    """
+    lower = pd.Timestamp(start).normalize() if start is not None else None
+    upper = pd.Timestamp(end).normalize() + pd.Timedelta(days=1) if end is not None else None
+    if columns is not None and date_column not in columns:
+        columns = [date_column, *columns]
+
+    partitions = list_partitions(root)
+    if not partitions:
+        raise FileNotFoundError(f"No candidate partitions under {root}")
+    parts = []
+    for month, path in partitions:
+        if lower is not None and month.end_time < lower:
+            continue
+        if upper is not None and month.start_time >= upper:
+            continue
+        part = pd.read_parquet(path, columns=columns)
+        # Only months cut by a bound need a row filter
+        if lower is not None and month.start_time < lower:
+            part = part[part[date_column] >= lower]
+        if upper is not None and month.end_time >= upper:
+            part = part[part[date_column] < upper]
+        parts.append(part)
+
+    if not parts:
+        # Nothing in range: an empty frame with the stored schema
+        return pd.read_parquet(partitions[0][1], columns=columns).iloc[:0]
+    frame = pd.concat(parts, ignore_index=True)
+    return frame.sort_values(date_column, ascending=ascending, kind='stable', ignore_index=True)
+
+
+def date_order(dates):
+    """'ascending' or 'descending' if ``dates`` is sorted, else None."""
+    if dates.is_monotonic_increasing:
+        return 'ascending'
+    if dates.is_monotonic_decreasing:
+        return 'descending'
+    return None
+
+
+def date_slice(dates, start, end, order):
+    """Row positions with ``start <= date <= end`` (whole days) on sorted ``dates``.
+
+    Returns None when ``order`` is None, i.e. the rows aren't in date
+    order and need a full scan.
+    """
+    if order is None:
+        return None
+    values = dates.to_numpy()
+    lower = np.datetime64(pd.Timestamp(start).normalize(), 'ns').astype(values.dtype)
+    upper = np.datetime64(pd.Timestamp(end).normalize() + pd.Timedelta(days=1), 'ns').astype(values.dtype)
+    if order == 'ascending':
+        return slice(np.searchsorted(values, lower, 'left'), np.searchsorted(values, upper, 'left'))
+    # Descending: search the reversed view and map back
+    reversed_values = values[::-1]
+    first = np.searchsorted(reversed_values, lower, 'left')
+    stop = np.searchsorted(reversed_values, upper, 'left')
+    return slice(len(values) - stop, len(values) - first)
@@ -0,0 +1,225 @@
+"""Opt-in sampling profiler for page reruns.
+
+Turned on per request with the ``?profile=1`` query parameter, or for
+every rerun with the ``HIRING_PROFILE=1`` environment variable. While a
+rerun is profiled, a daemon thread samples the script thread's stack
+every few milliseconds. When the rerun ends the samples are summarized
+(self and total time per function, plus collapsed stacks for flame graph
+tools) and written as JSON to ``HIRING_PROFILE_DIR``, where the Profiles
+page lists them. A rerun that never reaches its end hook (``st.stop()``,
+an exception, a rerun request) is noticed by the sampler when the page's
+frame leaves the stack, and saved from there. When profiling is off, a
+rerun pays one environment lookup and one query-parameter lookup.
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+import streamlit as st
+
+DEFAULT_PROFILE_DIR = os.path.join(tempfile.gettempdir(), 'hiring-profiles')
+
+# Seconds between samples
+SAMPLE_INTERVAL = 0.005
+
+# A rerun that never reaches its end hook stops being sampled after this
+MAX_DURATION = 120
+
+# Profiles kept on disk, newest first
+MAX_PROFILES = 50
+
+# Functions and stacks kept per profile
+TOP_FUNCTIONS = 100
+TOP_STACKS = 1000
+
+_active = threading.local()
+
+
+def profile_dir():
+    return os.environ.get('HIRING_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+
+
+def enabled():
+    if os.environ.get('HIRING_PROFILE') == '1':
+        return True
+    try:
+        return st.query_params.get('profile') == '1'
+    except Exception:
+        # No script run context, e.g. called from a worker thread
+        return False
+
+
+class Sampler:
+    """Samples one thread's Python stack on a background thread.
+
+    With a ``script_frame``, sampling ends on its own once that frame has
+    left the stack, and ``on_exit(sampler)`` is called from the sampling
+    thread.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL, max_duration=MAX_DURATION,
+                 script_frame=None, on_exit=None):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_duration = max_duration
+        self.script_frame = script_frame
+        self.on_exit = on_exit
+        self.stacks = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._claim_lock = threading.Lock()
+        self._claimed = False
+        self._thread = threading.Thread(target=self._run, name='hiring-profiler', daemon=True)
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        if not self._claimed:
+            self.duration = time.perf_counter() - self.started
+        return self
+
+    def claim(self):
+        """True for the first caller only, which saves the profile."""
+        with self._claim_lock:
+            claimed, self._claimed = self._claimed, True
+        return not claimed
+
+    def _run(self):
+        deadline = self.started + self.max_duration
+        exited = False
+        while not self._stopped.wait(self.interval) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            in_script = self.script_frame is None
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                in_script = in_script or frame is self.script_frame
+                frame = frame.f_back
+            if not stack or not in_script:
+                # Noticed within one interval of the rerun ending
+                exited = self.script_frame is not None
+                self.duration = time.perf_counter() - self.started
+                break
+            # Outermost first, as collapsed-stack tools expect
+            self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+        # Don't keep the page's frame, and everything it refers to, alive
+        self.script_frame = None
+        if exited and self.on_exit is not None:
+            self.on_exit(self)
+
+
+def _label(frame):
+    filename, line, name = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def summarize(sampler, page):
+    """JSON-ready profile: per-function self/total samples and collapsed stacks."""
+    own, total = Counter(), Counter()
+    for stack, count in sampler.stacks.items():
+        if not stack:
+            continue
+        own[stack[-1]] += count
+        # A recursive function still counts once per sample
+        for frame in set(stack):
+            total[frame] += count
+    functions = [
+        {
+            'function': frame[2],
+            'file': frame[0],
+            'line': frame[1],
+            'self': own[frame],
+            'total': count
+        }
+        for frame, count in total.most_common()
+    ]
+    functions.sort(key=lambda entry: (entry['self'], entry['total']), reverse=True)
+    return {
+        'page': page,
+        'started': datetime.now().isoformat(timespec='seconds'),
+        'duration': sampler.duration,
+        'interval': sampler.interval,
+        'samples': sampler.samples,
+        'functions': functions[:TOP_FUNCTIONS],
+        'stacks': {
+            ';'.join(_label(frame) for frame in stack): count
+            for stack, count in sampler.stacks.most_common(TOP_STACKS)
+        }
+    }
+
+
+def write_profile(profile):
+    directory = profile_dir()
+    os.makedirs(directory, exist_ok=True)
+    name = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{profile['page']}.json"
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        json.dump(profile, f)
+    # Drop the oldest profiles beyond the limit
+    for old in list_profiles()[MAX_PROFILES:]:
+        os.remove(old)
+    return path
+
+
+def list_profiles():
+    """Paths of saved profiles, newest first."""
+    directory = profile_dir()
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.json')),
+        reverse=True
+    )
+
+
+def load_profile(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save(sampler, page):
+    # Whichever of stop() and the sampler's exit check gets here first writes it
+    if not sampler.claim():
+        return None
+    return write_profile(summarize(sampler, page))
+
+
+def start(page):
+    """Start sampling this rerun if profiling is enabled."""
+    previous = getattr(_active, 'sampler', None)
+    if previous is not None:
+        # The last rerun on this thread ended before reaching stop(), and
+        # before the sampler noticed; unless it did after all, save it here
+        _save(previous.stop(), _active.page)
+    if not enabled():
+        _active.sampler = None
+        return
+    # The page script's frame: the innermost module-level frame calling us
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_name != '<module>':
+        frame = frame.f_back
+    _active.page = page
+    _active.sampler = Sampler(
+        threading.get_ident(), script_frame=frame, on_exit=lambda sampler: _save(sampler, page)
+    ).start()
+
+
+def stop():
+    """Stop sampling this rerun and save the profile; returns its path or None."""
+    sampler = getattr(_active, 'sampler', None)
+    if sampler is None:
+        return None
+    _active.sampler = None
+    return _save(sampler.stop(), _active.page)
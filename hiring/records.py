@@ -0,0 +1,208 @@
+"""Compact record types for candidate profiles.
+
+Profiles used to be nested dicts of dicts and lists, and each of those
+carries a per-object hash table. These classes use ``__slots__`` instead.
+Skill scores are ``uint8`` NumPy arrays next to a tuple of interned skill
+names. ``to_columns`` / ``from_columns`` convert whole batches to and from
+flat frames (one per entity) for the columnar store.
+"""
+import sys
+
+from hiring.charts import np, pd
+
+# Strings up to this length (names, labels, categories) are interned
+MAX_INTERNED_LENGTH = 64
+
+
+class Record:
+    """Base for slotted records: positional/keyword init, equality, repr."""
+
+    __slots__ = ()
+
+    def __init__(self, *values, **named):
+        fields = dict(zip(self.__slots__, values), **named)
+        missing = [field for field in self.__slots__ if field not in fields]
+        if missing or len(fields) != len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} expects fields {self.__slots__}, missing {missing}")
+        for field, value in fields.items():
+            setattr(self, field, value)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(_equal(getattr(self, field), getattr(other, field)) for field in self.__slots__)
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self):
+        return {field: _plain(getattr(self, field)) for field in self.__slots__}
+
+    # Pickle as a bare tuple of values, and re-intern short strings on load
+    # so records coming out of st.cache_data share them again
+    def __getstate__(self):
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            if type(value) is str and len(value) <= MAX_INTERNED_LENGTH:
+                value = sys.intern(value)
+            elif type(value) is tuple and value and type(value[0]) is str:
+                value = tuple(sys.intern(item) if len(item) <= MAX_INTERNED_LENGTH else item for item in value)
+            setattr(self, field, value)
+
+
+def _equal(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def _plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Education(Record):
+    __slots__ = ('degree', 'institution', 'year', 'gpa')
+
+
+class Experience(Record):
+    __slots__ = ('title', 'company', 'duration', 'description')
+
+
+class SkillSet(Record):
+    """Skill names with 0-100 scores, read like a dict."""
+
+    __slots__ = ('names', 'scores')
+
+    @classmethod
+    def from_dict(cls, skills):
+        names = tuple(sys.intern(name) for name in skills)
+        return cls(names, np.fromiter(skills.values(), dtype=np.uint8, count=len(skills)))
+
+    def keys(self):
+        return self.names
+
+    def values(self):
+        return self.scores.tolist()
+
+    def items(self):
+        return zip(self.names, self.scores.tolist())
+
+    def __len__(self):
+        return len(self.names)
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+class Skills(Record):
+    __slots__ = ('technical', 'soft')
+
+
+class AIEvaluation(Record):
+    __slots__ = ('overall_score', 'technical_score', 'experience_score', 'education_score',
+                 'cultural_fit', 'bias_risk', 'flags', 'recommendations')
+
+
+class Candidate(Record):
+    __slots__ = ('id', 'name', 'email', 'phone', 'location', 'position', 'department',
+                 'status', 'application_date', 'education', 'experience', 'skills', 'ai_evaluation')
+
+    PERSONAL_FIELDS = ('name', 'email', 'phone', 'location', 'position', 'department',
+                       'status', 'application_date')
+
+    @classmethod
+    def from_profile(cls, candidate_id, profile):
+        """Build from the nested profile dict shape used by the mock loaders."""
+        evaluation = profile['ai_evaluation']
+        return cls(
+            candidate_id,
+            *(sys.intern(profile['personal'][field]) for field in cls.PERSONAL_FIELDS),
+            education=tuple(Education(**entry) for entry in profile['education']),
+            experience=tuple(Experience(**entry) for entry in profile['experience']),
+            skills=Skills(*(SkillSet.from_dict(profile['skills'][kind]) for kind in Skills.__slots__)),
+            ai_evaluation=AIEvaluation(**{
+                **evaluation,
+                'bias_risk': sys.intern(evaluation['bias_risk']),
+                'flags': tuple(evaluation['flags']),
+                'recommendations': tuple(evaluation['recommendations'])
+            })
+        )
+
+    def to_profile(self):
+        """Inverse of ``from_profile``."""
+        profile = self.to_dict()
+        return {
+            'personal': {field: profile[field] for field in self.PERSONAL_FIELDS},
+            'education': profile['education'],
+            'experience': profile['experience'],
+            'skills': profile['skills'],
+            'ai_evaluation': profile['ai_evaluation']
+        }
+
+
+class ReviewItem(Record):
+    """A candidate waiting in the human oversight queue."""
+
+    __slots__ = ('id', 'name', 'position', 'department', 'ai_score', 'bias_risk', 'flags', 'last_modified')
+
+
+def to_columns(candidates):
+    """Flatten candidates into one frame per entity, keyed by ``candidate_id``."""
+    personal = {field: [] for field in ('id',) + Candidate.PERSONAL_FIELDS + AIEvaluation.__slots__}
+    education, experience, skills = [], [], []
+    for candidate in candidates:
+        for field in ('id',) + Candidate.PERSONAL_FIELDS:
+            personal[field].append(getattr(candidate, field))
+        for field in AIEvaluation.__slots__:
+            personal[field].append(getattr(candidate.ai_evaluation, field))
+        education += [(candidate.id, *(getattr(entry, f) for f in Education.__slots__)) for entry in candidate.education]
+        experience += [(candidate.id, *(getattr(entry, f) for f in Experience.__slots__)) for entry in candidate.experience]
+        for kind in Skills.__slots__:
+            skill_set = getattr(candidate.skills, kind)
+            skills += [(candidate.id, kind, name, score) for name, score in skill_set.items()]
+    return {
+        'candidates': pd.DataFrame(personal),
+        'education': pd.DataFrame(education, columns=['candidate_id', *Education.__slots__]),
+        'experience': pd.DataFrame(experience, columns=['candidate_id', *Experience.__slots__]),
+        'skills': pd.DataFrame(skills, columns=['candidate_id', 'kind', 'skill', 'score']).astype({'score': np.uint8}),
+    }
+
+
+def from_columns(tables):
+    """Rebuild candidates from the frames produced by ``to_columns``."""
+    def rows_by_candidate(frame, columns):
+        grouped = {}
+        for row in zip(frame['candidate_id'], *(frame[column] for column in columns)):
+            grouped.setdefault(row[0], []).append(row[1:])
+        return grouped
+
+    education = rows_by_candidate(tables['education'], Education.__slots__)
+    experience = rows_by_candidate(tables['experience'], Experience.__slots__)
+    skills = {}
+    skill_table = tables['skills']
+    for (candidate_id, kind), group in skill_table.groupby(['candidate_id', 'kind'], sort=False):
+        names = tuple(sys.intern(name) for name in group['skill'])
+        skills.setdefault(candidate_id, {})[kind] = SkillSet(names, group['score'].to_numpy(dtype=np.uint8))
+
+    empty = SkillSet((), np.empty(0, dtype=np.uint8))
+    candidates = []
+    frame = tables['candidates']
+    for row in frame.itertuples(index=False):
+        values = row._asdict()
+        candidate_skills = skills.get(row.id, {})
+        candidates.append(Candidate(
+            values['id'],
+            *(values[field] for field in Candidate.PERSONAL_FIELDS),
+            education=tuple(Education(*entry) for entry in education.get(row.id, ())),
+            experience=tuple(Experience(*entry) for entry in experience.get(row.id, ())),
+            skills=Skills(candidate_skills.get('technical', empty), candidate_skills.get('soft', empty)),
+            ai_evaluation=AIEvaluation(**{field: values[field] for field in AIEvaluation.__slots__})
+        ))
+    return candidates
@@ -0,0 +1,211 @@
+"""Blind-review mode: lazily redacted views of candidate data.
+
+Nothing is deep-copied. Records (slotted records, dicts and their
+lists/tuples) are wrapped in read-only proxies that mask identifying
+fields when they are read. Frames get masked columns
+computed once per (view, column) and shared from a small cache. With
+blind mode off, every helper returns its input unchanged.
+"""
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+import streamlit as st
+
+from hiring.charts import np, pd
+from hiring.formatting import styled_view
+from hiring.records import Record
+
+REDACTED_FIELDS = ('name', 'email', 'phone', 'institution', 'location')
+REDACTED = '🔒 Redacted'
+
+MAX_CACHED_VIEWS = 64
+
+# Per-process salt so pseudonyms can't be reversed from a list of names
+_SALT = os.urandom(8)
+
+
+def pseudonym(value):
+    digest = hashlib.sha1(_SALT + str(value).encode()).hexdigest()
+    return f"Candidate {digest[:4].upper()}"
+
+
+def mask_value(field, value):
+    return pseudonym(value) if field == 'name' else REDACTED
+
+
+def blind_mode_enabled():
+    return st.session_state.get('blind_mode', False)
+
+
+def _sync_blind_mode():
+    st.session_state['blind_mode'] = st.session_state['_blind_mode_toggle']
+
+
+def blind_mode_toggle():
+    """Sidebar switch for blind review, shared by every page of the session."""
+    # Widget state is dropped on pages that don't render the widget, so the
+    # setting itself lives under a separate key
+    st.sidebar.toggle(
+        "🙈 Blind Review",
+        value=blind_mode_enabled(),
+        key='_blind_mode_toggle',
+        on_change=_sync_blind_mode,
+        help="Hide names, contact details, institutions and locations"
+    )
+
+
+def _redacted_method(method):
+    # The method runs on the unredacted record, so its result is redacted too
+    @functools.wraps(method)
+    def call(*args, **kwargs):
+        return _redact_value(None, method(*args, **kwargs))
+    return call
+
+
+class RedactedRecord:
+    """Read-only view of a slotted record with identifying fields masked.
+
+    Methods (``to_dict``, ``to_profile``, ``items``...) are wrapped so that
+    what they return is redacted like the fields.
+    """
+
+    __slots__ = ('_record', '_cache')
+
+    def __init__(self, record):
+        self._record = record
+        self._cache = {}
+
+    def __getattr__(self, name):
+        # Special names (pickle, copy) are never forwarded to the record
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        if name not in self._cache:
+            value = getattr(self._record, name)
+            self._cache[name] = _redacted_method(value) if callable(value) else _redact_value(name, value)
+        return self._cache[name]
+
+
+class RedactedMapping(Mapping):
+    """Read-only view of a nested dict with identifying fields masked."""
+
+    __slots__ = ('_data', '_cache')
+
+    def __init__(self, data):
+        self._data = data
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            self._cache[key] = _redact_value(key, self._data[key])
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class RedactedList(Sequence):
+    """Read-only view of a list or tuple whose items are redacted on access."""
+
+    __slots__ = ('_data', '_cache')
+
+    def __init__(self, data):
+        self._data = data
+        self._cache = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        if index not in self._cache:
+            self._cache[index] = _redact_value(None, self._data[index])
+        return self._cache[index]
+
+    def __len__(self):
+        return len(self._data)
+
+    # Concatenation gives a plain list of the redacted items
+    def __add__(self, other):
+        if not isinstance(other, (list, tuple, RedactedList)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(other) + list(self)
+
+
+def _redact_value(key, value):
+    if key in REDACTED_FIELDS and isinstance(value, str):
+        return mask_value(key, value)
+    if isinstance(value, Record):
+        return RedactedRecord(value)
+    if isinstance(value, dict):
+        return RedactedMapping(value)
+    if isinstance(value, (list, tuple)):
+        return RedactedList(value)
+    return value
+
+
+def redact(record):
+    """``record`` as seen by the current session."""
+    if not blind_mode_enabled():
+        return record
+    return _redact_value(None, record)
+
+
+class _MaskedColumns:
+    def __init__(self, max_views=MAX_CACHED_VIEWS):
+        self.max_views = max_views
+        self._views = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, view_key, column, values):
+        key = (view_key, column)
+        with self._lock:
+            if key in self._views:
+                self._views.move_to_end(key)
+                return self._views[key]
+        masked = _mask_column(column, values)
+        with self._lock:
+            self._views[key] = masked
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+        return masked
+
+
+def _mask_column(column, values):
+    if column != 'name':
+        return np.full(len(values), REDACTED, dtype=object)
+    # Hash each distinct name once, then broadcast
+    codes, uniques = pd.factorize(values)
+    lookup = np.array([pseudonym(value) for value in uniques] + [REDACTED], dtype=object)
+    return lookup[codes]
+
+
+@st.cache_resource
+def _get_masked_columns():
+    return _MaskedColumns()
+
+
+def redact_frame(frame, view_key):
+    """``frame`` with identifying columns masked if blind mode is on.
+
+    ``view_key`` must change whenever the rows of ``frame`` do (e.g. the
+    data version plus the filter selection); masked columns are cached
+    under it and shared between sessions.
+    """
+    if not blind_mode_enabled():
+        return frame
+    columns = [column for column in REDACTED_FIELDS if column in frame.columns]
+    if not columns:
+        return frame
+    cache = _get_masked_columns()
+    return styled_view(frame, {column: cache.get(view_key, column, frame[column]) for column in columns})
@@ -0,0 +1,112 @@
+"""Per-reviewer workload and AI-human agreement statistics.
+
+``ReviewerStats`` keeps running sums per reviewer (counts, score sums,
+squares and cross products, and a 2x2 approve/not-approve table of AI
+recommendation against the human decision). A new chunk of the decision
+log is folded in with one ``bincount`` per statistic, and the summary
+(throughput, mean adjustment, Pearson correlation, Cohen's kappa) is
+derived from the sums, so neither step rescans earlier decisions.
+"""
+import threading
+
+from hiring.charts import np, pd
+
+# AI scores at or above this count as an "approve" recommendation
+AI_APPROVAL_THRESHOLD = 85
+
+# Running sums per reviewer, one column each
+SUM_COLUMNS = (
+    'decisions', 'adjustment', 'ai', 'human', 'ai_sq', 'human_sq', 'ai_human',
+    'both_approve', 'ai_only_approve', 'human_only_approve', 'neither_approve'
+)
+
+
+class ReviewerStats:
+    """Incrementally maintained per-reviewer statistics."""
+
+    def __init__(self, approval_threshold=AI_APPROVAL_THRESHOLD):
+        self.approval_threshold = approval_threshold
+        self._lock = threading.Lock()
+        self._reviewers = pd.Index([], dtype=object)
+        self._sums = np.zeros((0, len(SUM_COLUMNS)))
+        self._first = np.array([], dtype='datetime64[ns]')
+        self._last = np.array([], dtype='datetime64[ns]')
+        self.version = 0
+
+    def update(self, decisions):
+        """Fold in decisions with reviewer, ai_score, human_score, final_decision and date."""
+        if len(decisions) == 0:
+            return
+        codes, names = pd.factorize(decisions['reviewer'])
+        # Decisions with no reviewer (code -1) can't be attributed to anyone
+        attributed = codes >= 0
+        if not attributed.all():
+            decisions, codes = decisions[attributed], codes[attributed]
+            if len(codes) == 0:
+                return
+        ai = decisions['ai_score'].to_numpy(dtype=float)
+        human = decisions['human_score'].to_numpy(dtype=float)
+        ai_approves = ai >= self.approval_threshold
+        human_approves = (decisions['final_decision'] == 'Approved').to_numpy()
+        dates = pd.to_datetime(decisions['date']).to_numpy(dtype='datetime64[ns]')
+
+        columns = (
+            None, human - ai, ai, human, ai * ai, human * human, ai * human,
+            ai_approves & human_approves, ai_approves & ~human_approves,
+            ~ai_approves & human_approves, ~ai_approves & ~human_approves
+        )
+        chunk = np.column_stack([
+            np.bincount(codes, weights=weights, minlength=len(names))
+            for weights in columns
+        ])
+        # Dates as int64 so reduceat gives per-reviewer min and max in one pass
+        order = np.argsort(codes, kind='stable')
+        starts = np.searchsorted(codes[order], np.arange(len(names)))
+        date_values = dates.view('int64')[order]
+        first = np.minimum.reduceat(date_values, starts).view('datetime64[ns]')
+        last = np.maximum.reduceat(date_values, starts).view('datetime64[ns]')
+
+        with self._lock:
+            positions = self._reviewers.get_indexer(names)
+            new = positions < 0
+            if new.any():
+                positions[new] = np.arange(len(self._reviewers), len(self._reviewers) + new.sum())
+                self._reviewers = self._reviewers.append(pd.Index(names[new], dtype=object))
+                self._sums = np.vstack([self._sums, np.zeros((new.sum(), len(SUM_COLUMNS)))])
+                self._first = np.concatenate([self._first, first[new]])
+                self._last = np.concatenate([self._last, last[new]])
+            self._sums[positions] += chunk
+            self._first[positions] = np.minimum(self._first[positions], first)
+            self._last[positions] = np.maximum(self._last[positions], last)
+            self.version += 1
+
+    def summary(self):
+        """One row per reviewer, busiest first."""
+        with self._lock:
+            reviewers, sums = self._reviewers, self._sums.copy()
+            first, last = self._first.copy(), self._last.copy()
+        s = dict(zip(SUM_COLUMNS, sums.T))
+        n = s['decisions']
+        active_days = (last - first).astype('timedelta64[D]').astype(float) + 1
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = n * s['ai_human'] - s['ai'] * s['human']
+            spread = np.sqrt((n * s['ai_sq'] - s['ai'] ** 2) * (n * s['human_sq'] - s['human'] ** 2))
+            correlation = np.where(spread > 0, covariance / spread, np.nan)
+
+            agreement = (s['both_approve'] + s['neither_approve']) / n
+            ai_rate = (s['both_approve'] + s['ai_only_approve']) / n
+            human_rate = (s['both_approve'] + s['human_only_approve']) / n
+            chance = ai_rate * human_rate + (1 - ai_rate) * (1 - human_rate)
+            kappa = np.where(chance < 1, (agreement - chance) / (1 - chance), np.nan)
+
+        summary = pd.DataFrame({
+            'reviewer': reviewers,
+            'decisions': n.astype(np.int64),
+            'decisions_per_day': n / active_days,
+            'mean_adjustment': s['adjustment'] / n,
+            'ai_human_correlation': correlation,
+            'agreement': agreement,
+            'cohens_kappa': kappa
+        })
+        return summary.sort_values('decisions', ascending=False, kind='stable', ignore_index=True)
@@ -0,0 +1,35 @@
+"""Vectorized batch scoring of candidates.
+
+The score is the weighted sum of the four decision factors shown on the
+explanation page, plus an education prior per institution learned from
+historical hires. That prior is a known proxy for background, which is
+what the counterfactual tests are there to surface.
+"""
+from hiring.charts import np
+
+FACTOR_WEIGHTS = {
+    'technical_score': 0.35,
+    'experience_score': 0.30,
+    'education_score': 0.20,
+    'cultural_fit': 0.15,
+}
+
+# Points added to the education factor per institution
+INSTITUTION_ADJUSTMENT = {
+    'Stanford University': 4.0,
+    'MIT': 4.0,
+    'State University': 0.0,
+    'Community College': -2.0,
+    'Online Program': -3.0,
+}
+
+
+def score_batch(frame):
+    """AI score (0-100) for every row of ``frame``."""
+    scores = np.zeros(len(frame))
+    for column, weight in FACTOR_WEIGHTS.items():
+        scores += weight * frame[column].to_numpy(dtype=float)
+    if 'institution' in frame:
+        adjustment = frame['institution'].map(INSTITUTION_ADJUSTMENT).fillna(0.0).to_numpy(dtype=float)
+        scores += FACTOR_WEIGHTS['education_score'] * adjustment
+    return np.clip(scores, 0, 100).round(1)
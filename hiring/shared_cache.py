@@ -0,0 +1,222 @@
+"""Cache shared by every Streamlit worker process on one host.
+
+``@st.cache_data`` is per process, so each worker behind a load balancer
+used to rebuild every dataset. ``shared_cache`` adds a host-level layer:
+
+* objects are pickled into a SQLite database (WAL mode, so readers don't
+  block each other);
+* DataFrames keep their numeric and datetime columns as ``.npy`` files
+  that readers memory-map, so the OS page cache holds one copy for all
+  workers; other columns are pickled alongside the metadata.
+
+The first worker to miss takes a per-key file lock and computes the
+value; the others wait on the lock and then read what it stored.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import sqlite3
+import stat
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from hiring.charts import np, pd, timed_import
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to every worker computing its own
+    fcntl = None
+
+# Per-user, so no other account can plant entries that we then unpickle
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'hiring-platform'
+)
+
+_MISSING = object()
+
+
+def _private_directory(path):
+    """Create ``path`` readable only by us, or check an existing one is.
+
+    Entries are unpickled, so a directory another user can write to would
+    let them run code in every worker. Raises ``PermissionError`` then.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):  # Windows: no POSIX ownership to check
+        return
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(
+            f"Shared cache directory {path} must be a directory owned by this user with mode 0700"
+        )
+
+
+class SharedCache:
+    """SQLite + memory-mapped array store under one directory."""
+
+    def __init__(self, root):
+        self.root = root
+        _private_directory(root)
+        os.makedirs(os.path.join(root, 'arrays'), mode=0o700, exist_ok=True)
+        os.makedirs(os.path.join(root, 'locks'), mode=0o700, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, kind TEXT NOT NULL, payload BLOB NOT NULL, created REAL NOT NULL)"
+            )
+
+    def _connection(self):
+        # sqlite3 connections can't be shared between threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(os.path.join(self.root, 'objects.sqlite'), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key, ttl=None):
+        row = self._connection().execute(
+            "SELECT kind, payload, created FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        kind, payload, created = row
+        if ttl is not None and time.time() - created > ttl:
+            return _MISSING
+        # Unpickling imports pandas directly; go through timed_import so it
+        # can't race the warm-up thread's import of the same module
+        timed_import('pandas')
+        try:
+            if kind == 'frame':
+                return self._load_frame(pickle.loads(payload))
+            return pickle.loads(payload)
+        except (OSError, pickle.UnpicklingError):
+            # Arrays removed underneath us; treat as a miss and rebuild
+            return _MISSING
+
+    def put(self, key, value):
+        if isinstance(value, pd.DataFrame):
+            kind, payload = 'frame', pickle.dumps(self._store_frame(value), protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            kind, payload = 'object', pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        connection = self._connection()
+        previous = connection.execute("SELECT kind, payload FROM entries WHERE key = ?", (key,)).fetchone()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, kind, payload, created) VALUES (?, ?, ?, ?)",
+                (key, kind, payload, time.time())
+            )
+        if previous is not None and previous[0] == 'frame':
+            # Readers that already mapped the old files keep them until they unmap
+            shutil.rmtree(os.path.join(self.root, 'arrays', pickle.loads(previous[1])['directory']), ignore_errors=True)
+
+    def get_or_compute(self, key, compute, ttl=None):
+        value = self.get(key, ttl)
+        if value is not _MISSING:
+            return value
+        with self._key_lock(key):
+            # Another worker may have filled it while we waited for the lock
+            value = self.get(key, ttl)
+            if value is _MISSING:
+                self.put(key, compute())
+                value = self.get(key)
+        return value
+
+    def clear(self):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM entries")
+        shutil.rmtree(os.path.join(self.root, 'arrays'), ignore_errors=True)
+        os.makedirs(os.path.join(self.root, 'arrays'), mode=0o700, exist_ok=True)
+
+    @contextmanager
+    def _key_lock(self, key):
+        if fcntl is None:
+            yield
+            return
+        name = hashlib.sha1(key.encode()).hexdigest()
+        with open(os.path.join(self.root, 'locks', f'{name}.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _store_frame(self, frame):
+        directory = uuid.uuid4().hex
+        staging = os.path.join(self.root, 'arrays', f'.{directory}')
+        os.makedirs(staging)
+        arrays, objects = [], {}
+        for position, name in enumerate(frame.columns):
+            values = frame[name].to_numpy()
+            if values.dtype.kind in 'biufcmM':
+                np.save(os.path.join(staging, f'{position}.npy'), values, allow_pickle=False)
+                arrays.append(position)
+            else:
+                objects[position] = frame[name]
+        # Rename last so readers never see a half-written directory
+        os.rename(staging, os.path.join(self.root, 'arrays', directory))
+        return {
+            'directory': directory,
+            'columns': list(frame.columns),
+            'index': frame.index,
+            'arrays': arrays,
+            'objects': objects
+        }
+
+    def _load_frame(self, meta):
+        directory = os.path.join(self.root, 'arrays', meta['directory'])
+        data = {}
+        for position, name in enumerate(meta['columns']):
+            if position in meta['objects']:
+                # The pickled column keeps its dtype (categorical, string, ...)
+                data[name] = meta['objects'][position].array
+            else:
+                data[name] = np.load(os.path.join(directory, f'{position}.npy'), mmap_mode='r')
+        return pd.DataFrame(data, index=meta['index'], copy=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_cache(root=None):
+    return SharedCache(root or os.environ.get('HIRING_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+def shared_cache(name, ttl=None, memoize=False):
+    """Decorator caching ``func``'s results across worker processes.
+
+    The key covers ``name``, the function's source (so code changes
+    invalidate) and the call arguments. With ``memoize=True`` the loaded
+    value is also kept and returned as-is within the process, for loaders
+    not already wrapped in ``st.cache_data``; callers must then treat it
+    as read-only (memory-mapped columns are).
+    """
+    def decorator(func):
+        try:
+            source = inspect.getsource(func).encode()
+        except OSError:
+            source = func.__code__.co_code
+        code_version = hashlib.sha1(source).hexdigest()[:12]
+        memo = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = hashlib.sha1(pickle.dumps((args, sorted(kwargs.items())))).hexdigest()[:16]
+            key = f'{name}:{code_version}:{arguments}'
+            if memoize and key in memo:
+                loaded, value = memo[key]
+                if ttl is None or time.time() - loaded <= ttl:
+                    return value
+            value = get_shared_cache().get_or_compute(key, lambda: func(*args, **kwargs), ttl)
+            if memoize:
+                memo[key] = (time.time(), value)
+            return value
+
+        wrapper.clear_memo = memo.clear
+        return wrapper
+    return decorator
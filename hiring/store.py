@@ -0,0 +1,239 @@
+"""Candidate store shared by every session on this server process.
+
+Decisions are applied in batches. Each batch builds the new candidate
+frame, its audit entries and the updated status counts first, then swaps
+all three in under one lock, so readers see either the whole batch or
+none of it.
+
+From a partitioned dataset only the most recent ``HIRING_HISTORY_DAYS``
+are loaded at startup, so startup time and memory follow that window
+rather than the whole history. Older months are read from their
+partitions the first time a page asks for them (``ensure_history``).
+"""
+import os
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+import streamlit as st
+
+from hiring import partitions
+from hiring.charts import np, pd
+from hiring.data import generate_mock_data
+from hiring.fairness import FINAL_DECISIONS, get_fairness_monitor
+from hiring.versions import DataVersions, fingerprint, get_data_versions
+
+# Days of history loaded at startup, counted back from the newest partition
+DEFAULT_HISTORY_DAYS = 365
+
+AUDIT_COLUMNS = ['timestamp', 'id', 'previous_status', 'new_status', 'reviewer', 'batch']
+
+Snapshot = namedtuple('Snapshot', ['candidates', 'version'])
+BatchResult = namedtuple('BatchResult', ['batch', 'changed', 'version'])
+
+
+def _concat(parts):
+    # pd.concat turns categoricals with different categories into object
+    frame = pd.concat(parts, ignore_index=True)
+    for name in frame.columns:
+        if isinstance(parts[0][name].dtype, pd.CategoricalDtype) and \
+                not isinstance(frame[name].dtype, pd.CategoricalDtype):
+            frame[name] = pd.api.types.union_categoricals([part[name] for part in parts])
+    return frame
+
+
+class CandidateStore:
+    """Candidate frame, decision audit log and status counts, versioned together.
+
+    The candidate frame is replaced, never modified in place, so a
+    snapshot stays valid for as long as a page run holds on to it. The
+    version is the ``candidates`` token in ``versions`` and is bumped by
+    every committed batch. ``rows_version`` only changes when rows are
+    added, for caches that don't read statuses; it is derived from, but
+    never equal to, a ``candidates`` token, so figures keyed on it outlive
+    decision batches.
+    """
+
+    def __init__(self, candidates, versions=None, data_dir=None, loaded_from=None):
+        self._lock = threading.Lock()
+        self._candidates = candidates
+        self._audit_chunks = []
+        self._audit_frame = None
+        self._status_counts = candidates['status'].value_counts().to_dict()
+        # Decisions only change statuses, so row order by date is fixed
+        self.date_order = partitions.date_order(candidates['application_date'])
+        self._batches = 0
+        self._listeners = []
+        self._history_listeners = []
+        self._versions = versions or DataVersions()
+        self.version = self._versions.get('candidates')
+        self.rows_version = f"{self.version}:rows"
+        # Partitioned dataset the rows came from, and the first day held;
+        # None when every row is already in memory
+        self._data_dir = data_dir
+        self.loaded_from = loaded_from
+
+    def subscribe(self, listener=None, on_history=None):
+        """Call ``listener(audit, candidates)`` after every committed batch, and
+        ``on_history(added, candidates)`` after older rows are loaded.
+
+        Returns the snapshot that the listeners' first calls follow on from.
+        """
+        with self._lock:
+            if listener is not None:
+                self._listeners.append(listener)
+            if on_history is not None:
+                self._history_listeners.append(on_history)
+            return Snapshot(self._candidates, self.version)
+
+    def snapshot(self):
+        with self._lock:
+            return Snapshot(self._candidates, self.version)
+
+    def rows_snapshot(self):
+        """Snapshot versioned by ``rows_version``, for results that don't depend on statuses."""
+        with self._lock:
+            return Snapshot(self._candidates, self.rows_version)
+
+    @property
+    def status_counts(self):
+        with self._lock:
+            return dict(self._status_counts)
+
+    def apply_decisions(self, ids, status, reviewer):
+        """Set ``status`` on every candidate in ``ids`` as one batch.
+
+        Raises ``KeyError`` without changing anything if any id is unknown.
+        If every candidate already has ``status``, nothing is committed: the
+        result has no batch number and the current version.
+        """
+        ids = np.unique(np.asarray(ids))
+        with self._lock:
+            candidates = self._candidates
+            positions = np.flatnonzero(candidates['id'].isin(ids).to_numpy())
+            if len(positions) != len(ids):
+                missing = np.setdiff1d(ids, candidates['id'].to_numpy())
+                raise KeyError(f"Unknown candidate ids: {missing[:10].tolist()}")
+
+            column = candidates['status']
+            previous = column.iloc[positions].to_numpy(dtype=object)
+            changed = previous != status
+            if not changed.any():
+                return BatchResult(None, 0, self.version)
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Stays categorical: only the integer codes are copied
+                categories = column.cat.categories
+                if status not in categories:
+                    categories = categories.append(pd.Index([status]))
+                codes = column.cat.codes.to_numpy(copy=True)
+                codes[positions] = categories.get_loc(status)
+                statuses = pd.Categorical.from_codes(codes, categories=categories)
+            else:
+                statuses = column.to_numpy(dtype=object, copy=True)
+                statuses[positions] = status
+
+            batch = self._batches + 1
+            audit = pd.DataFrame({
+                'timestamp': pd.Timestamp(datetime.now()),
+                'id': candidates['id'].to_numpy()[positions][changed],
+                'previous_status': previous[changed],
+                'new_status': status,
+                'reviewer': reviewer,
+                'batch': batch
+            }, columns=AUDIT_COLUMNS)
+
+            counts = dict(self._status_counts)
+            for old_status, count in pd.Series(previous[changed]).value_counts().items():
+                counts[old_status] -= count
+            counts[status] = counts.get(status, 0) + int(changed.sum())
+
+            # Everything above only built new objects; publish them together
+            data = {name: candidates[name] for name in candidates.columns}
+            data['status'] = statuses
+            self._candidates = pd.DataFrame(data, index=candidates.index, copy=False)
+            self._audit_chunks.append(audit)
+            self._audit_frame = None
+            self._status_counts = {key: value for key, value in counts.items() if value}
+            self._batches = batch
+            self.version = self._versions.bump('candidates')
+            # Listeners run under the lock so they see batches in commit order
+            for listener in self._listeners:
+                listener(audit, self._candidates)
+            return BatchResult(batch, int(changed.sum()), self.version)
+
+    def ensure_history(self, start):
+        """Hold every candidate who applied on or after ``start``.
+
+        Reads the missing months from the partitioned dataset and adds
+        them as a new version. Returns True if rows were loaded.
+        """
+        start = pd.Timestamp(start).normalize()
+        with self._lock:
+            if self.loaded_from is None or start >= self.loaded_from:
+                return False
+            ascending = self.date_order == 'ascending'
+            added = partitions.read_partitions(
+                self._data_dir, start, self.loaded_from - pd.Timedelta(days=1), ascending=ascending
+            )
+            # Nothing is older than the first partition
+            first_month = partitions.list_partitions(self._data_dir)[0][0].start_time
+            self.loaded_from = start if start > first_month else None
+            if added.empty:
+                return False
+
+            parts = [added, self._candidates] if ascending else [self._candidates, added]
+            candidates = _concat(parts)
+            counts = dict(self._status_counts)
+            for status, count in added['status'].value_counts().items():
+                counts[status] = counts.get(status, 0) + int(count)
+
+            self._candidates = candidates
+            self._status_counts = {key: value for key, value in counts.items() if value}
+            self.date_order = partitions.date_order(candidates['application_date'])
+            self.version = self._versions.bump('candidates')
+            self.rows_version = f"{self.version}:rows"
+            for listener in self._history_listeners:
+                listener(added, candidates)
+            return True
+
+    def audit_log(self):
+        """All audit entries, oldest first."""
+        with self._lock:
+            if self._audit_frame is None:
+                if self._audit_chunks:
+                    self._audit_frame = pd.concat(self._audit_chunks, ignore_index=True)
+                else:
+                    self._audit_frame = pd.DataFrame(columns=AUDIT_COLUMNS)
+            return self._audit_frame
+
+
+@st.cache_resource
+def get_candidate_store():
+    # A partitioned dataset (see hiring.partitions) replaces the mock data when configured
+    data_dir = os.environ.get('HIRING_CANDIDATE_DATA')
+    loaded_from = None
+    if data_dir:
+        # Only the recent window; older months are read on demand
+        history_days = int(os.environ.get('HIRING_HISTORY_DAYS', DEFAULT_HISTORY_DAYS))
+        months = partitions.list_partitions(data_dir)
+        if not months:
+            raise FileNotFoundError(f"No candidate partitions under {data_dir}")
+        start = (months[-1][0].end_time - pd.Timedelta(days=history_days)).normalize()
+        if start > months[0][0].start_time:
+            loaded_from = start
+        candidates = partitions.read_partitions(data_dir, start=loaded_from)
+    else:
+        candidates = generate_mock_data()
+    versions = get_data_versions()
+    versions.set_base('candidates', fingerprint(data_dir) if data_dir else 'mock')
+    monitor = get_fairness_monitor()
+    store = CandidateStore(candidates, versions, data_dir, loaded_from)
+    # Prime the fairness monitor with the decisions already on record, oldest
+    # first. Only the last two windows' worth can affect its state.
+    history = candidates[['id']].assign(new_status=candidates['status'])
+    history = history[history['new_status'].isin(list(FINAL_DECISIONS))]
+    if store.date_order == 'descending':
+        history = history.iloc[::-1]
+    monitor.record_batch(history.tail(2 * monitor.window_size), candidates)
+    store.subscribe(monitor.record_batch)
+    return store
@@ -0,0 +1,114 @@
+"""Multi-resolution time-series store with LTTB downsampling.
+
+Additive counts (e.g. reviews and overrides per hour) are rolled up to
+coarser resolutions once, when the store is built. ``query`` then picks
+the finest rollup that fits the requested window and downsamples with
+Largest-Triangle-Three-Buckets if it still has too many points, so a
+chart never ships more than ``max_points`` to the browser.
+"""
+from hiring.charts import np, pd
+
+# Resolution name -> pandas offset alias, finest first
+RESOLUTIONS = {
+    'hour': 'h',
+    'day': 'D',
+    'week': 'W-MON',
+    'month': 'MS',
+}
+
+MAX_POINTS = 400
+
+
+def lttb(x, y, threshold):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets."""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # First and last points are always kept; the rest go into buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+class TimeSeriesStore:
+    """Additive counts at a base resolution plus precomputed rollups."""
+
+    def __init__(self, counts, base='hour'):
+        if base not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {base}")
+        counts = counts.sort_index()
+        self.base = base
+        self.rollups = {}
+        resolutions = list(RESOLUTIONS)
+        for resolution in resolutions[resolutions.index(base):]:
+            if resolution == base:
+                self.rollups[resolution] = counts
+            else:
+                self.rollups[resolution] = counts.resample(RESOLUTIONS[resolution]).sum()
+
+    @classmethod
+    def from_events(cls, timestamps, base='day'):
+        """Build a store counting events per ``base`` period."""
+        counts = pd.Series(1, index=pd.DatetimeIndex(timestamps)).resample(RESOLUTIONS[base]).sum()
+        return cls(counts.to_frame('count'), base=base)
+
+    @property
+    def start(self):
+        return self.rollups[self.base].index.min()
+
+    @property
+    def end(self):
+        return self.rollups[self.base].index.max()
+
+    def __len__(self):
+        return len(self.rollups[self.base])
+
+    def query(self, value, start=None, end=None, resolution='auto', max_points=MAX_POINTS, name=None):
+        """Return (frame, resolution) for ``value`` between ``start`` and ``end``.
+
+        ``value`` is a column name, or a (numerator, denominator) pair for
+        rates, which are summed before dividing so rollups stay exact. The
+        frame has a ``date`` column and one value column called ``name``.
+        """
+        if resolution == 'auto':
+            resolution = self._pick_resolution(start, end, max_points)
+        frame = self.rollups[resolution].loc[start:end]
+
+        if isinstance(value, tuple):
+            numerator, denominator = value
+            values = frame[numerator] / frame[denominator].where(frame[denominator] > 0)
+        else:
+            values = frame[value]
+        name = name or (value if isinstance(value, str) else value[0])
+        values = values.dropna()
+
+        keep = lttb(values.index.asi8, values.to_numpy(), max_points)
+        result = pd.DataFrame({'date': values.index[keep], name: values.to_numpy()[keep]})
+        return result, resolution
+
+    def _pick_resolution(self, start, end, max_points):
+        # Finest rollup that already fits; LTTB covers whatever is left over
+        for resolution, frame in self.rollups.items():
+            if len(frame.loc[start:end]) <= max_points:
+                return resolution
+        return list(self.rollups)[-1]
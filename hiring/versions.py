@@ -0,0 +1,96 @@
+"""Content versions per data source, for targeted cache invalidation.
+
+Every data source (candidates, explanations, overrides) has a
+version token that changes whenever that source is written. Loaders,
+figures and aggregates take the tokens of the sources they read as part
+of their cache key, so a write only misses the caches that depend on the
+written source; everything else stays warm. Listeners are told the
+superseded token so shared caches can drop its entries right away
+instead of waiting for LRU eviction.
+
+A token is ``source:base:counter``. The base identifies the loaded
+content (a fingerprint of the files it came from, or ``mock``) and the
+counter counts in-process writes since it was loaded.
+"""
+import hashlib
+import os
+import threading
+
+import streamlit as st
+
+from hiring import figures
+
+SOURCES = ('candidates', 'explanations', 'overrides')
+
+
+def fingerprint(root):
+    """Short hash of the names, sizes and modification times of files under ``root``.
+
+    ``root`` may also be a single file.
+    """
+    digest = hashlib.sha1()
+    if os.path.isfile(root):
+        stat = os.stat(root)
+        digest.update(f"{os.path.basename(root)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    for directory, _, files in sorted(os.walk(root)):
+        for name in sorted(files):
+            stat = os.stat(os.path.join(directory, name))
+            digest.update(f"{os.path.relpath(os.path.join(directory, name), root)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:12]
+
+
+class DataVersions:
+    """Thread-safe registry of version tokens per data source."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bases = {source: 'mock' for source in SOURCES}
+        self._counters = {source: 0 for source in SOURCES}
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Call ``listener(source, old_token, new_token)`` after every change."""
+        self._listeners.append(listener)
+
+    def get(self, source):
+        with self._lock:
+            return self._token(source)
+
+    def tokens(self):
+        with self._lock:
+            return {source: self._token(source) for source in self._bases}
+
+    def set_base(self, source, base):
+        """Record which content ``source`` was loaded from."""
+        with self._lock:
+            old = self._token(source)
+            self._bases[source] = base
+            self._counters[source] = 0
+            new = self._token(source)
+        if new != old:
+            self._notify(source, old, new)
+        return new
+
+    def bump(self, source):
+        """Mark ``source`` as written; returns its new token."""
+        with self._lock:
+            old = self._token(source)
+            self._counters[source] += 1
+            new = self._token(source)
+        self._notify(source, old, new)
+        return new
+
+    def _token(self, source):
+        return f"{source}:{self._bases[source]}:{self._counters[source]}"
+
+    def _notify(self, source, old, new):
+        for listener in self._listeners:
+            listener(source, old, new)
+
+
+@st.cache_resource
+def get_data_versions():
+    versions = DataVersions()
+    # Figures built on a superseded version can never be hit again
+    versions.subscribe(lambda source, old, new: figures.get_figure_cache().discard_version(old))
+    return versions
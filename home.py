@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta
+from hiring import charts
+from hiring.fairness import get_notification_feed
 
 # Page configuration
 st.set_page_config(
@@ -9,6 +10,7 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="collapsed"
 )
+charts.begin_page("home")
 
 # Custom CSS
 st.markdown("""
@@ -204,9 +206,25 @@ with tab2:
             </div>
         """, unsafe_allow_html=True)
 
+def time_ago(timestamp):
+    elapsed = datetime.now() - timestamp
+    if elapsed < timedelta(minutes=1):
+        return "just now"
+    if elapsed < timedelta(hours=1):
+        return f"{elapsed.seconds // 60} minutes ago"
+    if elapsed < timedelta(days=1):
+        return f"{elapsed.seconds // 3600} hours ago"
+    return f"{elapsed.days} days ago"
+
 with tab3:
+    # Live fairness alerts from the decision monitor come first
     notifications = [
-        {"type": "⚠️ Warning", "message": "High bias risk detected in recent evaluations", "time": "1 hour ago"},
+        {"type": event['type'], "message": event['message'], "time": time_ago(event['time'])}
+        for event in get_notification_feed().events()
+    ]
+    if not notifications:
+        notifications.append({"type": "✅ Success", "message": "No fairness alerts in recent decisions", "time": "just now"})
+    notifications += [
         {"type": "ℹ️ Info", "message": "System maintenance scheduled for tonight", "time": "2 hours ago"},
         {"type": "✅ Success", "message": "Weekly report generated successfully", "time": "3 hours ago"}
     ]
@@ -234,3 +252,5 @@ with st.sidebar:
 st.markdown("---")
 st.caption("Hiring Platform v2.0 - Powered by Tharazeenuddin")
 st.caption("© 2025 Hiring Platform. All rights reserved.")
+
+charts.report_import_times()
@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
+from hiring import calibration, charts, comparison, dashboard, figures, formatting, memory, redaction
+from hiring.charts import pd
+from hiring.database import get_database
+from hiring.overrides import get_override_store
+from hiring.store import get_candidate_store
 
 # Page configuration
 st.set_page_config(
@@ -10,6 +12,7 @@ st.set_page_config(
     page_icon="📊",
     layout="wide"
 )
+charts.begin_page("dashboard")
 
 # Custom CSS
 st.markdown("""
@@ -28,42 +31,30 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Mock data generation
-@st.cache_data
-def generate_mock_data():
-    positions = ['Data Scientist', 'Software Engineer', 'Product Manager', 'UX Designer',
-                'ML Engineer', 'DevOps Engineer', 'Frontend Developer', 'Backend Developer']
-    departments = ['Engineering', 'Product', 'Design', 'Data']
-    locations = ['New York', 'San Francisco', 'London', 'Singapore', 'Berlin']
-    
-    # Generate dates as datetime objects
-    dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(50)]
-    
-    data = {
-        'id': range(1, 51),
-        'name': [f"Candidate {i}" for i in range(1, 51)],
-        'position': [positions[i % len(positions)] for i in range(50)],
-        'department': [departments[i % len(departments)] for i in range(50)],
-        'location': [locations[i % len(locations)] for i in range(50)],
-        'score': [round(50 + (i % 50), 1) for i in range(50)],
-        'bias_risk': ['Low' if i > 30 else 'Medium' if i > 15 else 'High' for i in range(50)],
-        'status': ['Review' if i < 20 else 'Approved' if i < 35 else 'Rejected' for i in range(50)],
-        'application_date': dates
-    }
-    df = pd.DataFrame(data)
-    # Convert application_date to datetime
-    df['application_date'] = pd.to_datetime(df['application_date'])
-    return df
+# Load data from the shared candidate store
+store = get_candidate_store()
+df, data_version = store.snapshot()
+
+# Start mirroring into the database the other pages query; it loads in the background
+get_database()
+
+# Precomputed default view, if it is current for this data version
+materialized = dashboard.get_dashboard_materializer().latest(data_version)
+
+# Memory held by this rerun; the store snapshot is shared by every session
+memory_accounting = memory.session_memory()
+memory_accounting.track('candidates', df, shared=True)
 
-# Load data
-df = generate_mock_data()
+# Rows per table page when a session is over its memory budget
+TABLE_PAGE_SIZE = 500
 
 # Sidebar filters
+redaction.blind_mode_toggle()
 st.sidebar.title('Filters')
+options = materialized.options if materialized is not None else dashboard.filter_options(df)
 
 # Date range filter with default values
-default_start_date = datetime.now() - timedelta(days=30)
-default_end_date = datetime.now()
+default_start_date, default_end_date = dashboard.default_date_range()
 
 date_range = st.sidebar.date_input(
     "Date Range",
@@ -79,80 +70,106 @@ else:
     start_date = pd.to_datetime(default_start_date)
     end_date = pd.to_datetime(default_end_date)
 
+# Months older than the store holds are read from their partitions the first
+# time a range reaches back to them
+if store.ensure_history(start_date):
+    df, data_version = store.snapshot()
+    memory_accounting.track('candidates', df, shared=True)
+
 # Department filter
 department_filter = st.sidebar.multiselect(
     'Department',
-    options=df['department'].unique(),
-    default=df['department'].unique()
+    options=options['department'],
+    default=options['department']
 )
 
 # Position filter
 position_filter = st.sidebar.multiselect(
     'Position',
-    options=df['position'].unique(),
-    default=df['position'].unique()
+    options=options['position'],
+    default=options['position']
 )
 
-# Location filter
-location_filter = st.sidebar.multiselect(
-    'Location',
-    options=df['location'].unique(),
-    default=df['location'].unique()
-)
+# Location filter (hidden in blind review, where locations are redacted)
+if redaction.blind_mode_enabled():
+    location_filter = options['location']
+else:
+    location_filter = st.sidebar.multiselect(
+        'Location',
+        options=options['location'],
+        default=options['location']
+    )
 
 # Status filter
 status_filter = st.sidebar.multiselect(
     'Status',
-    options=df['status'].unique(),
-    default=df['status'].unique()
+    options=options['status'],
+    default=options['status']
 )
 
+# Figures depend only on the filters and the data, so they are cached on both
+filter_key = {
+    'department': department_filter,
+    'position': position_filter,
+    'location': location_filter,
+    'status': status_filter,
+    'date_range': (start_date.date(), end_date.date())
+}
+
+# The default view is served from the snapshot; anything else is computed live
+snapshot = None
+if materialized is not None and materialized.filter_key == figures.normalize_filters(filter_key):
+    snapshot = materialized
+
 # Apply filters
-mask = (
-    df['department'].isin(department_filter) &
-    df['position'].isin(position_filter) &
-    df['location'].isin(location_filter) &
-    df['status'].isin(status_filter) &
-    (df['application_date'].dt.date >= start_date.date()) &
-    (df['application_date'].dt.date <= end_date.date())
-)
-filtered_df = df[mask]
+filtered_df = snapshot.filtered if snapshot is not None else dashboard.filter_candidates(df, filter_key, store.date_order)
+memory_accounting.track('filtered candidates', filtered_df, shared=filtered_df is df or snapshot is not None)
+
+# Over budget, figures are still served from the shared cache but new ones aren't added
+cache_figures = not memory_accounting.over_budget()
+
+def dashboard_figure(chart_id):
+    if snapshot is not None:
+        return snapshot.figures[chart_id]
+    return figures.cached_figure(
+        chart_id, filter_key, data_version,
+        lambda: dashboard.build_figure(chart_id, filtered_df),
+        store=cache_figures
+    )
 
 # Main content
 st.title('📊 HR Analytics Dashboard')
 
 # KPI metrics
+kpis = snapshot.kpis if snapshot is not None else dashboard.compute_kpis(filtered_df, df)
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.metric(
         "Total Candidates",
-        len(filtered_df),
-        delta=f"{len(filtered_df) - len(df)}"
+        kpis['total'],
+        delta=f"{kpis['total_delta']}"
     )
 
 with col2:
-    approval_rate = round(len(filtered_df[filtered_df['status'] == 'Approved']) / len(filtered_df) * 100, 1) if len(filtered_df) > 0 else 0
     st.metric(
         "Approval Rate",
-        f"{approval_rate}%",
-        delta=f"{round(approval_rate - 50, 1)}%"
+        f"{kpis['approval_rate']}%",
+        delta=f"{round(kpis['approval_rate'] - 50, 1)}%"
     )
 
 with col3:
-    avg_score = round(filtered_df['score'].mean(), 1) if len(filtered_df) > 0 else 0
     st.metric(
         "Average Score",
-        avg_score,
-        delta=f"{round(avg_score - df['score'].mean(), 1)}"
+        kpis['avg_score'],
+        delta=f"{kpis['avg_score_delta']}"
     )
 
 with col4:
-    low_bias = round(len(filtered_df[filtered_df['bias_risk'] == 'Low']) / len(filtered_df) * 100, 1) if len(filtered_df) > 0 else 0
     st.metric(
         "Low Bias Rate",
-        f"{low_bias}%",
-        delta=f"{round(low_bias - 70, 1)}%"
+        f"{kpis['low_bias']}%",
+        delta=f"{round(kpis['low_bias'] - 70, 1)}%"
     )
 
 # Charts
@@ -161,101 +178,164 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("Score Distribution")
     if not filtered_df.empty:
-        fig = px.histogram(
-            filtered_df,
-            x='score',
-            nbins=20,
-            title='Distribution of AI Scores'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(dashboard_figure('score_histogram'), use_container_width=True)
     else:
         st.info("No data available for the selected filters")
 
     st.subheader("Applications by Department")
     if not filtered_df.empty:
-        dept_counts = filtered_df['department'].value_counts()
-        fig = px.pie(
-            names=dept_counts.index,
-            values=dept_counts.values,
-            title='Applications by Department'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(dashboard_figure('department_pie'), use_container_width=True)
     else:
         st.info("No data available for the selected filters")
 
 with col2:
     st.subheader("Status Distribution")
     if not filtered_df.empty:
-        status_counts = filtered_df['status'].value_counts()
-        fig = px.pie(
-            names=status_counts.index,
-            values=status_counts.values,
-            title='Application Status Distribution',
-            color=status_counts.index,
-            color_discrete_map={
-                'Approved': '#4CAF50',
-                'Review': '#FFC107',
-                'Rejected': '#F44336'
-            }
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(dashboard_figure('status_pie'), use_container_width=True)
     else:
         st.info("No data available for the selected filters")
 
     st.subheader("Bias Risk Distribution")
     if not filtered_df.empty:
-        risk_counts = filtered_df['bias_risk'].value_counts()
-        fig = px.bar(
-            x=risk_counts.index,
-            y=risk_counts.values,
-            title='Distribution of Bias Risk Levels',
-            color=risk_counts.index,
-            color_discrete_map={
-                'Low': '#4CAF50',
-                'Medium': '#FFC107',
-                'High': '#F44336'
-            }
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(dashboard_figure('bias_risk_bar'), use_container_width=True)
     else:
         st.info("No data available for the selected filters")
 
+st.subheader("Applications Over Time")
+if not filtered_df.empty:
+    st.plotly_chart(dashboard_figure('applications_trend'), use_container_width=True)
+else:
+    st.info("No data available for the selected filters")
+
 # Candidates table
 st.subheader("Candidates Overview")
 
-if not filtered_df.empty:
-    # Color coding for different statuses and risks
-    def style_dataframe(df):
-        return df.style.apply(
-            lambda x: ['background-color: #E8F5E9' if v == 'Approved'
-                      else 'background-color: #FFEBEE' if v == 'Rejected'
-                      else '' for v in x],
-            subset=['status']
-        ).apply(
-            lambda x: ['color: #4CAF50' if v == 'Low'
-                      else 'color: #FFC107' if v == 'Medium'
-                      else 'color: #F44336' for v in x],
-            subset=['bias_risk']
-        )
-
-    # Display styled dataframe
-    display_df = filtered_df.copy()
-    display_df['application_date'] = display_df['application_date'].dt.strftime('%Y-%m-%d')
-    st.dataframe(
-        style_dataframe(display_df),
+# Bulk decisions change the data every chart and KPI is drawn from, so after
+# applying one the whole page reruns and the next run shows the result
+def apply_bulk_decision(ids, status):
+    result = store.apply_decisions(ids, status, reviewer='Hiring Manager')
+    if result.changed:
+        st.session_state['bulk_result'] = f"{result.changed} of {len(ids)} candidates set to {status} (batch #{result.batch})"
+    else:
+        st.session_state['bulk_result'] = f"All {len(ids)} candidates are already {status}"
+    st.rerun()
+
+# The table and its actions are a fragment: selecting rows, paging and the
+# apply-to-all toggle rerun only this part, not the KPIs and charts above
+@st.fragment
+def candidates_table(filtered_df, table_df, paged):
+    # Over budget, only one page of rows is sent to the browser
+    table_offset = 0
+    if paged and len(table_df) > TABLE_PAGE_SIZE:
+        page_count = -(-len(table_df) // TABLE_PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+        table_offset = (page - 1) * TABLE_PAGE_SIZE
+        table_df = table_df.iloc[table_offset:table_offset + TABLE_PAGE_SIZE]
+        st.caption(f"Showing page {page} of {page_count}: this session is over its memory budget")
+
+    table = st.dataframe(
+        table_df,
+        column_config={
+            'application_date': st.column_config.DateColumn('application_date', format='YYYY-MM-DD'),
+            'calibrated_score': st.column_config.NumberColumn(
+                'calibrated_score',
+                format='%.1f',
+                help="AI score mapped to the scores reviewers in this department settle on"
+            )
+        },
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        key="candidates_table"
     )
+
+    # Bulk actions on the selected rows, or on everything the filters match
+    apply_to_all = st.checkbox(f"Apply to all {len(filtered_df)} filtered candidates")
+    if apply_to_all:
+        selected_ids = filtered_df['id'].to_numpy()
+    else:
+        selected_ids = filtered_df['id'].to_numpy()[[table_offset + row for row in table.selection.rows]]
+    st.caption(f"{len(selected_ids)} candidates selected")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button(
+            "👍 Approve Selected",
+            type="primary",
+            use_container_width=True,
+            disabled=len(selected_ids) == 0
+        ):
+            apply_bulk_decision(selected_ids, 'Approved')
+    with col2:
+        if st.button(
+            "👎 Reject Selected",
+            use_container_width=True,
+            disabled=len(selected_ids) == 0
+        ):
+            apply_bulk_decision(selected_ids, 'Rejected')
+    with col3:
+        if st.button(
+            "📝 Request More Info",
+            use_container_width=True,
+            disabled=len(selected_ids) == 0
+        ):
+            apply_bulk_decision(selected_ids, 'Info Requested')
+
+    # Side-by-side comparison of a few finalists
+    can_compare = comparison.MIN_CANDIDATES <= len(selected_ids) <= comparison.MAX_CANDIDATES
+    if st.button(
+        "⚖️ Compare Selected",
+        disabled=not can_compare,
+        help=f"Select {comparison.MIN_CANDIDATES} to {comparison.MAX_CANDIDATES} candidates to compare"
+    ):
+        compare_ids = ','.join(map(str, selected_ids))
+        st.session_state['compare_ids'] = compare_ids
+        st.switch_page("pages/6_⚖️_compare_candidates.py", query_params={'ids': compare_ids})
+
+if 'bulk_result' in st.session_state:
+    st.success(st.session_state.pop('bulk_result'))
+
+if not filtered_df.empty:
+    # Color coding for different statuses and risks, computed per column
+    view_key = ('candidates', data_version, figures.normalize_filters(filter_key))
+    if snapshot is not None:
+        status_labels, risk_labels = snapshot.status_labels, snapshot.risk_labels
+    else:
+        status_labels = formatting.category_labels(filtered_df['status'], formatting.STATUS_BADGES)
+        risk_labels = formatting.category_labels(filtered_df['bias_risk'], formatting.RISK_BADGES)
+    memory_accounting.track('table status labels', status_labels, shared=snapshot is not None)
+    memory_accounting.track('table risk labels', risk_labels, shared=snapshot is not None)
+    # AI scores calibrated to what reviewers settle on, per department
+    override_log, overrides_version = get_override_store().snapshot()
+    calibration_model = calibration.get_calibration(override_log, overrides_version)
+    calibrated_scores = calibration_model.apply(filtered_df['score'], filtered_df['department'])
+    memory_accounting.track('table calibrated scores', calibrated_scores)
+    table_df = formatting.styled_view(redaction.redact_frame(filtered_df, view_key), {
+        'status': status_labels,
+        'bias_risk': risk_labels,
+        'calibrated_score': calibrated_scores
+    })
+    candidates_table(filtered_df, table_df, memory_accounting.over_budget())
 else:
     st.info("No candidates match the selected filters")
 
-# Export button
+with st.expander("Decision Audit Log"):
+    audit_log = store.audit_log()
+    if audit_log.empty:
+        st.write("No decisions recorded yet.")
+    else:
+        st.dataframe(audit_log.tail(100).iloc[::-1], use_container_width=True, hide_index=True)
+
+# Export button; the CSV is only generated when the download is requested
 if not filtered_df.empty:
-    export_df = filtered_df.copy()
-    export_df['application_date'] = export_df['application_date'].dt.strftime('%Y-%m-%d')
+    export_view = redaction.redact_frame(filtered_df, view_key)
     st.download_button(
         label="📥 Export Data",
-        data=export_df.to_csv(index=False).encode('utf-8'),
+        data=lambda: export_view.to_csv(index=False, date_format='%Y-%m-%d').encode('utf-8'),
         file_name=f"hr_data_{datetime.now().strftime('%Y%m%d')}.csv",
         mime='text/csv'
     )
+
+memory_accounting.render()
+charts.report_import_times()
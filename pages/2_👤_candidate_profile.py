@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+from hiring import charts, formatting, redaction
+from hiring.charts import px, go
+from hiring.data import get_candidate_data
+from hiring.database import get_database
+from hiring.store import get_candidate_store
 
 # Page configuration
 st.set_page_config(
@@ -10,6 +12,7 @@ st.set_page_config(
     page_icon="👤",
     layout="wide"
 )
+charts.begin_page("candidate_profile")
 
 # Custom CSS
 st.markdown("""
@@ -32,82 +35,13 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Mock candidate data
-@st.cache_data
-def get_candidate_data(candidate_id):
-    return {
-        'personal': {
-            'name': 'John Smith',
-            'email': 'john.smith@email.com',
-            'phone': '+1 (555) 123-4567',
-            'location': 'San Francisco, CA',
-            'position': 'Senior Data Scientist',
-            'department': 'Data Science',
-            'status': 'In Review',
-            'application_date': '2024-01-01'
-        },
-        'education': [
-            {
-                'degree': 'Ph.D. in Computer Science',
-                'institution': 'Stanford University',
-                'year': '2018-2022',
-                'gpa': '3.9'
-            },
-            {
-                'degree': 'M.S. in Data Science',
-                'institution': 'MIT',
-                'year': '2016-2018',
-                'gpa': '3.8'
-            }
-        ],
-        'experience': [
-            {
-                'title': 'Lead Data Scientist',
-                'company': 'Tech Corp',
-                'duration': '2022-Present',
-                'description': 'Led a team of 5 data scientists in developing ML models'
-            },
-            {
-                'title': 'Data Scientist',
-                'company': 'AI Startup',
-                'duration': '2018-2022',
-                'description': 'Developed and deployed ML models for client projects'
-            }
-        ],
-        'skills': {
-            'technical': {
-                'Python': 95,
-                'Machine Learning': 90,
-                'Deep Learning': 85,
-                'SQL': 88,
-                'Cloud Platforms': 82
-            },
-            'soft': {
-                'Leadership': 90,
-                'Communication': 88,
-                'Problem Solving': 92,
-                'Teamwork': 95,
-                'Project Management': 85
-            }
-        },
-        'ai_evaluation': {
-            'overall_score': 92,
-            'technical_score': 90,
-            'experience_score': 88,
-            'education_score': 95,
-            'cultural_fit': 92,
-            'bias_risk': 'Low',
-            'flags': [],
-            'recommendations': [
-                'Strong technical background',
-                'Excellent leadership experience',
-                'Cultural fit alignment'
-            ]
-        }
-    }
-
 # Load candidate data
-candidate = get_candidate_data(1)  # In real app, get ID from URL or selection
+candidate_id = 1  # In real app, get ID from URL or selection
+redaction.blind_mode_toggle()
+candidate = redaction.redact(get_candidate_data(candidate_id))
+store = get_candidate_store()
+# Current decision for this candidate, by primary key
+candidate_row = get_database().candidate(candidate_id)
 
 # Header section
 st.title("👤 Candidate Profile")
@@ -117,22 +51,24 @@ with st.container():
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        st.subheader(candidate['personal']['name'])
-        st.write(f"📧 {candidate['personal']['email']}")
-        st.write(f"📱 {candidate['personal']['phone']}")
-        st.write(f"📍 {candidate['personal']['location']}")
+        st.subheader(candidate.name)
+        st.write(f"📧 {candidate.email}")
+        st.write(f"📱 {candidate.phone}")
+        st.write(f"📍 {candidate.location}")
+        if candidate_row is not None:
+            st.write(f"📋 {formatting.STATUS_BADGES.get(candidate_row.status, candidate_row.status)}")
     
     with col2:
         st.metric(
             "AI Score",
-            f"{candidate['ai_evaluation']['overall_score']}/100",
+            f"{candidate.ai_evaluation.overall_score}/100",
             delta="Top 10%"
         )
     
     with col3:
         st.metric(
             "Bias Risk",
-            candidate['ai_evaluation']['bias_risk'],
+            candidate.ai_evaluation.bias_risk,
             delta="Low Risk"
         )
 
@@ -146,18 +82,18 @@ with tab1:
     with col1:
         # Education section
         st.subheader("🎓 Education")
-        for edu in candidate['education']:
-            with st.expander(f"{edu['degree']} - {edu['institution']}", expanded=True):
-                st.write(f"**Year:** {edu['year']}")
-                st.write(f"**GPA:** {edu['gpa']}")
+        for edu in candidate.education:
+            with st.expander(f"{edu.degree} - {edu.institution}", expanded=True):
+                st.write(f"**Year:** {edu.year}")
+                st.write(f"**GPA:** {edu.gpa}")
     
     with col2:
         # Experience section
         st.subheader("💼 Experience")
-        for exp in candidate['experience']:
-            with st.expander(f"{exp['title']} at {exp['company']}", expanded=True):
-                st.write(f"**Duration:** {exp['duration']}")
-                st.write(exp['description'])
+        for exp in candidate.experience:
+            with st.expander(f"{exp.title} at {exp.company}", expanded=True):
+                st.write(f"**Duration:** {exp.duration}")
+                st.write(exp.description)
 
 # Skills & Experience tab
 with tab2:
@@ -165,7 +101,7 @@ with tab2:
     st.subheader("Technical Skills")
     
     # Create radar chart for technical skills
-    technical_skills = candidate['skills']['technical']
+    technical_skills = candidate.skills.technical
     fig = go.Figure(data=go.Scatterpolar(
         r=list(technical_skills.values()),
         theta=list(technical_skills.keys()),
@@ -179,7 +115,7 @@ with tab2:
     
     # Soft skills
     st.subheader("Soft Skills")
-    soft_skills = candidate['skills']['soft']
+    soft_skills = candidate.skills.soft
     for skill, score in soft_skills.items():
         col1, col2 = st.columns([3, 1])
         with col1:
@@ -192,10 +128,10 @@ with tab3:
     # AI scores breakdown
     st.subheader("AI Evaluation Scores")
     scores = {
-        'Technical Assessment': candidate['ai_evaluation']['technical_score'],
-        'Experience Evaluation': candidate['ai_evaluation']['experience_score'],
-        'Education Assessment': candidate['ai_evaluation']['education_score'],
-        'Cultural Fit': candidate['ai_evaluation']['cultural_fit']
+        'Technical Assessment': candidate.ai_evaluation.technical_score,
+        'Experience Evaluation': candidate.ai_evaluation.experience_score,
+        'Education Assessment': candidate.ai_evaluation.education_score,
+        'Cultural Fit': candidate.ai_evaluation.cultural_fit
     }
     
     fig = px.bar(
@@ -207,30 +143,41 @@ with tab3:
     
     # AI recommendations
     st.subheader("AI Recommendations")
-    for rec in candidate['ai_evaluation']['recommendations']:
+    for rec in candidate.ai_evaluation.recommendations:
         st.info(rec)
     
     # Flags (if any)
-    if candidate['ai_evaluation']['flags']:
+    if candidate.ai_evaluation.flags:
         st.subheader("⚠️ Flags")
-        for flag in candidate['ai_evaluation']['flags']:
+        for flag in candidate.ai_evaluation.flags:
             st.warning(flag)
 
-# Action buttons
+# Action buttons. Decisions are applied in the buttons' callbacks, which run
+# before the page does, so the status shown above already includes them
+DECISION_MESSAGES = {
+    'Approved': (st.success, "Candidate approved!"),
+    'Rejected': (st.error, "Candidate rejected."),
+    'Info Requested': (st.info, "Information request sent.")
+}
+
+def apply_decision(candidate_id, status):
+    result = store.apply_decisions([candidate_id], status, reviewer='Hiring Manager')
+    st.session_state['decision_result'] = (status, result.changed)
+
 st.divider()
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    if st.button("👍 Approve", type="primary", use_container_width=True):
-        st.success("Candidate approved!")
+    st.button("👍 Approve", type="primary", use_container_width=True,
+              on_click=apply_decision, args=(candidate_id, 'Approved'))
 
 with col2:
-    if st.button("👎 Reject", type="secondary", use_container_width=True):
-        st.error("Candidate rejected.")
+    st.button("👎 Reject", type="secondary", use_container_width=True,
+              on_click=apply_decision, args=(candidate_id, 'Rejected'))
 
 with col3:
-    if st.button("📝 Request More Info", use_container_width=True):
-        st.info("Information request sent.")
+    st.button("📝 Request More Info", use_container_width=True,
+              on_click=apply_decision, args=(candidate_id, 'Info Requested'))
 
 with col4:
     if st.button("📊 Download Profile", use_container_width=True):
@@ -240,3 +187,10 @@ with col4:
             file_name=f"candidate_profile_{datetime.now().strftime('%Y%m%d')}.pdf",
             mime="application/pdf"
         )
+
+if 'decision_result' in st.session_state:
+    status, changed = st.session_state.pop('decision_result')
+    show, message = DECISION_MESSAGES[status]
+    show(message if changed else f"Candidate is already {status}.")
+
+charts.report_import_times()
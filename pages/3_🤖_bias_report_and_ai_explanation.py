@@ -1,14 +1,21 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import asyncio
+import os
+import time
 from datetime import datetime
+from hiring import batch, bias, charts, counterfactual, evaluation, figures
+from hiring.data import get_candidate_data
+from hiring.explanations import get_explanation_store
+from hiring.store import get_candidate_store
+from hiring.versions import fingerprint, get_data_versions
+from hiring.charts import pd, px
 # Page configuration
 st.set_page_config(
     page_title="Bias Report and AI Explanation Panel",
     page_icon="🤖",
     layout="wide"
 )
+charts.begin_page("bias_report")
 
 # Custom CSS
 st.markdown("""
@@ -42,117 +49,94 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Mock AI explanation data
-@st.cache_data
-def get_ai_explanation_data():
+# Steps of the evaluation pipeline and the model's global feature importance
+# are the same for every candidate
+EVALUATION_PROCESS = [
+    {
+        'step': 1,
+        'name': 'Resume Analysis',
+        'description': 'Parsed and analyzed resume content',
+        'duration': '2.3s',
+        'confidence': 0.95
+    },
+    {
+        'step': 2,
+        'name': 'Skills Validation',
+        'description': 'Verified technical skills and experience',
+        'duration': '3.1s',
+        'confidence': 0.92
+    },
+    {
+        'step': 3,
+        'name': 'Background Check',
+        'description': 'Validated education and work history',
+        'duration': '4.2s',
+        'confidence': 0.88
+    },
+    {
+        'step': 4,
+        'name': 'Bias Detection',
+        'description': 'Analyzed for potential biases',
+        'duration': '1.8s',
+        'confidence': 0.94
+    }
+]
+
+FEATURE_IMPORTANCE = {
+    'Technical Skills Score': 0.35,
+    'Years of Experience': 0.25,
+    'Education Level': 0.20,
+    'Leadership Experience': 0.15,
+    'Project Complexity': 0.05
+}
+
+BIAS_MITIGATIONS = {
+    'gender_bias': "Review job descriptions and interview panels for gendered language and composition.",
+    'age_bias': "Weigh the depth of relevant experience rather than years, and check the experience score against the role's actual needs.",
+    'education_bias': "Consider focusing on skills and experience rather than academic qualifications. Use blind recruitment techniques to anonymize educational backgrounds.",
+    'cultural_bias': "Score cultural fit against written team values with structured interview questions, not general impressions."
+}
+
+# Explanations are materialized when candidates are scored (hiring.explanations);
+# opening one is a keyed lookup, cached per candidate and content version
+@st.cache_data(max_entries=256)
+def get_ai_explanation_data(candidate_id, version):
     return {
-        'decision_factors': {
-            'Technical Skills': {
-                'weight': 0.35,
-                'score': 92,
-                'confidence_interval': (90, 94),
-                'explanation': 'Strong proficiency in required technical skills',
-                'confidence': 0.95,
-                'key_points': [
-                    'Advanced Python programming skills',
-                    'Extensive ML/AI experience',
-                    'Strong cloud platform knowledge'
-                ]
-            },
-            'Experience': {
-                'weight': 0.30,
-                'score': 88,
-                'confidence_interval': (85, 91),
-                'explanation': 'Relevant experience in similar roles',
-                'confidence': 0.90,
-                'key_points': [
-                    'Leadership experience',
-                    'Project management skills',
-                    'Industry expertise'
-                ]
-            },
-            'Education': {
-                'weight': 0.20,
-                'score': 95,
-                'confidence_interval': (93, 97),
-                'explanation': 'Advanced degree in relevant field',
-                'confidence': 0.98,
-                'key_points': [
-                    'PhD in Computer Science',
-                    'Research background',
-                    'Academic achievements'
-                ]
-            },
-            'Cultural Fit': {
-                'weight': 0.15,
-                'score': 90,
-                'confidence_interval': (87, 93),
-                'explanation': 'Strong alignment with company values',
-                'confidence': 0.85,
-                'key_points': [
-                    'Communication skills',
-                    'Team collaboration',
-                    'Leadership potential'
-                ]
-            }
-        },
-        'bias_analysis': {
-            'gender_bias': {'risk': 'Low', 'confidence': 0.95},
-            'age_bias': {'risk': 'Low', 'confidence': 0.92},
-            'education_bias': {'risk': 'Medium', 'confidence': 0.85},
-            'cultural_bias': {'risk': 'Low', 'confidence': 0.90}
-        },
-        'evaluation_process': [
-            {
-                'step': 1,
-                'name': 'Resume Analysis',
-                'description': 'Parsed and analyzed resume content',
-                'duration': '2.3s',
-                'confidence': 0.95
-            },
-            {
-                'step': 2,
-                'name': 'Skills Validation',
-                'description': 'Verified technical skills and experience',
-                'duration': '3.1s',
-                'confidence': 0.92
-            },
-            {
-                'step': 3,
-                'name': 'Background Check',
-                'description': 'Validated education and work history',
-                'duration': '4.2s',
-                'confidence': 0.88
-            },
-            {
-                'step': 4,
-                'name': 'Bias Detection',
-                'description': 'Analyzed for potential biases',
-                'duration': '1.8s',
-                'confidence': 0.94
-            }
-        ],
-        'model_interpretation': {
-            'feature_importance': {
-                'Technical Skills Score': 0.35,
-                'Years of Experience': 0.25,
-                'Education Level': 0.20,
-                'Leadership Experience': 0.15,
-                'Project Complexity': 0.05
-            }
-        }
+        **get_explanation_store().explain(candidate_id),
+        'evaluation_process': EVALUATION_PROCESS,
+        'model_interpretation': {'feature_importance': FEATURE_IMPORTANCE}
     }
 
-# Load explanation data
-explanation_data = get_ai_explanation_data()
+# Load explanation data for the candidate in the URL (?candidate=<id>)
+explanation_store = get_explanation_store()
+if 'explanation_candidate' not in st.session_state:
+    try:
+        st.session_state['explanation_candidate'] = max(int(st.query_params.get('candidate', 1)), 1)
+    except ValueError:
+        st.session_state['explanation_candidate'] = 1
+candidate_id = int(st.sidebar.number_input("Candidate ID", min_value=1, step=1, key='explanation_candidate'))
+st.query_params['candidate'] = candidate_id
+try:
+    explanation_data = get_ai_explanation_data(candidate_id, get_data_versions().get('explanations'))
+except KeyError:
+    st.error(f"No explanation for candidate {candidate_id}")
+    st.stop()
 
 # Header
 st.title("🤖 Bias Report and AI Decision Explanation Panel")
 st.markdown("Understanding how the AI evaluates candidates")
 
 # Summary of AI Decision
-st.subheader("Summary of AI Decision")
-st.write(f"The candidate was ranked highly due to their strong technical skills ({explanation_data['decision_factors']['Technical Skills']['score']}/100) and relevant experience ({explanation_data['decision_factors']['Experience']['score']}/100). Their advanced education ({explanation_data['decision_factors']['Education']['score']}/100) and cultural fit ({explanation_data['decision_factors']['Cultural Fit']['score']}/100) also contributed positively.")
+st.subheader(f"Summary of AI Decision: Candidate {explanation_data['candidate_id']}")
+ranked = sorted(explanation_data['decision_factors'].items(), key=lambda item: item[1]['contribution'], reverse=True)
+st.write(
+    f"The candidate scored {explanation_data['score']}/100. The largest contributions came from "
+    f"{ranked[0][0].lower()} ({ranked[0][1]['score']}/100, +{ranked[0][1]['contribution']} points) and "
+    f"{ranked[1][0].lower()} ({ranked[1][1]['score']}/100, +{ranked[1][1]['contribution']} points). "
+    + " ".join(f"{name}: {details['explanation'].lower()}." for name, details in ranked)
+)
+if explanation_data['education_prior']:
+    st.caption(f"Includes an institution prior of {explanation_data['education_prior']:+.1f} points on the education factor")
 
 # Decision Factors Analysis
 st.header("Decision Factors Analysis")
@@ -162,7 +146,7 @@ factors_df = pd.DataFrame({
     'Factor': list(explanation_data['decision_factors'].keys()),
     'Weight': [f['weight'] for f in explanation_data['decision_factors'].values()],
     'Score': [f['score'] for f in explanation_data['decision_factors'].values()],
-    'Weighted Score': [f['weight'] * f['score'] for f in explanation_data['decision_factors'].values()]
+    'Weighted Score': [f['contribution'] for f in explanation_data['decision_factors'].values()]
 })
 
 # Display factors breakdown
@@ -172,9 +156,9 @@ with col1:
     fig = px.bar(
         factors_df,
         x='Factor',
-        y=[ 'Score'],
+        y=['Score', 'Weighted Score'],
         barmode='group',
-        title='Decision Factors: Scores'
+        title='Decision Factors: Scores and Contributions'
     )
     st.plotly_chart(fig, use_container_width=True)
 
@@ -192,6 +176,7 @@ st.subheader("Detailed Factor Analysis")
 for factor, details in explanation_data['decision_factors'].items():
     with st.expander(f"{factor} (Score: {details['score']}, Confidence: {details['confidence']*100:.1f}%)", expanded=True):
         st.write(f"**Weight:** {details['weight']}")
+        st.write(f"**Contribution to AI Score:** {details['contribution']} points")
         st.write(f"**Explanation:** {details['explanation']}")
         st.write(f"**Confidence Interval:** {details['confidence_interval'][0]} - {details['confidence_interval'][1]}")
         st.write("**Key Points:**")
@@ -221,14 +206,144 @@ for bias_type, bias_details in explanation_data['bias_analysis'].items():
 
 # Mitigation recommendations
 st.subheader("Bias Mitigation Recommendations")
-if explanation_data['bias_analysis']['education_bias']['risk'] == 'Medium':
-    st.write("**Education Bias:** Consider focusing on skills and experience rather than academic qualifications. Use blind recruitment techniques to anonymize educational backgrounds.")
+flagged = [bias_type for bias_type, details in explanation_data['bias_analysis'].items() if details['risk'] != 'Low']
+for bias_type in flagged:
+    st.write(f"**{bias_type.replace('_', ' ').title()}:** {BIAS_MITIGATIONS[bias_type]}")
+if not flagged:
+    st.write("No bias risks flagged for this candidate.")
+
+# Audit written ahead of time by a batch run (hiring.batch), if configured.
+# Keyed on its files, so a new run is picked up.
+AUDIT_DIR = os.environ.get('HIRING_AUDIT_DATA')
+
+@st.cache_data(max_entries=2)
+def get_batch_audit(audit_dir, audit_version):
+    return batch.read_audit(audit_dir)
+
+# Intersectional analysis over the whole candidate pool. The frame is not
+# hashed by the cache (leading underscore); the store version keys it instead.
+# A few attribute/group-size combinations per data version; older versions
+# are evicted rather than kept until the server restarts
+@st.cache_data(max_entries=16)
+def get_intersectional_rates(_candidates, version, attributes, min_cell_size):
+    return bias.intersectional_rates(
+        _candidates,
+        attributes,
+        selected=(_candidates['status'] == 'Approved').to_numpy(),
+        min_cell_size=min_cell_size
+    )
+
+st.header("Intersectional Bias Analysis")
+candidates, candidates_version = get_candidate_store().snapshot()
+audit_version = fingerprint(AUDIT_DIR) if AUDIT_DIR else None
+audit = get_batch_audit(AUDIT_DIR, audit_version) if AUDIT_DIR else None
+
+if audit is not None:
+    # Served from the batch audit, for the intersections it covers
+    audited = audit['intersectional']
+    audit_attributes = {attribute for attributes in batch.AUDIT_INTERSECTIONS for attribute in attributes}
+    audited_intersections = list(dict.fromkeys(audited['intersection']))
+    intersection = st.selectbox(
+        "Protected attributes",
+        options=audited_intersections,
+        index=len(audited_intersections) - 1 if audited_intersections else None,
+        format_func=lambda name: name.replace('_', ' ')
+    )
+    intersect_attributes = intersection.split(' x ') if intersection else []
+    intersections = audited[audited['intersection'] == intersection]
+    intersections = intersections[
+        intersect_attributes + [column for column in audited.columns if column not in audit_attributes | {'intersection'}]
+    ].reset_index(drop=True)
+    min_cell_size = batch.AUDIT_MIN_CELL_SIZE
+else:
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        intersect_attributes = st.multiselect(
+            "Protected attributes",
+            options=['gender', 'age_band', 'location', 'department'],
+            default=['gender', 'age_band']
+        )
+    with col2:
+        min_cell_size = st.slider("Minimum group size", min_value=1, max_value=50, value=3)
+    if intersect_attributes:
+        intersections = get_intersectional_rates(candidates, candidates_version, tuple(intersect_attributes), min_cell_size)
+
+if intersect_attributes:
+    adverse = intersections[intersections['adverse_impact']]
+    if len(adverse):
+        st.warning(f"⚠️ {len(adverse)} of {len(intersections)} groups fall below the four-fifths rule")
+    else:
+        st.success(f"✅ No adverse impact across {len(intersections)} groups")
+    st.dataframe(
+        intersections,
+        column_config={
+            'selection_rate': st.column_config.ProgressColumn('Selection Rate', min_value=0, max_value=1, format='percent'),
+            'disparate_impact': st.column_config.NumberColumn('Disparate Impact', format='%.2f'),
+            'suppressed': st.column_config.CheckboxColumn('Suppressed'),
+            'adverse_impact': st.column_config.CheckboxColumn('Adverse Impact')
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption(f"{int(intersections['suppressed'].sum())} groups with fewer than {min_cell_size} applicants are suppressed")
+    if audit is not None:
+        st.caption("From the batch audit (HIRING_AUDIT_DATA), computed on the pool it re-scored")
+else:
+    st.info("Select at least one attribute")
+
+# Counterfactual fairness: swap each protected attribute and re-score. A batch
+# run writes this audit ahead of time; otherwise it is computed here
+# Shifts only depend on the rows and their factor scores, so decisions (which
+# bump the candidates version) don't invalidate them
+@st.cache_data(max_entries=2)
+def get_counterfactual_shifts(_candidates, rows_version):
+    return counterfactual.counterfactual_shifts(_candidates)
+
+st.header("Counterfactual Fairness Test")
+st.markdown("Each candidate is re-scored with one protected attribute swapped; a fair scorer leaves every score unchanged.")
+if audit is not None:
+    shift_summary, shift_histograms = audit['counterfactual_summary'], audit['counterfactual_histograms']
+    shift_version = audit_version
+else:
+    rows, rows_version = get_candidate_store().rows_snapshot()
+    shift_summary, shift_histograms = get_counterfactual_shifts(rows, rows_version)
+    shift_version = rows_version
+
+col1, col2 = st.columns([1, 1])
+with col1:
+    st.dataframe(
+        shift_summary,
+        column_config={
+            'share_changed': st.column_config.ProgressColumn('Scores Changed', min_value=0, max_value=1, format='percent'),
+            'mean_shift': st.column_config.NumberColumn('Mean Shift', format='%+.2f'),
+            'mean_abs_shift': st.column_config.NumberColumn('Mean |Shift|', format='%.2f'),
+            'max_abs_shift': st.column_config.NumberColumn('Max |Shift|', format='%.2f')
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    for row in shift_summary.itertuples():
+        if row.max_abs_shift > 0:
+            st.warning(f"⚠️ Swapping {row.attribute.replace('_', ' ')} changes {row.share_changed:.0%} of scores (up to {row.max_abs_shift:.1f} points)")
+
+with col2:
+    def build_shift_histogram():
+        histogram_long = shift_histograms.reset_index().melt(id_vars='shift', var_name='attribute', value_name='candidates')
+        return px.bar(
+            histogram_long[histogram_long['candidates'] > 0],
+            x='shift',
+            y='candidates',
+            color='attribute',
+            barmode='group',
+            title='Score Shift Distribution by Attribute'
+        )
+    fig = figures.cached_figure('counterfactual_shifts', None, shift_version, build_shift_histogram)
+    st.plotly_chart(fig, use_container_width=True)
 
 # Evaluation Process Visualization
 st.header("Evaluation Process")
 
-# Create timeline of evaluation steps
-for step in explanation_data['evaluation_process']:
+def render_step(step):
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col1:
@@ -242,6 +357,45 @@ for step in explanation_data['evaluation_process']:
         st.write(f"**Duration:** {step['duration']}")
         st.write(f"**Confidence:** {step['confidence']*100:.1f}%")
 
+# Steps run concurrently in a thread pool, CPU-bound ones in a process pool;
+# each row fills in as its step finishes
+async def stream_evaluation(candidate, placeholders):
+    results = []
+    async for result in evaluation.run_evaluation(
+        candidate, executor=evaluation.get_thread_pool(), process_pool=evaluation.get_process_pool()
+    ):
+        step = result._asdict()
+        step['duration'] = f"{result.duration * 1000:.2f}ms"
+        step['description'] = f"{result.description} ({result.detail})"
+        placeholders[result.name].empty()
+        with placeholders[result.name].container():
+            render_step(step)
+        results.append(step)
+    return results
+
+run_pipeline = st.button("▶️ Run Evaluation Pipeline")
+
+# Create timeline of evaluation steps; runs are kept per candidate
+evaluation_runs = st.session_state.setdefault('evaluation_runs', {})
+steps, latency = evaluation_runs.get(candidate_id, (explanation_data['evaluation_process'], None))
+placeholders = {}
+for step in sorted(steps, key=lambda s: s['step']):
+    placeholders[step['name']] = st.empty()
+    with placeholders[step['name']].container():
+        if run_pipeline:
+            st.info(f"⏳ Step {step['step']}: {step['name']} running...")
+        else:
+            render_step(step)
+
+if run_pipeline:
+    start = time.perf_counter()
+    steps = asyncio.run(stream_evaluation(get_candidate_data(candidate_id), placeholders))
+    latency = time.perf_counter() - start
+    evaluation_runs[candidate_id] = (steps, latency)
+
+if latency is not None:
+    st.caption(f"End-to-end latency of the last run: {latency * 1000:.0f}ms")
+
 # Model Interpretation
 st.header("Model Interpretation")
 
@@ -286,4 +440,6 @@ with col2:
 
 # Footer
 st.markdown("---")
-st.caption("Bias Report and AI Explanation System v2.0 - Powered by Advanced Machine Learning")
\ No newline at end of file
+st.caption("Bias Report and AI Explanation System v2.0 - Powered by Advanced Machine Learning")
+
+charts.report_import_times()
@@ -1,8 +1,14 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from hiring import calibration, charts, figures, formatting, redaction, reviewers
+from hiring.charts import np, pd, px
+from hiring.data import mock_reviewer_decisions
+from hiring.database import get_database
+from hiring.overrides import get_override_store
+from hiring.records import ReviewItem
+from hiring.shared_cache import shared_cache
+from hiring.timeseries import TimeSeriesStore
+from hiring.versions import get_data_versions
 
 # Page configuration
 st.set_page_config(
@@ -10,6 +16,7 @@ st.set_page_config(
     page_icon="👥",
     layout="wide"
 )
+charts.begin_page("human_oversight")
 
 # Custom CSS
 st.markdown("""
@@ -30,29 +37,32 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Mock oversight data
+# Mock oversight data. Nothing writes to it, so it is cached without a version.
 @st.cache_data
+@shared_cache('oversight')
 def get_oversight_data():
     return {
         'pending_reviews': [
-            {
-                'id': 1,
-                'name': 'John Smith',
-                'position': 'Senior Data Scientist',
-                'ai_score': 92,
-                'bias_risk': 'Low',
-                'flags': [],
-                'last_modified': '2024-01-10'
-            },
-            {
-                'id': 2,
-                'name': 'Sarah Johnson',
-                'position': 'ML Engineer',
-                'ai_score': 88,
-                'bias_risk': 'Medium',
-                'flags': ['Education bias detected'],
-                'last_modified': '2024-01-09'
-            }
+            ReviewItem(
+                id=1,
+                name='John Smith',
+                position='Senior Data Scientist',
+                department='Data',
+                ai_score=92,
+                bias_risk='Low',
+                flags=(),
+                last_modified='2024-01-10'
+            ),
+            ReviewItem(
+                id=2,
+                name='Sarah Johnson',
+                position='ML Engineer',
+                department='Data',
+                ai_score=88,
+                bias_risk='Medium',
+                flags=('Education bias detected',),
+                last_modified='2024-01-09'
+            )
         ],
         'recent_decisions': pd.DataFrame({
             'id': [3, 4, 5, 6],
@@ -65,9 +75,6 @@ def get_oversight_data():
             'date': ['2024-01-08', '2024-01-07', '2024-01-06', '2024-01-05']
         }),
         'override_statistics': {
-            'total_reviews': 100,
-            'override_rate': 0.15,
-            'average_score_adjustment': -2.5,
             'common_reasons': {
                 'Technical Skills Overestimated': 35,
                 'Experience Undervalued': 25,
@@ -78,8 +85,259 @@ def get_oversight_data():
         }
     }
 
-# Load oversight data
+# Mock override history: hourly review and override counts over three years.
+# Cached as a resource so every session shares one store instead of a copy.
+@st.cache_resource
+def get_override_history():
+    rng = np.random.default_rng(42)
+    hours = pd.date_range(start='2021-01-01', end='2024-01-10 23:00', freq='h')
+    days = np.arange(len(hours)) / 24
+    override_rate = 0.17 - 0.02 * days / days[-1] + 0.02 * np.sin(2 * np.pi * days / 365)
+    reviews = rng.poisson(2.5, len(hours))
+    overrides = rng.binomial(reviews, override_rate)
+    counts = pd.DataFrame({'reviews': reviews, 'overrides': overrides}, index=hours)
+    return TimeSeriesStore(counts, base='hour')
+
+# Reviewer statistics, fed from the decision log in chunks as it grows.
+@st.cache_resource
+def get_reviewer_stats():
+    stats = reviewers.ReviewerStats()
+    stats.update(get_oversight_data()['recent_decisions'])
+    # Overrides confirmed from now on are folded in as they are appended; the
+    # log up to that point comes back with the subscription
+    override_log, _ = get_override_store().subscribe(stats.update)
+    if {'reviewer', 'final_decision'} <= set(override_log.columns):
+        stats.update(override_log)
+    else:
+        # The mock override log doesn't record who reviewed
+        for decisions in mock_reviewer_decisions():
+            stats.update(decisions)
+    return stats
+
+# Confirmed adjustments are appended to the override log. That bumps only the
+# overrides version, so only calibration and other override-based caches refresh.
+def confirm_adjustment(review):
+    get_override_store().append(pd.DataFrame({
+        'position': [review.position],
+        'department': [review.department],
+        'ai_score': [float(review.ai_score)],
+        'human_score': [float(st.session_state[f"slider_{review.id}"])],
+        'reviewer': ['Hiring Manager'],
+        'final_decision': ['Review'],
+        'date': [pd.Timestamp.now().normalize()]
+    }))
+    st.session_state['override_result'] = f"Adjustment for candidate #{review.id} recorded"
+
+def reset_adjustment(review):
+    st.session_state[f"slider_{review.id}"] = review.ai_score
+
+# Each review card is a fragment: its slider, text area and buttons rerun
+# only the card, not the tabs' charts and tables
+@st.fragment
+def review_card(candidate):
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        st.markdown(f"### {candidate.name}")
+        st.write(f"**Position:** {candidate.position}")
+        if candidate.flags:
+            for flag in candidate.flags:
+                st.warning(flag)
+    
+    with col2:
+        st.metric("AI Score", candidate.ai_score)
+        st.write(f"**Bias Risk:** {candidate.bias_risk}")
+    
+    with col3:
+        st.write(f"**Last Modified:** {candidate.last_modified}")
+        if st.button("Review Now", key=f"review_{candidate.id}", type="primary"):
+            st.write("Opening review panel...")
+    
+    # Score adjustment slider. Its value lives in session_state, seeded once
+    # with the AI score, since the reset button writes it there too
+    st.session_state.setdefault(f"slider_{candidate.id}", candidate.ai_score)
+    st.slider(
+        "Adjust Score",
+        min_value=0,
+        max_value=100,
+        key=f"slider_{candidate.id}"
+    )
+    
+    # Justification input
+    st.text_area(
+        "Justification for Adjustment",
+        key=f"justification_{candidate.id}"
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        confirmed = st.button(
+            "Confirm Adjustment",
+            key=f"confirm_{candidate.id}",
+            use_container_width=True
+        )
+    with col2:
+        st.button(
+            "Reset to AI Score",
+            key=f"reset_{candidate.id}",
+            use_container_width=True,
+            on_click=reset_adjustment,
+            args=(candidate,)
+        )
+    
+    st.divider()
+    
+    # A confirmed adjustment changes the override log behind the metrics and
+    # analytics, so that one reruns the whole page
+    if confirmed:
+        confirm_adjustment(candidate)
+        st.rerun()
+
+# Override log aggregates, computed in the database and cached per log version
+@st.cache_data(max_entries=4)
+def get_override_aggregates(version):
+    database = get_database()
+    return {
+        'summary': database.override_summary(),
+        'adjustments': database.adjustment_histogram(),
+        'by_department': database.adjustments_by('department')
+    }
+
+# The analytics sections below each have their own controls. As fragments,
+# changing one reruns only that section.
+
+# Override trend, served from precomputed rollups and downsampled
+@st.fragment
+def override_trend():
+    history = get_override_history()
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        trend_resolution = st.selectbox(
+            "Resolution",
+            ['auto', 'hour', 'day', 'week', 'month'],
+            format_func=str.capitalize,
+            key="trend_resolution"
+        )
+    with col2:
+        trend_range = st.date_input(
+            "Trend Period",
+            value=(history.start.date(), history.end.date()),
+            min_value=history.start.date(),
+            max_value=history.end.date(),
+            key="trend_range"
+        )
+    if len(trend_range) == 2:
+        trend_start, trend_end = str(trend_range[0]), str(trend_range[1])
+    else:
+        trend_start, trend_end = None, None
+
+    trend_data, resolution = history.query(
+        ('overrides', 'reviews'),
+        trend_start,
+        trend_end,
+        resolution=trend_resolution,
+        name='override_rate'
+    )
+    fig = figures.cached_figure('override_trend', None, figures.data_version(trend_data), lambda: px.line(
+        trend_data,
+        x='date',
+        y='override_rate',
+        title="Override Rate Trend"
+    ))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{len(trend_data)} points at {resolution} resolution from {len(history):,} hourly records")
+
+# Score calibration fitted on the override log
+@st.fragment
+def score_calibration():
+    st.subheader("Score Calibration")
+    override_log, log_version = get_override_store().snapshot()
+    calibration_by = st.radio("Calibrate per", ['department', 'position'], format_func=str.capitalize, horizontal=True, key="calibration_by")
+    calibration_model = calibration.get_calibration(override_log, log_version, calibration_by)
+    calibrated = calibration_model.apply(override_log['ai_score'], override_log[calibration_by])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        raw_error = (override_log['human_score'] - override_log['ai_score']).abs()
+        calibrated_error = (override_log['human_score'] - calibrated).abs()
+        st.metric(
+            "Mean Reviewer Adjustment",
+            f"{calibrated_error.mean():.2f}",
+            delta=f"{calibrated_error.mean() - raw_error.mean():+.2f} vs. raw AI score",
+            delta_color="inverse"
+        )
+    with col2:
+        # Adjustments of more than 5 points are what reviewers override
+        st.metric(
+            "Scores Needing Override",
+            f"{(calibrated_error > 5).mean() * 100:.1f}%",
+            delta=f"{((calibrated_error > 5).mean() - (raw_error > 5).mean()) * 100:+.1f}% vs. raw AI score",
+            delta_color="inverse"
+        )
+
+    fig = figures.cached_figure('calibration_curves', {'by': calibration_by}, log_version, lambda: px.line(
+        calibration_model.curve_frame(),
+        x='ai_score',
+        y='calibrated',
+        color=calibration_by,
+        title="Calibrated Score by AI Score"
+    ))
+    st.plotly_chart(fig, use_container_width=True)
+
+# Per-reviewer statistics, filtered by decision count
+@st.fragment
+def reviewer_analytics():
+    reviewer_stats = get_reviewer_stats()
+    reviewer_summary = reviewer_stats.summary()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Reviewers", len(reviewer_summary))
+    with col2:
+        st.metric("Decisions", f"{reviewer_summary['decisions'].sum():,}")
+    with col3:
+        st.metric("Median Cohen's Kappa", f"{reviewer_summary['cohens_kappa'].median():.2f}")
+
+    min_decisions = st.slider("Minimum decisions per reviewer", 0, 5000, 100, step=50, key="min_decisions")
+    shown = reviewer_summary[reviewer_summary['decisions'] >= min_decisions]
+
+    st.dataframe(
+        shown,
+        column_config={
+            'reviewer': st.column_config.TextColumn('Reviewer'),
+            'decisions': st.column_config.NumberColumn('Decisions', format='%d'),
+            'decisions_per_day': st.column_config.NumberColumn('Decisions / Day', format='%.1f'),
+            'mean_adjustment': st.column_config.NumberColumn('Mean Adjustment', format='%+.2f'),
+            'ai_human_correlation': st.column_config.NumberColumn('AI-Human Correlation', format='%.2f'),
+            'agreement': st.column_config.ProgressColumn('Agreement', min_value=0, max_value=1, format='percent'),
+            'cohens_kappa': st.column_config.NumberColumn("Cohen's Kappa", format='%.2f')
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption(
+        f"Agreement compares an AI score of {reviewers.AI_APPROVAL_THRESHOLD}+ with the reviewer's "
+        "approval; kappa corrects it for agreement expected by chance."
+    )
+
+    fig = figures.cached_figure('reviewer_agreement', {'min_decisions': min_decisions}, reviewer_stats.version, lambda: px.scatter(
+        shown,
+        x='mean_adjustment',
+        y='cohens_kappa',
+        size='decisions',
+        hover_name='reviewer',
+        title="Score Adjustment vs. Agreement with AI"
+    ))
+    st.plotly_chart(fig, use_container_width=True)
+
+# Load oversight data; loading the database loads the stores, which sets
+# the content versions read below
+get_database()
+versions = get_data_versions()
+overrides_version = versions.get('overrides')
 data = get_oversight_data()
+override_aggregates = get_override_aggregates(overrides_version)
+redaction.blind_mode_toggle()
 
 # Header
 st.title("👥 Human Oversight Interface")
@@ -98,113 +356,51 @@ with col1:
 with col2:
     st.metric(
         "Override Rate",
-        f"{data['override_statistics']['override_rate']*100:.1f}%",
+        f"{override_aggregates['summary'].override_rate*100:.1f}%",
         delta="-2.5%"
     )
 
 with col3:
     st.metric(
         "Avg Score Adjustment",
-        f"{data['override_statistics']['average_score_adjustment']:+.1f}",
+        f"{override_aggregates['summary'].mean_adjustment:+.1f}",
         delta="Minimal bias"
     )
 
 with col4:
     st.metric(
         "Total Reviews",
-        data['override_statistics']['total_reviews'],
+        f"{override_aggregates['summary'].reviews:,}",
         delta="+10 this week"
     )
 
 # Main content tabs
-tab1, tab2, tab3 = st.tabs(["Pending Reviews", "Recent Decisions", "Override Analytics"])
+tab1, tab2, tab3, tab4 = st.tabs(["Pending Reviews", "Recent Decisions", "Override Analytics", "Reviewer Analytics"])
 
 # Pending Reviews tab
 with tab1:
     st.subheader("Pending Reviews")
+    if 'override_result' in st.session_state:
+        st.success(st.session_state.pop('override_result'))
     
-    for candidate in data['pending_reviews']:
-        with st.container():
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                st.markdown(f"### {candidate['name']}")
-                st.write(f"**Position:** {candidate['position']}")
-                if candidate['flags']:
-                    for flag in candidate['flags']:
-                        st.warning(flag)
-            
-            with col2:
-                st.metric("AI Score", candidate['ai_score'])
-                st.write(f"**Bias Risk:** {candidate['bias_risk']}")
-            
-            with col3:
-                st.write(f"**Last Modified:** {candidate['last_modified']}")
-                if st.button("Review Now", key=f"review_{candidate['id']}", type="primary"):
-                    st.write("Opening review panel...")
-            
-            # Score adjustment slider
-            adjusted_score = st.slider(
-                "Adjust Score",
-                min_value=0,
-                max_value=100,
-                value=candidate['ai_score'],
-                key=f"slider_{candidate['id']}"
-            )
-            
-            # Justification input
-            st.text_area(
-                "Justification for Adjustment",
-                key=f"justification_{candidate['id']}"
-            )
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.button(
-                    "Confirm Adjustment",
-                    key=f"confirm_{candidate['id']}",
-                    use_container_width=True
-                )
-            with col2:
-                st.button(
-                    "Reset to AI Score",
-                    key=f"reset_{candidate['id']}",
-                    use_container_width=True
-                )
-            
-            st.divider()
+    for candidate in redaction.redact(data['pending_reviews']):
+        review_card(candidate)
 
 # Recent Decisions tab
 with tab2:
     st.subheader("Recent Decisions")
     
-    # Style the dataframe
-    def style_decision(df):
-        df_styled = pd.DataFrame('', index=df.index, columns=df.columns)
-        
-        # Style for final_decision column
-        decision_styles = {
-            'Approved': 'background-color: #d4edda',
-            'Rejected': 'background-color: #f8d7da',
-            'Review': 'background-color: #fff3cd'
-        }
-        for decision, style in decision_styles.items():
-            mask = (df['final_decision'] == decision)
-            df_styled.loc[mask, 'final_decision'] = style
-            
-        # Style for score difference
-        df['score_diff'] = df['human_score'] - df['ai_score']
-        mask_positive = df['score_diff'] > 0
-        mask_negative = df['score_diff'] < 0
-        df_styled.loc[mask_positive, 'human_score'] = 'color: green'
-        df_styled.loc[mask_negative, 'human_score'] = 'color: red'
-        
-        return df_styled
-
-    # Display styled dataframe
+    # Decision colors and score adjustments, computed per column
     recent_decisions_df = data['recent_decisions']
+    view_key = ('recent_decisions',)
     st.dataframe(
-        recent_decisions_df.style.apply(style_decision, axis=None),
+        formatting.styled_view(redaction.redact_frame(recent_decisions_df, view_key), {
+            'final_decision': formatting.category_labels(recent_decisions_df['final_decision'], formatting.STATUS_BADGES),
+            'score_diff': formatting.delta_labels(recent_decisions_df['human_score'], recent_decisions_df['ai_score'])
+        }),
+        column_config={
+            'score_diff': st.column_config.TextColumn('Adjustment')
+        },
         use_container_width=True
     )
 
@@ -214,40 +410,44 @@ with tab3:
     
     # Override reasons chart
     reasons = data['override_statistics']['common_reasons']
-    fig = px.pie(
+    fig = figures.cached_figure('override_reasons', None, None, lambda: px.pie(
         values=list(reasons.values()),
         names=list(reasons.keys()),
         title="Common Override Reasons"
-    )
+    ))
     st.plotly_chart(fig, use_container_width=True)
     
-    # Override trend
-    trend_data = pd.DataFrame({
-        'date': pd.date_range(start='2024-01-01', periods=10),
-        'override_rate': [0.18, 0.16, 0.15, 0.14, 0.15, 0.13, 0.12, 0.15, 0.14, 0.15]
-    })
-    
-    fig = px.line(
-        trend_data,
-        x='date',
-        y='override_rate',
-        title="Override Rate Trend"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    override_trend()
     
-    # Score adjustment distribution
-    adjustments = pd.DataFrame({
-        'adjustment': [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5],
-        'frequency': [5, 8, 12, 15, 20, 25, 18, 10, 7, 5, 3]
-    })
-    
-    fig = px.bar(
-        adjustments,
-        x='adjustment',
-        y='frequency',
-        title="Score Adjustment Distribution"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    # Score adjustment distribution over the override log
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        fig = figures.cached_figure('score_adjustments', None, overrides_version, lambda: px.bar(
+            override_aggregates['adjustments'],
+            x='adjustment',
+            y='frequency',
+            title="Score Adjustment Distribution"
+        ))
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        st.dataframe(
+            override_aggregates['by_department'],
+            column_config={
+                'department': st.column_config.TextColumn('Department'),
+                'reviews': st.column_config.NumberColumn('Reviews', format='%d'),
+                'mean_adjustment': st.column_config.NumberColumn('Mean Adjustment', format='%+.2f'),
+                'mean_abs_adjustment': st.column_config.NumberColumn('Mean |Adjustment|', format='%.2f')
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+
+    score_calibration()
+
+# Reviewer Analytics tab
+with tab4:
+    st.subheader("Reviewer Analytics")
+    reviewer_analytics()
 
 # Export options
 st.divider()
@@ -274,3 +474,5 @@ with col2:
 # Footer
 st.markdown("---")
 st.caption("Human Oversight Interface v2.0 - Ensuring Fair and Accurate Evaluations")
+
+charts.report_import_times()
@@ -0,0 +1,112 @@
+import streamlit as st
+import os
+from hiring import charts, figures, profiling
+from hiring.charts import pd, px
+
+# Page configuration
+st.set_page_config(
+    page_title="Profiles",
+    page_icon="🛠️",
+    layout="wide"
+)
+charts.begin_page("profiles")
+
+# Header
+st.title("🛠️ Page Profiles")
+st.markdown(
+    "Profiles of individual page reruns. Add `?profile=1` to any page URL to profile that "
+    "rerun, or start the server with `HIRING_PROFILE=1` to profile every rerun. "
+    f"Profiles are saved to `{profiling.profile_dir()}`."
+)
+
+# Cached per file: a saved profile never changes
+@st.cache_data(max_entries=20)
+def load_profile(path, modified):
+    return profiling.load_profile(path)
+
+paths = profiling.list_profiles()
+if not paths:
+    st.info("No profiles recorded yet.")
+else:
+    profiles = {path: load_profile(path, os.path.getmtime(path)) for path in paths}
+
+    # Recent profiles
+    st.subheader("Recent Profiles")
+    st.dataframe(
+        pd.DataFrame({
+            'started': [profile['started'] for profile in profiles.values()],
+            'page': [profile['page'] for profile in profiles.values()],
+            'duration_ms': [profile['duration'] * 1000 for profile in profiles.values()],
+            'samples': [profile['samples'] for profile in profiles.values()]
+        }),
+        column_config={
+            'duration_ms': st.column_config.NumberColumn('Duration (ms)', format='%.0f')
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+
+    # Hot functions of one profile
+    st.subheader("Hot Functions")
+    selected = st.selectbox(
+        "Profile",
+        paths,
+        format_func=lambda path: f"{profiles[path]['started']} · {profiles[path]['page']} · {profiles[path]['duration'] * 1000:.0f} ms"
+    )
+    profile = profiles[selected]
+    hide_internals = st.checkbox("Hide Streamlit and standard-library frames", value=True)
+
+    functions = pd.DataFrame(profile['functions'])
+    if hide_internals and not functions.empty:
+        internal = functions['file'].str.contains(f"{os.sep}streamlit{os.sep}|{os.sep}threading.py|<frozen", regex=True)
+        functions = functions[~internal]
+    samples = max(profile['samples'], 1)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Duration", f"{profile['duration'] * 1000:.0f} ms")
+    with col2:
+        st.metric("Samples", profile['samples'])
+    with col3:
+        st.metric("Interval", f"{profile['interval'] * 1000:.0f} ms")
+
+    if functions.empty:
+        st.info("No samples in this profile.")
+    else:
+        functions = functions.assign(
+            location=functions['file'].map(os.path.basename) + ':' + functions['line'].astype(str),
+            self_pct=functions['self'] / samples * 100,
+            total_pct=functions['total'] / samples * 100
+        )
+        st.dataframe(
+            functions[['function', 'location', 'self_pct', 'total_pct', 'self', 'total']],
+            column_config={
+                'self_pct': st.column_config.ProgressColumn('Self %', min_value=0, max_value=100, format='%.1f%%'),
+                'total_pct': st.column_config.NumberColumn('Total %', format='%.1f%%'),
+                'self': st.column_config.NumberColumn('Self Samples'),
+                'total': st.column_config.NumberColumn('Total Samples')
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+
+        top = functions.head(15)
+        fig = figures.cached_figure('profile_hot_functions', {'internals': hide_internals}, selected, lambda: px.bar(
+            top.iloc[::-1],
+            x='self_pct',
+            y=top['function'].iloc[::-1] + ' (' + top['location'].iloc[::-1] + ')',
+            orientation='h',
+            labels={'self_pct': 'Self time (%)', 'y': ''},
+            title="Top Functions by Self Time"
+        ))
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Collapsed stacks for flamegraph.pl, speedscope and similar tools
+    st.download_button(
+        label="📥 Download Collapsed Stacks",
+        data=lambda: "\n".join(f"{stack} {count}" for stack, count in profile['stacks'].items()),
+        file_name=os.path.basename(selected).replace('.json', '.collapsed.txt'),
+        mime='text/plain'
+    )
+
+charts.report_import_times()
@@ -0,0 +1,110 @@
+import streamlit as st
+from hiring import charts, comparison, figures, formatting, redaction
+from hiring.database import get_database
+from hiring.explanations import BIAS_TYPES, get_explanation_store
+from hiring.versions import get_data_versions
+
+# Page configuration
+st.set_page_config(
+    page_title="Compare Candidates",
+    page_icon="⚖️",
+    layout="wide"
+)
+charts.begin_page("compare_candidates")
+
+# Header
+st.title("⚖️ Compare Candidates")
+st.markdown(
+    f"Compare {comparison.MIN_CANDIDATES} to {comparison.MAX_CANDIDATES} finalists side by side. "
+    "Select rows on the dashboard and use **Compare Selected**, or enter candidate IDs below."
+)
+
+# Candidates and explanations are each read once for the whole selection,
+# cached per selection and data versions
+@st.cache_data(max_entries=32)
+def get_comparison(ids, candidates_version, explanations_version):
+    return comparison.comparison_frame(database, explanation_store, list(ids))
+
+# Loading the stores sets the content versions read below
+database = get_database()
+explanation_store = get_explanation_store()
+versions = get_data_versions()
+candidates_version = versions.get('candidates')
+explanations_version = versions.get('explanations')
+
+redaction.blind_mode_toggle()
+
+# Selection, shareable as ?ids=1,2,3
+if 'compare_ids' not in st.session_state:
+    st.session_state['compare_ids'] = st.query_params.get('ids', '')
+ids_text = st.text_input("Candidate IDs", key='compare_ids', placeholder="e.g. 3, 17, 42")
+try:
+    ids = comparison.parse_ids(ids_text)
+except ValueError:
+    st.error("Candidate IDs must be whole numbers separated by commas")
+    st.stop()
+st.query_params['ids'] = ','.join(map(str, ids))
+
+if len(ids) < comparison.MIN_CANDIDATES:
+    st.info(f"Enter at least {comparison.MIN_CANDIDATES} candidate IDs to compare")
+    st.stop()
+if len(ids) > comparison.MAX_CANDIDATES:
+    st.warning(f"Comparing the first {comparison.MAX_CANDIDATES} of {len(ids)} candidates")
+    ids = ids[:comparison.MAX_CANDIDATES]
+
+try:
+    compared = get_comparison(tuple(ids), candidates_version, explanations_version)
+except KeyError as error:
+    st.error(str(error).strip("'\""))
+    st.stop()
+
+view = redaction.redact_frame(compared, ('compare', candidates_version, tuple(ids)))
+labels = view['name'].astype(str) + ' (#' + view['id'].astype(str) + ')'
+factors = comparison.factor_frame(compared, labels)
+
+# Overview
+st.subheader("Overview")
+st.dataframe(
+    formatting.styled_view(view, {
+        'bias_risk': formatting.category_labels(view['bias_risk'], formatting.RISK_BADGES),
+        'status': formatting.category_labels(view['status'], formatting.STATUS_BADGES)
+    })[comparison.CANDIDATE_COLUMNS],
+    column_config={
+        'score': st.column_config.ProgressColumn('AI Score', min_value=0, max_value=100, format='%.1f')
+    },
+    use_container_width=True,
+    hide_index=True
+)
+
+# Figures share one cache key per selection, so every session comparing the same finalists reuses them
+figure_filters = {'ids': ','.join(map(str, ids)), 'blind': redaction.blind_mode_enabled()}
+
+col1, col2 = st.columns(2)
+with col1:
+    fig = figures.cached_figure('compare_radar', figure_filters, explanations_version, lambda: comparison.radar_figure(factors))
+    st.plotly_chart(fig, use_container_width=True)
+with col2:
+    fig = figures.cached_figure('compare_factors', figure_filters, explanations_version, lambda: comparison.factor_bar_figure(factors))
+    st.plotly_chart(fig, use_container_width=True)
+
+fig = figures.cached_figure('compare_contributions', figure_filters, explanations_version, lambda: comparison.contribution_figure(factors))
+st.plotly_chart(fig, use_container_width=True)
+
+# Bias flags
+st.subheader("Bias Flags")
+flags = comparison.bias_flags(compared, labels)
+st.dataframe(
+    formatting.styled_view(flags, {
+        bias_type: formatting.category_labels(flags[bias_type], formatting.RISK_BADGES) for bias_type in BIAS_TYPES
+    }),
+    column_config={
+        **{bias_type: st.column_config.TextColumn(bias_type.replace('_', ' ').title()) for bias_type in BIAS_TYPES},
+        'flagged': st.column_config.NumberColumn('Flagged Types')
+    },
+    use_container_width=True,
+    hide_index=True
+)
+if flags['flagged'].any():
+    st.caption("Open a candidate on the Bias Report page (?candidate=<id>) for the explanation and mitigations behind each flag")
+
+charts.report_import_times()